@@ -0,0 +1,74 @@
+"""
+Cold start of the headless CLI (fresh interpreter per run).
+
+    python -m benchmarks.bench_cli_startup --runs 10 --budget-ms 250
+
+Exits non-zero if the median run exceeds the budget or Qt got imported.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# runs the CLI, then reports whether anything pulled in Qt / the UI package
+_PROBE = (
+    "import sys; from builder.cli import main; code = main(sys.argv[1:]); "
+    "bad = [m for m in sys.modules if m.startswith(('PySide6', 'builder.ui'))]; "
+    "print('QT_IMPORTED', bad, file=sys.stderr) if bad else None; "
+    "raise SystemExit(code or (3 if bad else 0))"
+)
+
+
+def run_once(argv: list[str]) -> float:
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", _PROBE, *argv], cwd=REPO_ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"CLI run failed ({proc.returncode}): {proc.stderr.strip()}")
+    return elapsed
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--budget-ms", type=float, default=250.0)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenarios = {
+            "--help": ["--version"],
+            "dry-run": ["build", "--root", tmp, "--project", "Bench", "--template", "vfx_default",
+                        "--shots", "SQ010: SH0010-SH1000x10", "--dry-run"],
+            "build": ["build", "--root", tmp, "--project", "Bench", "--template", "vfx_default",
+                      "--shots", "SQ010: SH0010-SH1000x10", "--overwrite"],
+            "validate": ["validate-templates", "--workers", "1"],
+        }
+        baseline = statistics.median(run_once_python() for _ in range(args.runs))
+        print(f"{'scenario':>10} {'median ms':>10} {'max ms':>8}   (bare interpreter: {baseline * 1000:.0f} ms)")
+        over = False
+        for name, argv in scenarios.items():
+            times = [run_once(argv) for _ in range(args.runs)]
+            median = statistics.median(times)
+            over |= name != "build" and median * 1000 > args.budget_ms
+            print(f"{name:>10} {median * 1000:>10.0f} {max(times) * 1000:>8.0f}")
+
+    if over:
+        print(f"over budget ({args.budget_ms:.0f} ms)")
+    return 1 if over else 0
+
+
+def run_once_python() -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""
+Time to first window of the GUI (fresh interpreter per run, offscreen Qt).
+
+    python -m benchmarks.bench_gui_startup --runs 5 --budget-ms 1500
+
+Reports the median of each startup phase (see builder/util/startup.py) and
+fails if the median time to first window exceeds the budget, or if a module
+that should load lazily (Flow, manifest, job config) was imported before the
+window was shown. Needs PySide6.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+LAZY_MODULES = (
+    "builder.integrations",
+    "builder.core.manifest",
+    "builder.core.job_config",
+    "builder.core.flow_snapshot",
+    "builder.util.import_shots",
+)
+
+# modules present when first_shown fires are recorded before templates load
+_PROBE = (
+    "import sys, json; from builder.app import run_app; from builder.ui.main_window import MainWindow; "
+    "seen = []; orig = MainWindow._on_first_shown; "
+    f"MainWindow._on_first_shown = lambda self: (seen.extend(m for m in sys.modules if m.startswith({LAZY_MODULES!r})), orig(self)); "
+    "code = run_app(quit_when_shown=True); print(json.dumps(sorted(seen))); raise SystemExit(code)"
+)
+
+
+def run_once(report: Path) -> tuple[dict, list[str]]:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", SFB_STARTUP_REPORT=str(report))
+    proc = subprocess.run([sys.executable, "-c", _PROBE], cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"GUI run failed ({proc.returncode}): {proc.stderr.strip()}")
+    eager = json.loads(proc.stdout.strip().splitlines()[-1])
+    return json.loads(report.read_text(encoding="utf-8")), eager
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget-ms", type=float, default=1500.0)
+    args = ap.parse_args()
+
+    phases: dict[str, list[float]] = {}
+    totals: list[float] = []
+    eager: set[str] = set()
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.runs):
+            report, loaded = run_once(Path(tmp) / f"startup_{i}.json")
+            totals.append(report["total_ms"])
+            for p in report["phases"]:
+                phases.setdefault(p["phase"], []).append(p["ms"])
+            eager.update(loaded)
+
+    print(f"{'phase':>14} {'median ms':>10}")
+    for name, values in phases.items():
+        print(f"{name:>14} {statistics.median(values):>10.0f}")
+    median = statistics.median(totals)
+    print(f"{'total':>14} {median:>10.0f}   (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if eager:
+        print(f"imported before the first window: {', '.join(sorted(eager))}")
+        failed = True
+    if median > args.budget_ms:
+        print("over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
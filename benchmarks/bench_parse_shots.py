@@ -0,0 +1,71 @@
+"""
+Shot list parsing/import on very large inputs (one shot per line, CSV and EDL).
+
+    python -m benchmarks.bench_parse_shots --shots 50000 200000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from builder.util.import_shots import import_shots_file
+from builder.util.parse_input import parse_sequences_and_shots
+
+
+def make_shot_lines(shots: int, per_seq: int = 500) -> list[tuple[str, str]]:
+    return [(f"SQ{(i // per_seq + 1) * 10:04d}", f"SH{(i % per_seq + 1) * 10:04d}") for i in range(shots)]
+
+
+def write_inputs(folder: Path, pairs: list[tuple[str, str]]) -> dict[str, Path]:
+    # one "SEQ: SHOT" line per shot (the case that used to go quadratic)
+    text_lines = [f"{seq}: {shot}" for seq, shot in pairs]
+
+    edl_lines = ["TITLE: BENCH", "FCM: NON-DROP FRAME", ""]
+    for i, (seq, shot) in enumerate(pairs, start=1):
+        edl_lines.append(f"{i:06d}  A001C{i:06d} V     C        01:00:00:00 01:00:01:00 01:00:00:00 01:00:01:00")
+        edl_lines.append(f"* FROM CLIP NAME: {seq}_{shot}")
+
+    paths = {
+        "text": folder / "shots.txt",
+        "csv": folder / "shots.csv",
+        "edl": folder / "cut.edl",
+    }
+    paths["text"].write_text("\n".join(text_lines), encoding="utf-8")
+    paths["csv"].write_text("sequence,shot\n" + "\n".join(f"{s},{h}" for s, h in pairs), encoding="utf-8")
+    paths["edl"].write_text("\n".join(edl_lines), encoding="utf-8")
+    return paths
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--shots", type=int, nargs="+", default=[50_000, 200_000])
+    args = ap.parse_args()
+
+    print(f"{'shots':>8} {'input':>14} {'seconds':>9} {'shots/s':>12}")
+    for count in args.shots:
+        pairs = make_shot_lines(count)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = write_inputs(Path(tmp), pairs)
+
+            text = paths["text"].read_text(encoding="utf-8")
+            t0 = time.perf_counter()
+            parsed = parse_sequences_and_shots(text)
+            _report(count, "ui text box", time.perf_counter() - t0)
+            assert sum(len(v) for v in parsed.sequences.values()) == count
+
+            for fmt, path in paths.items():
+                t0 = time.perf_counter()
+                imported = import_shots_file(path)
+                _report(count, f"{fmt} file", time.perf_counter() - t0)
+                assert imported.sequences == parsed.sequences
+    return 0
+
+
+def _report(count: int, label: str, seconds: float) -> None:
+    print(f"{count:>8} {label:>14} {seconds:>9.3f} {count / max(seconds, 1e-9):>12.0f}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
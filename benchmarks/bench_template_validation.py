@@ -0,0 +1,67 @@
+"""
+Bulk template validation on synthetic template libraries.
+
+    python -m benchmarks.bench_template_validation --sizes 500 2000 --workers 1 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from builder.core.template_bulk import validate_library
+from builder.core.template_loader import TemplateLoader
+
+
+def make_template_library(folder: Path, count: int, tree_width: int = 12, extends_every: int = 10) -> None:
+    """
+    Writes `count` templates; every `extends_every`-th one extends the previous base.
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    base_id = None
+    for i in range(count):
+        template_id = f"show_{i:05d}"
+        if base_id and i % extends_every:
+            obj = {
+                "extends": base_id,
+                "name": f"Show {i}",
+                "version": "1.0",
+                "shot_tree": {"+work": [f"dcc_{i}"]},
+            }
+        else:
+            obj = {
+                "name": f"Show {i}",
+                "version": "1.0",
+                "project_folders": [f"folder_{k}" for k in range(tree_width)],
+                "shot_tree": {f"dept_{k}": [f"sub_{j}" for j in range(tree_width)] + ["notes.md"] for k in range(tree_width)},
+                "asset_tree": {f"cat_{k}": {"work": ["maya"], "publish": ["usd"]} for k in range(tree_width)},
+            }
+            base_id = template_id
+        (folder / f"{template_id}.json").write_text(json.dumps(obj, indent=2), encoding="utf-8")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[500, 2000])
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = ap.parse_args()
+
+    print(f"{'templates':>10} {'mode':>16} {'seconds':>9} {'files/s':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp) / "templates"
+            make_template_library(folder, size)
+
+            # sanity: the bulk report must agree with the regular loader
+            expected_valid = len(TemplateLoader(folder).load_all().templates)
+            for workers in args.workers:
+                report = validate_library(folder, workers=workers)
+                assert report.valid_count == expected_valid
+                mode = "serial" if report.workers == 1 else f"pool x{report.workers}"
+                print(f"{size:>10} {mode:>16} {report.seconds:>9.3f} {size / report.seconds:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,208 @@
+"""
+Benchmark suite: planner, builder, manifest and parsers on synthetic shows.
+
+    python -m benchmarks.suite                           # run, compare to the baseline
+    python -m benchmarks.suite --save                    # run and (re)write the baseline
+    python -m benchmarks.suite --quick --only plan       # smaller inputs, matching cases only
+    python -m benchmarks.suite --threshold 0.5 --tmp /dev/shm
+
+Each case reports the best of --repeat runs. A case regresses when it is
+slower than its baseline by more than the threshold (a fraction: 0.25 means
+25%); a per-case "threshold" in the baseline file overrides --threshold.
+Exits 1 on any regression. Builds run in --tmp (tmpfs /dev/shm by default
+where it exists) so disk speed does not swamp the builder's own cost.
+Baselines are machine-specific: re-record them on the machine that runs
+the comparison (e.g. CI) with --save.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.synthetic import assets_text, make_assets, make_show, make_template, shots_text
+from builder.core.builder import PlanBuilder
+from builder.core.filesystem import MemoryFileSystem
+from builder.core.manifest import build_manifest, write_manifest
+from builder.core.planner import plan_asset_build, plan_shot_build
+from builder.util.parse_assets import parse_assets
+from builder.util.parse_input import parse_sequences_and_shots
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+DEFAULT_TMP = Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(tempfile.gettempdir())
+
+# input sizes for full / --quick runs; parsers get their own, larger inputs
+SIZES = {
+    "full": {"sequences": 10, "shots": 200, "assets": 1000, "parse_shots": 100_000},
+    "quick": {"sequences": 4, "shots": 50, "assets": 200, "parse_shots": 20_000},
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Callable[[], Any]
+    setup: Callable[[], Any] | None = None   # untimed, before every repeat
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    seconds: float
+    baseline: float
+    threshold: float
+
+    def pretty(self) -> str:
+        return (
+            f"{self.name}: {self.seconds * 1000:.1f} ms vs baseline {self.baseline * 1000:.1f} ms "
+            f"(+{(self.seconds / self.baseline - 1) * 100:.0f}%, allowed +{self.threshold * 100:.0f}%)"
+        )
+
+
+def make_cases(size: str, tmp: Path) -> list[Case]:
+    n = SIZES[size]
+    show = make_show(n["sequences"], n["shots"])
+    assets = make_assets(3, n["assets"])
+    wide = make_template(width=8, depth=1)
+    deep = make_template(width=3, depth=6)
+    root = tmp / "root"
+
+    plan = plan_shot_build(root, "Show", wide, show)
+
+    def clean() -> None:
+        shutil.rmtree(root, ignore_errors=True)
+
+    # one untimed build gives the manifest cases a realistic result
+    result = PlanBuilder().execute(plan)
+    clean()
+
+    def manifest() -> Any:
+        return build_manifest(root / "Show", "Synthetic", "1.0", wide, "shots", show, None, result)
+
+    rec = manifest()
+    text_shots = shots_text(make_show(n["parse_shots"] // 500, 500))
+    text_assets = assets_text(make_assets(10, n["parse_shots"] // 10))
+
+    return [
+        Case("plan_shot_build.wide", lambda: plan_shot_build(root, "Show", wide, show)),
+        Case("plan_shot_build.deep", lambda: plan_shot_build(root, "Show", deep, show)),
+        Case("plan_asset_build.wide", lambda: plan_asset_build(root, "Show", wide, assets)),
+        Case("builder.execute", lambda: PlanBuilder().execute(plan), setup=clean),
+        # same plan without the disk: the builder's own overhead
+        Case("builder.execute.memory", lambda: PlanBuilder(fs=MemoryFileSystem()).execute(plan)),
+        Case("build_manifest", manifest),
+        Case("write_manifest", lambda: write_manifest(rec)),
+        Case("parse_sequences_and_shots", lambda: parse_sequences_and_shots(text_shots)),
+        Case("parse_assets", lambda: parse_assets(text_assets)),
+    ]
+
+
+def time_case(case: Case, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if case.setup is not None:
+            case.setup()
+        t0 = time.perf_counter()
+        case.run()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, Any], threshold: float, min_seconds: float = 0.005
+) -> list[Regression]:
+    """
+    Cases missing from the baseline (or from this run) are not compared, and
+    slowdowns under min_seconds are treated as noise.
+    """
+    regressions = []
+    for name, seconds in results.items():
+        entry = baseline.get("cases", {}).get(name)
+        if not entry:
+            continue
+        allowed = float(entry.get("threshold", threshold))
+        if seconds > entry["seconds"] * (1 + allowed) and seconds - entry["seconds"] > min_seconds:
+            regressions.append(Regression(name, seconds, entry["seconds"], allowed))
+    return regressions
+
+
+def save_baseline(path: Path, results: dict[str, float], size: str, previous: dict[str, Any]) -> None:
+    # per-case thresholds set by hand survive a re-record
+    old_cases = previous.get("cases", {})
+    cases = {}
+    for name, seconds in results.items():
+        cases[name] = {"seconds": round(seconds, 6)}
+        if "threshold" in old_cases.get(name, {}):
+            cases[name]["threshold"] = old_cases[name]["threshold"]
+    payload = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "size": size,
+        "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} CPUs)",
+        "python": platform.python_version(),
+        "cases": cases,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--quick", action="store_true", help="smaller inputs (smoke run)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--only", default="", help="run only cases whose name contains this text")
+    ap.add_argument("--baseline", type=Path, default=None, help="default: benchmarks/baselines/<full|quick>.json")
+    ap.add_argument("--save", action="store_true", help="write this run as the new baseline")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown as a fraction (default 0.25)")
+    ap.add_argument("--min-ms", type=float, default=5.0, help="ignore slowdowns smaller than this (noise)")
+    ap.add_argument("--tmp", type=Path, default=DEFAULT_TMP, help="folder for disk builds (tmpfs recommended)")
+    args = ap.parse_args()
+
+    size = "quick" if args.quick else "full"
+    args.baseline = args.baseline or BASELINE_DIR / f"{size}.json"
+    baseline = load_baseline(args.baseline)
+    if baseline and baseline.get("size", size) != size and not args.save:
+        print(f"baseline was recorded with size '{baseline.get('size')}'; comparing a '{size}' run is meaningless")
+        return 2
+
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory(dir=args.tmp, prefix="sfb_bench_") as tmp:
+        cases = [c for c in make_cases(size, Path(tmp)) if args.only in c.name]
+        print(f"{'case':<28} {'best ms':>10} {'baseline':>10} {'change':>8}")
+        for case in cases:
+            seconds = results[case.name] = time_case(case, args.repeat)
+            entry = baseline.get("cases", {}).get(case.name)
+            if entry:
+                change = f"{(seconds / entry['seconds'] - 1) * 100:+.0f}%"
+                print(f"{case.name:<28} {seconds * 1000:>10.1f} {entry['seconds'] * 1000:>10.1f} {change:>8}")
+            else:
+                print(f"{case.name:<28} {seconds * 1000:>10.1f} {'-':>10} {'':>8}")
+
+    if args.save:
+        save_baseline(args.baseline, results, size, baseline)
+        print(f"baseline written: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold, args.min_ms / 1000)
+    for r in regressions:
+        print(f"REGRESSION {r.pretty()}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
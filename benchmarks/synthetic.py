@@ -0,0 +1,56 @@
+"""
+Synthetic studio data for benchmarks: shows, templates and asset lists.
+
+Everything is deterministic, so the same arguments always produce the same
+plan (and the same timings are comparable against a baseline).
+"""
+from __future__ import annotations
+
+from typing import Any
+
+DCCS = ("maya", "houdini", "nuke", "unreal", "max", "blender", "substance", "katana")
+
+
+def make_show(sequences: int, shots: int, step: int = 10) -> dict[str, list[str]]:
+    """
+    sequences x shots, named SQ0010.. / SH0010.. like a real show.
+    """
+    return {
+        f"SQ{(s + 1) * step:04d}": [f"SH{(i + 1) * step:04d}" for i in range(shots)]
+        for s in range(sequences)
+    }
+
+
+def make_assets(categories: int, per_category: int) -> dict[str, list[str]]:
+    return {f"category_{c:02d}": [f"Asset{i:05d}" for i in range(per_category)] for c in range(categories)}
+
+
+def make_template(width: int = 8, depth: int = 1, files: int = 1, categories: int = 3) -> dict[str, Any]:
+    """
+    Template with `width` top-level shot folders, each holding `width`
+    children nested `depth` levels deep ("a/b/c"), plus `files` starter files
+    per folder. Asset categories share the same tree.
+    """
+    tree: dict[str, list[str]] = {}
+    for w in range(width):
+        children = []
+        for c in range(width):
+            children.append("/".join([f"{DCCS[c % len(DCCS)]}_{c:02d}"] + [f"sub_{d}" for d in range(1, depth)]))
+        children += [f"notes_{f}.md" for f in range(files)]
+        tree[f"dept_{w:02d}"] = children
+    return {
+        "name": f"Synthetic {width}x{depth}",
+        "version": "1.0",
+        "project_folders": ["assets", "sequences", "editorial", "production", "tools", "delivery"],
+        "shot_tree": tree,
+        "asset_tree": {f"category_{c:02d}": tree for c in range(categories)},
+    }
+
+
+def shots_text(show: dict[str, list[str]]) -> str:
+    # one "SEQ: SHOT" line per shot, the worst case for the text parser
+    return "\n".join(f"{seq}: {shot}" for seq, shots in show.items() for shot in shots)
+
+
+def assets_text(assets: dict[str, list[str]]) -> str:
+    return "\n".join(f"{cat}: {', '.join(names)}" for cat, names in assets.items())
@@ -1,14 +1,46 @@
+from builder.util.startup import PROFILE  # first: starts the startup clock
+
+import os
 import sys
-from PySide6.QtWidgets import QApplication
-from builder.ui.main_window import MainWindow
 
+from builder.util import tracing
+
+
+def run_app(quit_when_shown: bool = False) -> int:
+    """
+    SFB_STARTUP_REPORT=1 prints startup timings to stderr; any other value is
+    a path the JSON report is written to. SFB_TRACE=<file> records a
+    Chrome/Perfetto trace of the session, written on exit. quit_when_shown
+    exits right after the first window is up (startup benchmark).
+    """
+    trace_path = tracing.enable_from_env()
+    from PySide6.QtWidgets import QApplication
+    PROFILE.mark("import Qt")
+
+    from builder.ui.main_window import MainWindow
+    PROFILE.mark("import app")
 
-def run_app() -> int:
     app = QApplication(sys.argv)
     app.setApplicationName("Studio Folder Builder")
     app.setOrganizationName("Portfolio")
 
     win = MainWindow()
+    PROFILE.mark("window built")
+
+    def shown() -> None:
+        PROFILE.mark("first window")
+        win.log_startup(PROFILE)
+        report = os.getenv("SFB_STARTUP_REPORT")
+        if report:
+            PROFILE.write_report(report)
+        if quit_when_shown:
+            app.quit()
+
+    win.first_shown.connect(shown)
     win.show()
 
-    return app.exec()
+    code = app.exec()
+    tracer = tracing.disable()
+    if tracer is not None and trace_path is not None:
+        tracer.export(trace_path)
+    return code
@@ -0,0 +1,437 @@
+"""
+Headless command line: plan, build and validate without Qt.
+
+    python -m builder build --config job_config.json
+    python -m builder build --root D:/shows --project MyShow --template vfx_default --shots "SQ010: SH010-SH050x10"
+    python -m builder rebuild --old job_config.prev.json --new job_config.json
+    python -m builder batch jobs/ --workers 4 --summary batch_summary.json
+    python -m builder validate-templates
+
+Only core/util modules are imported (lazily, per subcommand) so scripted
+builds start fast and need no display. Nothing here may import builder.ui
+or PySide6.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Sequence
+
+DEFAULT_TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+# exit codes
+OK = 0
+FAILED = 1      # build errors / invalid templates
+USAGE = 2       # bad arguments or input
+
+
+class CliError(Exception):
+    pass
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    started = time.perf_counter()
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    trace_path = _start_trace(args.trace)
+    try:
+        code = args.func(args)
+    except CliError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        code = USAGE
+    finally:
+        if trace_path is not None:
+            _stop_trace(trace_path)
+    if getattr(args, "timings", False):
+        print(f"[time] total {time.perf_counter() - started:.3f}s", file=sys.stderr)
+    return code
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    from builder import __version__
+
+    parser = argparse.ArgumentParser(prog="python -m builder", description="Studio Folder Builder (headless)")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--trace", type=Path, help="write a Chrome/Perfetto trace of this run to this file (or set SFB_TRACE)"
+    )
+
+    b = sub.add_parser("build", help="plan and build folders from a job config or inline input", parents=[common])
+    b.add_argument("--config", type=Path, help="job_config.json (as saved by the app)")
+    b.add_argument("--root", type=Path, help="root directory (overrides the config)")
+    b.add_argument("--project", help="project name (overrides the config)")
+    b.add_argument("--template", help="template id, i.e. file name without .json (overrides the config)")
+    src = b.add_mutually_exclusive_group()
+    src.add_argument("--shots", help='Seq/Shots text, e.g. "SQ010: SH010, SH020"')
+    src.add_argument("--shots-file", type=Path, help="shot list file (.txt, .csv or .edl)")
+    src.add_argument("--assets", help='Assets text, e.g. "props: Sword, Shield"')
+    b.add_argument("--overwrite", action="store_true", default=None, help="overwrite existing starter files")
+    b.add_argument("--dry-run", action="store_true", help="plan only; nothing is written")
+    b.add_argument("--list", action="store_true", help="print every planned action")
+    b.add_argument("--no-manifest", action="store_true", help="do not write production/manifest.json")
+    b.add_argument("--templates-dir", type=Path, default=DEFAULT_TEMPLATES_DIR)
+    b.add_argument("--json", action="store_true", help="print the summary as JSON")
+    b.add_argument("--timings", action="store_true", help="print phase timings to stderr")
+    b.set_defaults(func=_cmd_build)
+
+    r = sub.add_parser("rebuild", help="build only what changed between two job configs of one project", parents=[common])
+    r.add_argument("--old", type=Path, required=True, help="job config the project was last built from")
+    r.add_argument("--new", type=Path, required=True, help="edited job config")
+    r.add_argument("--dry-run", action="store_true", help="plan only; nothing is written")
+    r.add_argument("--list", action="store_true", help="print every planned action")
+    r.add_argument("--no-manifest", action="store_true", help="do not update the manifest")
+    r.add_argument("--templates-dir", type=Path, default=DEFAULT_TEMPLATES_DIR)
+    r.add_argument("--json", action="store_true", help="print the summary as JSON")
+    r.add_argument("--timings", action="store_true", help="print phase timings to stderr")
+    r.set_defaults(func=_cmd_rebuild)
+
+    bt = sub.add_parser("batch", help="plan and build many job configs in one run", parents=[common])
+    bt.add_argument("paths", type=Path, nargs="+", help="job config files and/or folders to search")
+    bt.add_argument("--pattern", default="*job_config*.json", help="file pattern used inside folders")
+    bt.add_argument("--workers", type=int, default=None, help="planning processes (default: CPU count)")
+    bt.add_argument("--per-root", type=int, default=2, help="project folders building at once on the same storage")
+    bt.add_argument("--dry-run", action="store_true", help="plan only; nothing is written")
+    bt.add_argument("--summary", type=Path, help="write the combined summary JSON here")
+    bt.add_argument("--templates-dir", type=Path, default=DEFAULT_TEMPLATES_DIR)
+    bt.add_argument("--json", action="store_true", help="print the summary as JSON")
+    bt.add_argument("--timings", action="store_true", help="print total time to stderr")
+    bt.set_defaults(func=_cmd_batch)
+
+    v = sub.add_parser("validate-templates", help="validate every template in a folder", parents=[common])
+    v.add_argument("--templates-dir", type=Path, default=DEFAULT_TEMPLATES_DIR)
+    v.add_argument("--workers", type=int, default=None)
+    v.add_argument("--json", action="store_true", help="print the report as JSON")
+    v.add_argument("--timings", action="store_true", help="print total time to stderr")
+    v.set_defaults(func=_cmd_validate_templates)
+    return parser
+
+
+# ---------------- build ----------------
+
+def _cmd_build(args: argparse.Namespace) -> int:
+    from builder.core.plan_request import PlanInputError, PlanRequest, run_plan_request
+
+    timer = _Timer(args.timings)
+    job = _resolve_job(args)
+    template = _load_template(args.templates_dir, job["template_id"])
+    timer.mark("load")
+
+    try:
+        resp = run_plan_request(
+            PlanRequest(job["root"], job["project"], template.raw, job["mode"], job["text"], job["groups"]),
+        )
+    except PlanInputError as exc:
+        raise CliError(str(exc)) from exc
+    timer.mark("plan")
+
+    summary: dict[str, Any] = {
+        "project_root": resp.project_root.as_posix(),
+        "template": template.template_id,
+        "mode": job["mode"],
+        "planned": len(resp.plan),
+        "dry_run": bool(args.dry_run),
+    }
+    if args.list:
+        for action in resp.plan:
+            print(action.pretty())
+
+    result = None
+    if args.dry_run:
+        summary["would"] = _simulate(resp.plan, job["overwrite"])
+        timer.mark("simulate")
+    else:
+        from builder.core.builder import PlanBuilder
+
+        result = PlanBuilder(overwrite=job["overwrite"]).execute(resp.plan)
+        timer.mark("build")
+        summary["results"] = {
+            "created_dirs": result.created_dirs,
+            "created_files": result.created_files,
+            "skipped": result.skipped,
+            "errors": result.errors,
+        }
+        if not args.no_manifest:
+            from builder.core.manifest import build_manifest, write_manifest
+
+            rec = build_manifest(
+                project_root=resp.project_root,
+                template_name=template.name,
+                template_version=template.version,
+                template_raw=template.raw,
+                mode=job["mode"],
+                sequences=resp.sequences,
+                assets=resp.assets,
+                result=result,
+            )
+            summary["manifest"] = write_manifest(rec).as_posix()
+            timer.mark("manifest")
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"Project path: {summary['project_root']}")
+        print(f"Template: {template.name} (v{template.version})")
+        print(resp.summary())
+        print(f"Plan totals - folders/files: {len(resp.plan)} (deduped).")
+        if "would" in summary:
+            _print_simulation(summary["would"])
+        if result is not None:
+            from builder.core.reporting import format_build_summary
+
+            print(format_build_summary(result), end="")
+        if "manifest" in summary:
+            print(f"Manifest written: {summary['manifest']}")
+    timer.report()
+    return FAILED if result is not None and result.errors else OK
+
+
+def _resolve_job(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Config values first, then command-line overrides. Input read from files
+    (config, shot list) is kept parsed in "groups"; only --shots/--assets
+    text is parsed by the planner.
+    """
+    job: dict[str, Any] = {
+        "root": None, "project": None, "template_id": None, "mode": None,
+        "text": "", "groups": None, "overwrite": False,
+    }
+
+    if args.config is not None:
+        from builder.core.job_config import read_job_config
+
+        try:
+            cfg = read_job_config(args.config)
+        except (OSError, ValueError) as exc:
+            raise CliError(f"cannot read {args.config}: {exc}") from exc
+        job.update(
+            root=Path(cfg.root),
+            project=cfg.project,
+            template_id=cfg.template_id,
+            mode=cfg.mode,
+            groups=cfg.sequences if cfg.mode == "shots" else cfg.assets,
+            overwrite=cfg.overwrite,
+        )
+
+    if args.shots is not None:
+        job.update(mode="shots", text=args.shots, groups=None)
+    elif args.shots_file is not None:
+        from builder.util.import_shots import import_shots_file
+
+        try:
+            parsed = import_shots_file(args.shots_file)
+        except (OSError, ValueError) as exc:
+            raise CliError(f"cannot read {args.shots_file}: {exc}") from exc
+        if parsed.skipped:
+            print(f"warning: skipped {len(parsed.skipped)} row(s) with no sequence in {args.shots_file}", file=sys.stderr)
+        job.update(mode="shots", groups=parsed.sequences)
+    elif args.assets is not None:
+        job.update(mode="assets", text=args.assets, groups=None)
+
+    if args.root is not None:
+        job["root"] = args.root
+    if args.project:
+        job["project"] = args.project
+    if args.template:
+        job["template_id"] = args.template
+    if args.overwrite is not None:
+        job["overwrite"] = args.overwrite
+
+    missing = [flag for flag, key in (("--root", "root"), ("--project", "project"), ("--template", "template_id")) if not job[key]]
+    if missing:
+        raise CliError(f"missing {', '.join(missing)} (or --config)")
+    if not job["mode"]:
+        raise CliError("no input: give --config, --shots, --shots-file or --assets")
+    return job
+
+
+def _simulate(plan: list[Any], overwrite: bool) -> dict[str, int]:
+    """
+    Dry run: builds into an in-memory overlay of the real disk, so existing
+    folders/files are reported as skipped and nothing is written.
+    """
+    from builder.core.builder import PlanBuilder
+    from builder.core.filesystem import LocalFileSystem, MemoryFileSystem
+
+    result = PlanBuilder(overwrite=overwrite, fs=MemoryFileSystem(base=LocalFileSystem())).execute(plan)
+    return {
+        "create_dirs": result.created_dirs,
+        "create_files": result.created_files,
+        "existing": result.skipped,
+        "errors": result.errors,
+    }
+
+
+def _print_simulation(would: dict[str, int]) -> None:
+    print(
+        f"Dry run: would create {would['create_dirs']} folder(s) and {would['create_files']} file(s); "
+        f"{would['existing']} already exist. Nothing was written."
+    )
+
+
+def _load_template(templates_dir: Path, template_id: str) -> Any:
+    from builder.core.template_loader import TemplateLoader, TemplateLoadError
+
+    loader = TemplateLoader(templates_dir)
+    handle = next((h for h in loader.scan() if h.template_id == template_id), None)
+    if handle is None:
+        raise CliError(f"template '{template_id}' not found in {templates_dir}")
+    try:
+        return loader.load(handle)
+    except TemplateLoadError as exc:
+        details = "; ".join(issue.pretty() for issue in exc.issues)
+        raise CliError(f"template '{template_id}' is invalid: {details}") from exc
+
+
+# ---------------- rebuild ----------------
+
+def _cmd_rebuild(args: argparse.Namespace) -> int:
+    from builder.core.job_config import read_job_config
+    from builder.core.job_diff import JobDiffError, diff_job_configs, plan_delta
+
+    timer = _Timer(args.timings)
+    try:
+        old, new = read_job_config(args.old), read_job_config(args.new)
+    except (OSError, ValueError) as exc:
+        raise CliError(f"cannot read job config: {exc}") from exc
+    try:
+        delta = diff_job_configs(old, new)
+    except JobDiffError as exc:
+        raise CliError(str(exc)) from exc
+    template = _load_template(args.templates_dir, new.template_id)
+    timer.mark("diff")
+
+    plan = plan_delta(new, template.raw, delta)
+    timer.mark("plan")
+    project_root = Path(new.root) / new.project
+    summary: dict[str, Any] = {
+        "project_root": project_root.as_posix(),
+        "added": {group: len(names) for group, names in delta.added.items()},
+        "removed": {group: len(names) for group, names in delta.removed.items()},
+        "planned": len(plan),
+        "dry_run": bool(args.dry_run),
+    }
+    if args.list:
+        for action in plan:
+            print(action.pretty())
+
+    result = None
+    if plan and args.dry_run:
+        summary["would"] = _simulate(plan, new.overwrite)
+    elif plan:
+        from builder.core.builder import PlanBuilder
+
+        result = PlanBuilder(overwrite=new.overwrite).execute(plan)
+        timer.mark("build")
+        summary["results"] = {
+            "created_dirs": result.created_dirs,
+            "created_files": result.created_files,
+            "skipped": result.skipped,
+            "errors": result.errors,
+        }
+        if not args.no_manifest:
+            from builder.core.manifest import build_manifest, update_manifest
+
+            rec = build_manifest(
+                project_root=project_root,
+                template_name=template.name,
+                template_version=template.version,
+                template_raw=template.raw,
+                mode=new.mode,
+                sequences=new.sequences,
+                assets=new.assets,
+                result=result,
+            )
+            summary["manifest"] = update_manifest(rec).as_posix()
+            timer.mark("manifest")
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"Project path: {summary['project_root']}")
+        print(delta.pretty())
+        if delta.is_empty:
+            print("Nothing to build.")
+        else:
+            print(f"Plan totals - folders/files: {len(plan)} (delta only).")
+        if "would" in summary:
+            _print_simulation(summary["would"])
+        if result is not None:
+            from builder.core.reporting import format_build_summary
+
+            print(format_build_summary(result), end="")
+        if "manifest" in summary:
+            print(f"Manifest updated: {summary['manifest']}")
+    timer.report()
+    return FAILED if result is not None and result.errors else OK
+
+
+# ---------------- batch ----------------
+
+def _cmd_batch(args: argparse.Namespace) -> int:
+    from builder.core.batch import find_job_configs, run_batch
+
+    missing = [p for p in args.paths if not p.exists()]
+    if missing:
+        raise CliError(f"not found: {', '.join(str(p) for p in missing)}")
+    configs = find_job_configs(args.paths, args.pattern)
+    if not configs:
+        raise CliError(f"no job configs matching {args.pattern}")
+
+    report = run_batch(configs, args.templates_dir, workers=args.workers, per_root=args.per_root, dry_run=args.dry_run)
+    summary = report.to_dict()
+    if args.summary is not None:
+        args.summary.parent.mkdir(parents=True, exist_ok=True)
+        args.summary.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    print(json.dumps(summary, indent=2) if args.json else report.pretty())
+    return OK if report.ok else FAILED
+
+
+# ---------------- validate-templates ----------------
+
+def _cmd_validate_templates(args: argparse.Namespace) -> int:
+    from builder.core.template_bulk import validate_library
+
+    if not args.templates_dir.is_dir():
+        raise CliError(f"not a directory: {args.templates_dir}")
+    report = validate_library(args.templates_dir, workers=args.workers)
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.pretty())
+    return OK if report.ok else FAILED
+
+
+def _start_trace(path: Path | None) -> Path | None:
+    from builder.util import tracing
+
+    if path is not None:
+        tracing.enable()
+        return path
+    return tracing.enable_from_env()
+
+
+def _stop_trace(path: Path) -> None:
+    from builder.util import tracing
+
+    tracer = tracing.disable()
+    if tracer is not None:
+        print(f"[trace] {len(tracer.events)} span(s) written to {tracer.export(path)}", file=sys.stderr)
+
+
+class _Timer:
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self._last = time.perf_counter()
+        self._marks: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._marks.append((phase, now - self._last))
+        self._last = now
+
+    def report(self) -> None:
+        if self.enabled:
+            print("[time] " + ", ".join(f"{name} {secs:.3f}s" for name, secs in self._marks), file=sys.stderr)
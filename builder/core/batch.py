@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Sequence
+
+from builder.core.builder import ActionOutcome, BuildResult, PlanBuilder
+from builder.core.filesystem import FileSystem
+from builder.core.job_config import read_job_config
+from builder.core.manifest import build_manifest, write_manifest
+from builder.core.plan_request import plan_groups
+from builder.core.template_loader import TemplateLoader
+from builder.models import PlanAction, PlanActionType
+from builder.util.tracing import span
+
+DEFAULT_PATTERN = "*job_config*.json"
+
+
+@dataclass(frozen=True)
+class JobPlan:
+    """
+    Result of planning one job config (in a worker process).
+    """
+    config_path: str
+    project_root: Path | None = None
+    template_name: str = ""
+    template_version: str = ""
+    template_raw: dict[str, Any] = field(default_factory=dict)
+    mode: str = ""
+    overwrite: bool = False
+    sequences: dict[str, Sequence[str]] | None = None
+    assets: dict[str, Sequence[str]] | None = None
+    plan: list[PlanAction] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class JobReport:
+    config_path: str
+    project_root: str = ""
+    planned: int = 0
+    shared: int = 0       # directories created by an earlier job in the batch
+    result: BuildResult | None = None
+    manifest: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and (self.result is None or self.result.errors == 0)
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    jobs: list[JobReport]
+    seconds: float
+    plan_workers: int
+    dry_run: bool
+
+    @property
+    def ok(self) -> bool:
+        return all(j.ok for j in self.jobs)
+
+    def pretty(self) -> str:
+        failed = sum(1 for j in self.jobs if not j.ok)
+        lines = [
+            f"Batch: {len(self.jobs)} job(s), {failed} failed, {self.seconds:.2f}s"
+            + (" (dry run)" if self.dry_run else ""),
+        ]
+        for j in self.jobs:
+            name = Path(j.config_path).name
+            if j.error:
+                lines.append(f"  FAIL {name}: {j.error}")
+                continue
+            line = f"  {'ok  ' if j.ok else 'FAIL'} {name} -> {j.project_root}: {j.planned} planned"
+            if j.result is not None:
+                r = j.result
+                line += f", {r.created_dirs} dirs / {r.created_files} files created, {r.skipped} skipped, {r.errors} errors"
+            if j.shared:
+                line += f" ({j.shared} shared)"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        jobs = []
+        for j in self.jobs:
+            item: dict[str, Any] = {
+                "config": j.config_path,
+                "project_root": j.project_root,
+                "planned": j.planned,
+                "shared": j.shared,
+                "manifest": j.manifest,
+                "error": j.error,
+            }
+            if j.result is not None:
+                item["results"] = {
+                    "created_dirs": j.result.created_dirs,
+                    "created_files": j.result.created_files,
+                    "skipped": j.result.skipped,
+                    "errors": j.result.errors,
+                }
+            jobs.append(item)
+        return {
+            "seconds": round(self.seconds, 4),
+            "plan_workers": self.plan_workers,
+            "dry_run": self.dry_run,
+            "ok": self.ok,
+            "jobs": jobs,
+        }
+
+
+def find_job_configs(paths: Sequence[Path], pattern: str = DEFAULT_PATTERN) -> list[Path]:
+    """
+    Files are taken as given; directories are searched recursively for pattern.
+    """
+    found: list[Path] = []
+    for p in paths:
+        found.extend(sorted(p.rglob(pattern)) if p.is_dir() else [p])
+    # same file listed twice (or found twice) runs once
+    seen: set[Path] = set()
+    return [p for p in found if not (p.resolve() in seen or seen.add(p.resolve()))]
+
+
+def run_batch(
+    configs: Sequence[Path],
+    templates_dir: Path,
+    workers: int | None = None,
+    per_root: int = 2,
+    dry_run: bool = False,
+    fs: FileSystem | None = None,
+) -> BatchReport:
+    """
+    Plans every job in a process pool, then builds on threads with at most
+    per_root project folders being written on the same storage device at
+    once. Jobs sharing a project folder run one after another in config
+    order, so what each job creates or skips doesn't depend on thread
+    timing. A directory an earlier job created is recorded as shared by
+    later jobs; one it failed to create is attempted again. One manifest
+    per job. `fs` is what builds write through (default: the local disk).
+    """
+    started = time.perf_counter()
+    workers = max(1, workers or os.cpu_count() or 1)
+    args = [str(c) for c in configs]
+
+    # a fresh loader per batch (per worker process), so edited templates are seen
+    if workers == 1 or len(args) <= 1:
+        workers = 1
+        _init_planner(str(templates_dir))
+        plans = [_plan_job(a) for a in args]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(args)), initializer=_init_planner, initargs=(str(templates_dir),)
+        ) as pool:
+            plans = list(pool.map(_plan_job, args))
+
+    reports = [JobReport(config_path=p.config_path, error=p.error) for p in plans]
+    for jp, report in zip(plans, reports):
+        report.planned = len(jp.plan)
+        report.project_root = jp.project_root.as_posix() if jp.project_root else ""
+
+    if dry_run:
+        _count_shared(plans, reports)
+    else:
+        manifest_paths = _manifest_paths(plans)
+        by_root: dict[Path, list[int]] = {}
+        for i, jp in enumerate(plans):
+            if jp.error is None and jp.project_root is not None:
+                by_root.setdefault(jp.project_root, []).append(i)
+        limits: dict[Any, threading.Semaphore] = {}
+        for root in by_root:
+            limits.setdefault(_storage_key(root), threading.Semaphore(max(1, per_root)))
+
+        def build(root: Path) -> None:
+            done: set[Path] = set()   # directories this folder's earlier jobs created (or found)
+            with limits[_storage_key(root)]:
+                for i in by_root[root]:
+                    jp = plans[i]
+                    with span("batch.job", config=Path(jp.config_path).name):
+                        reports[i].result = _build_job(jp, reports[i], done, manifest_paths[i], fs)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(by_root), per_root * len(limits)))) as pool:
+            list(pool.map(build, by_root))
+
+    return BatchReport(jobs=reports, seconds=time.perf_counter() - started, plan_workers=workers, dry_run=dry_run)
+
+
+# ---------------- Internals ----------------
+
+_loader: TemplateLoader | None = None
+
+
+def _init_planner(templates_dir: str) -> None:
+    global _loader
+    _loader = TemplateLoader(Path(templates_dir))
+
+
+def _plan_job(config_path: str) -> JobPlan:
+    """
+    Worker: reads one job config and plans it. Errors are returned, not raised,
+    so one broken config doesn't stop the batch.
+    """
+    try:
+        assert _loader is not None
+        cfg = read_job_config(Path(config_path))
+        handle = next((h for h in _loader.scan() if h.template_id == cfg.template_id), None)
+        if handle is None:
+            raise ValueError(f"template '{cfg.template_id}' not found")
+        template = _loader.load(handle)
+        # the config is already parsed: plan its groups as they are
+        groups = cfg.sequences if cfg.mode == "shots" else cfg.assets
+        plan = plan_groups(Path(cfg.root), cfg.project, template.raw, cfg.mode, groups)
+    except Exception as exc:
+        return JobPlan(config_path=config_path, error=str(exc))
+
+    return JobPlan(
+        config_path=config_path,
+        project_root=Path(cfg.root) / cfg.project,
+        template_name=template.name,
+        template_version=template.version,
+        template_raw=template.raw,
+        mode=cfg.mode,
+        overwrite=cfg.overwrite,
+        sequences=cfg.sequences if cfg.mode == "shots" else None,
+        assets=cfg.assets if cfg.mode == "assets" else None,
+        plan=plan,
+    )
+
+
+def _count_shared(plans: list[JobPlan], reports: list[JobReport]) -> None:
+    # dry run: directories an earlier job in the batch would create
+    claimed: set[Path] = set()
+    for jp, report in zip(plans, reports):
+        for action in jp.plan:
+            if action.type == PlanActionType.DIR:
+                if action.path in claimed:
+                    report.shared += 1
+                claimed.add(action.path)
+
+
+def _build_job(
+    jp: JobPlan, report: JobReport, done: set[Path], manifest_path: Path | None, fs: FileSystem | None = None
+) -> BuildResult:
+    # files are never shared: each job's overwrite setting applies to its own files
+    todo = [a for a in jp.plan if not (a.type == PlanActionType.DIR and a.path in done)]
+    report.shared = len(jp.plan) - len(todo)
+    result = PlanBuilder(overwrite=jp.overwrite, fs=fs).execute(todo)
+    for outcome in result.outcomes:
+        if outcome.action.type == PlanActionType.DIR and outcome.status != "error":
+            done.add(outcome.action.path)
+
+    # shared directories still belong in this job's manifest
+    own = {a.path for a in todo}
+    for action in jp.plan:
+        if action.type == PlanActionType.DIR and action.path not in own:
+            result.outcomes.append(ActionOutcome(action, "skipped", "Shared with another job in the batch"))
+            result.skipped += 1
+    result.planned = len(jp.plan)
+
+    assert jp.project_root is not None
+    rec = build_manifest(
+        project_root=jp.project_root,
+        template_name=jp.template_name,
+        template_version=jp.template_version,
+        template_raw=jp.template_raw,
+        mode=jp.mode,
+        sequences=jp.sequences,
+        assets=jp.assets,
+        result=result,
+    )
+    if manifest_path is not None:
+        rec = replace(rec, manifest_path=manifest_path.as_posix())
+    report.manifest = write_manifest(rec).as_posix()
+    return result
+
+
+def _manifest_paths(plans: list[JobPlan]) -> list[Path | None]:
+    """
+    Jobs that share a project folder would overwrite each other's
+    production/manifest.json; those get manifest_<config name>.json instead.
+    """
+    roots: dict[Path, int] = {}
+    for jp in plans:
+        if jp.project_root is not None:
+            roots[jp.project_root] = roots.get(jp.project_root, 0) + 1
+
+    out: list[Path | None] = []
+    for jp in plans:
+        if jp.project_root is None or roots[jp.project_root] == 1:
+            out.append(None)
+        else:
+            out.append(jp.project_root / "production" / f"manifest_{Path(jp.config_path).stem}.json")
+    return out
+
+
+def _storage_key(path: Path | None) -> Any:
+    """
+    Device id of the nearest existing ancestor, so jobs on the same disk or
+    share are throttled together (falls back to the path's anchor).
+    """
+    if path is None:
+        return None
+    for candidate in (path, *path.parents):
+        try:
+            return os.stat(candidate).st_dev
+        except OSError:
+            continue
+    return path.anchor
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
+from builder.core.filesystem import FileSystem, LocalFileSystem
 from builder.models import PlanAction, PlanActionType
+from builder.util.tracing import span
 
 
 @dataclass(frozen=True)
@@ -22,52 +25,121 @@ class BuildResult:
     skipped: int = 0
     errors: int = 0
     outcomes: list[ActionOutcome] = field(default_factory=list)
+    planned: int = 0          # actions in the plan; outcomes cover the ones that ran
+    cancelled: bool = False   # stopped early; the remaining actions were not attempted
+
+    @property
+    def pending(self) -> int:
+        return max(0, self.planned - len(self.outcomes))
+
+
+@dataclass(frozen=True)
+class BuildProgress:
+    done: int
+    total: int
+    elapsed: float  # seconds
+
+    @property
+    def rate(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        rate = self.rate
+        return (self.total - self.done) / rate if rate > 0 else None
+
+    def pretty(self) -> str:
+        eta = f"{self.eta:.0f}s left" if self.eta is not None else "estimating..."
+        return f"{self.done}/{self.total} actions - {self.rate:.0f}/s - {eta}"
+
+
+ProgressCallback = Callable[[BuildProgress], None]
 
 
 class PlanBuilder:
-    def __init__(self, overwrite: bool = False):
-        self.overwrite = overwrite
+    """
+    fs defaults to the real disk; pass a MemoryFileSystem for dry runs and
+    benchmarks, or a FlakyFileSystem to simulate slow or failing storage.
+    """
 
-    def execute(self, plan: Iterable[PlanAction]) -> BuildResult:
+    def __init__(self, overwrite: bool = False, progress_interval: float = 0.1, fs: FileSystem | None = None):
+        self.overwrite = overwrite
+        self.progress_interval = progress_interval
+        self.fs: FileSystem = fs if fs is not None else LocalFileSystem()
+
+    def execute(
+        self,
+        plan: Iterable[PlanAction],
+        progress: ProgressCallback | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> BuildResult:
+        """
+        progress is called at most every progress_interval seconds (and once
+        at the end). should_cancel is checked between actions, so a cancelled
+        build stops after a whole action and its outcomes stay accurate.
+        """
         result = BuildResult(overwrite=self.overwrite)
 
-        dirs = [a for a in plan if a.type == PlanActionType.DIR]
-        files = [a for a in plan if a.type == PlanActionType.FILE]
-
-        for action in dirs + files:
-            try:
-                if action.type == PlanActionType.DIR:
-                    created = self._make_dir(action.path)
-                    if created:
-                        result.created_dirs += 1
-                        result.outcomes.append(ActionOutcome(action, "created"))
-                    else:
-                        result.skipped += 1
-                        result.outcomes.append(ActionOutcome(action, "skipped", "Directory already exists"))
-                else:
-                    created = self._make_file(action.path)
-                    if created:
-                        result.created_files += 1
-                        result.outcomes.append(ActionOutcome(action, "created"))
-                    else:
-                        result.skipped += 1
-                        result.outcomes.append(ActionOutcome(action, "skipped", "File already exists (overwrite OFF)"))
-            except Exception as exc:
-                result.errors += 1
-                result.outcomes.append(ActionOutcome(action, "error", str(exc)))
-
+        with span("build.order"):
+            dirs = [a for a in plan if a.type == PlanActionType.DIR]
+            files = [a for a in plan if a.type == PlanActionType.FILE]
+        result.planned = len(dirs) + len(files)
+
+        started = time.perf_counter()
+        next_report = started + self.progress_interval
+
+        done = 0
+        for phase, actions in (("build.dirs", dirs), ("build.files", files)):
+            with span(phase, actions=len(actions)):
+                for action in actions:
+                    if should_cancel is not None and should_cancel():
+                        result.cancelled = True
+                        break
+                    if progress is not None and time.perf_counter() >= next_report:
+                        now = time.perf_counter()
+                        progress(BuildProgress(done, result.planned, now - started))
+                        next_report = now + self.progress_interval
+                    self._run(action, result)
+                    done += 1
+            if result.cancelled:
+                break
+
+        if progress is not None:
+            progress(BuildProgress(len(result.outcomes), result.planned, time.perf_counter() - started))
         return result
 
+    def _run(self, action: PlanAction, result: BuildResult) -> None:
+        try:
+            if action.type == PlanActionType.DIR:
+                created = self._make_dir(action.path)
+                if created:
+                    result.created_dirs += 1
+                    result.outcomes.append(ActionOutcome(action, "created"))
+                else:
+                    result.skipped += 1
+                    result.outcomes.append(ActionOutcome(action, "skipped", "Directory already exists"))
+            else:
+                created = self._make_file(action.path)
+                if created:
+                    result.created_files += 1
+                    result.outcomes.append(ActionOutcome(action, "created"))
+                else:
+                    result.skipped += 1
+                    result.outcomes.append(ActionOutcome(action, "skipped", "File already exists (overwrite OFF)"))
+        except Exception as exc:
+            result.errors += 1
+            result.outcomes.append(ActionOutcome(action, "error", str(exc)))
+
     def _make_dir(self, path: Path) -> bool:
-        if path.exists():
+        if self.fs.exists(path):
             return False
-        path.mkdir(parents=True, exist_ok=True)
+        self.fs.mkdir(path)
         return True
 
     def _make_file(self, path: Path) -> bool:
-        path.parent.mkdir(parents=True, exist_ok=True)
+        self.fs.mkdir(path.parent)
 
-        if path.exists() and not self.overwrite:
+        if self.fs.exists(path) and not self.overwrite:
             return False
 
         suffix = path.suffix.lower()
@@ -78,5 +150,5 @@ class PlanBuilder:
         else:
             content = ""
 
-        path.write_text(content, encoding="utf-8")
+        self.fs.write_text(path, content)
         return True
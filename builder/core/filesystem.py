@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Protocol
+
+
+class FileSystem(Protocol):
+    """
+    The few filesystem calls PlanBuilder needs. mkdir always creates missing
+    parents and accepts an existing directory.
+    """
+
+    def exists(self, path: Path) -> bool: ...
+
+    def mkdir(self, path: Path) -> None: ...
+
+    def write_text(self, path: Path, text: str) -> None: ...
+
+
+class LocalFileSystem:
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def mkdir(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+    def write_text(self, path: Path, text: str) -> None:
+        path.write_text(text, encoding="utf-8")
+
+
+class MemoryFileSystem:
+    """
+    Directories and files kept in memory (thread-safe), keyed by path string
+    (hashing Path objects would cost more than the work being measured).
+
+    With a `base`, this is an overlay: reads fall through to the base and
+    writes stay in memory. MemoryFileSystem(LocalFileSystem()) is a dry run
+    that still sees which folders already exist on disk.
+    """
+
+    def __init__(self, base: FileSystem | None = None) -> None:
+        self.base = base
+        self.dirs: set[str] = set()
+        self.files: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def exists(self, path: Path) -> bool:
+        key = str(path)
+        with self._lock:
+            if key in self.dirs or key in self.files:
+                return True
+        return self.base is not None and self.base.exists(path)
+
+    def mkdir(self, path: Path) -> None:
+        key = str(path)
+        with self._lock:
+            # walk up only until a known directory (usually the parent)
+            missing = []
+            while key not in self.dirs:
+                if key in self.files:
+                    raise FileExistsError(f"not a directory: {key}")
+                missing.append(key)
+                parent = os.path.dirname(key)
+                if parent == key:
+                    break
+                key = parent
+            self.dirs.update(missing)
+
+    def write_text(self, path: Path, text: str) -> None:
+        key = str(path)
+        with self._lock:
+            if key in self.dirs:
+                raise IsADirectoryError(f"is a directory: {key}")
+            parent_known = os.path.dirname(key) in self.dirs
+        if not parent_known and not (self.base is not None and self.base.exists(path.parent)):
+            raise FileNotFoundError(f"no such directory: {path.parent}")
+        with self._lock:
+            self.files[key] = text
+
+    def read_text(self, path: Path) -> str:
+        with self._lock:
+            return self.files[str(path)]
+
+
+class FlakyFileSystem:
+    """
+    Wraps another FileSystem with latency and injected faults, for tests and
+    benchmarks of slow or unreliable storage (network shares).
+
+    Every call sleeps `latency` seconds. Write calls (mkdir/write_text) fail
+    with `error` for the next `fail_next` calls, for any path containing one
+    of `fail_paths`, and otherwise with probability `failure_rate` (seeded,
+    so runs are repeatable).
+    """
+
+    def __init__(
+        self,
+        inner: FileSystem,
+        latency: float = 0.0,
+        fail_next: int = 0,
+        failure_rate: float = 0.0,
+        fail_paths: tuple[str, ...] = (),
+        error: type[OSError] = PermissionError,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.inner = inner
+        self.latency = latency
+        self.fail_next = fail_next
+        self.failure_rate = failure_rate
+        self.fail_paths = fail_paths
+        self.error = error
+        self.calls = 0
+        self.failures = 0
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def exists(self, path: Path) -> bool:
+        self._delay()
+        return self.inner.exists(path)
+
+    def mkdir(self, path: Path) -> None:
+        self._delay()
+        self._maybe_fail("mkdir", path)
+        self.inner.mkdir(path)
+
+    def write_text(self, path: Path, text: str) -> None:
+        self._delay()
+        self._maybe_fail("write", path)
+        self.inner.write_text(path, text)
+
+    def _delay(self) -> None:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            self._sleep(self.latency)
+
+    def _maybe_fail(self, op: str, path: Path) -> None:
+        text = path.as_posix()
+        with self._lock:
+            fail = self.fail_next > 0 or any(p in text for p in self.fail_paths) or self._rng.random() < self.failure_rate
+            if self.fail_next > 0:
+                self.fail_next -= 1
+            if fail:
+                self.failures += 1
+        if fail:
+            raise self.error(f"injected fault in {op}({text})")
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+SNAPSHOT_KIND = "studio-folder-builder/flow-snapshot"
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+class StaleSnapshotError(SnapshotError):
+    pass
+
+
+@dataclass(frozen=True)
+class FlowSnapshot:
+    """
+    Flow/PT sequences/shots and assets frozen to a file, so batch jobs and
+    the UI can work without a live connection.
+    """
+    created_at: str   # UTC ISO time of the fetch
+    site: str
+    project_id: int
+    sequences: dict[str, Sequence[str]]
+    assets: dict[str, Sequence[str]]
+    filter_key: str = ""
+
+    def age(self, now: datetime | None = None) -> timedelta:
+        return (now or datetime.now(timezone.utc)) - datetime.fromisoformat(self.created_at)
+
+    def is_fresh(self, max_age: timedelta, now: datetime | None = None) -> bool:
+        return self.age(now) <= max_age
+
+
+def write_snapshot(path: Path, snapshot: FlowSnapshot) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "kind": SNAPSHOT_KIND,
+        "version": SNAPSHOT_VERSION,
+        "created_at": snapshot.created_at,
+        "site": snapshot.site,
+        "project_id": snapshot.project_id,
+        "filter": snapshot.filter_key,
+        "sequences": {k: list(v) for k, v in snapshot.sequences.items()},
+        "assets": {k: list(v) for k, v in snapshot.assets.items()},
+    }
+    # compact separators: snapshots are read by machines, often many at once
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def read_snapshot(path: Path, max_age: timedelta | None = None) -> FlowSnapshot:
+    """
+    Raises SnapshotError for unreadable or unknown files and
+    StaleSnapshotError when the snapshot is older than max_age.
+    """
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise SnapshotError(f"Cannot read Flow/PT snapshot {path}: {exc}") from exc
+
+    if not isinstance(obj, dict) or obj.get("kind") != SNAPSHOT_KIND:
+        raise SnapshotError(f"Not a Flow/PT snapshot: {path}")
+    if obj.get("version") != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported Flow/PT snapshot version {obj.get('version')!r} in {path}")
+
+    try:
+        snapshot = FlowSnapshot(
+            created_at=str(obj["created_at"]),
+            site=str(obj.get("site") or ""),
+            project_id=int(obj["project_id"]),
+            sequences=_groups(obj.get("sequences")),
+            assets=_groups(obj.get("assets")),
+            filter_key=str(obj.get("filter") or ""),
+        )
+        age = snapshot.age()
+    except (KeyError, TypeError, ValueError) as exc:
+        raise SnapshotError(f"Malformed Flow/PT snapshot {path}: {exc}") from exc
+
+    if max_age is not None and age > max_age:
+        raise StaleSnapshotError(
+            f"Flow/PT snapshot {path.name} is {_hours(age)} old (limit {_hours(max_age)})"
+        )
+    return snapshot
+
+
+def _groups(obj: Any) -> dict[str, Sequence[str]]:
+    if not isinstance(obj, dict):
+        return {}
+    # server codes, stored and read as literal names (never range syntax)
+    return {str(k): [str(t) for t in v] for k, v in obj.items() if isinstance(v, list)}
+
+
+def _hours(delta: timedelta) -> str:
+    return f"{delta.total_seconds() / 3600:.1f}h"
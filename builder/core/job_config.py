@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, asdict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
+
+from builder.util.name_ranges import json_default, name_tokens, names_from_json
 
 
 def utc_iso_now() -> str:
@@ -24,8 +26,14 @@ class JobConfig:
     mode: str  # "shots" | "assets"
     overwrite: bool
 
-    sequences: dict[str, list[str]] | None
-    assets: dict[str, list[str]] | None
+    # values may be NameList objects (range syntax); ranges are saved as {"range": token}
+    sequences: dict[str, Sequence[str]] | None
+    assets: dict[str, Sequence[str]] | None
+
+    # optional Flow/PT snapshot (path relative to the config file) that fills
+    # sequences/assets when they are not listed inline
+    flow_snapshot: str | None = None
+    flow_snapshot_max_age_hours: float | None = None
 
 
 def make_job_config(
@@ -34,8 +42,8 @@ def make_job_config(
     template_id: str,
     mode: str,
     overwrite: bool,
-    sequences: dict[str, list[str]] | None,
-    assets: dict[str, list[str]] | None,
+    sequences: dict[str, Sequence[str]] | None,
+    assets: dict[str, Sequence[str]] | None,
     version: str = "0.8.0",
 ) -> JobConfig:
     return JobConfig(
@@ -55,7 +63,10 @@ def make_job_config(
 def write_job_config(path: Path, config: JobConfig) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = asdict(config)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    for key in ("flow_snapshot", "flow_snapshot_max_age_hours"):
+        if payload[key] is None:
+            del payload[key]
+    path.write_text(json.dumps(payload, indent=2, default=json_default), encoding="utf-8")
     return path
 
 
@@ -70,8 +81,20 @@ def read_job_config(path: Path) -> JobConfig:
             raise ValueError(f"Missing required key: {k}")
 
     mode = str(obj["mode"])
-    sequences = obj.get("sequences")
-    assets = obj.get("assets")
+    sequences = _expand_groups(obj.get("sequences"))
+    assets = _expand_groups(obj.get("assets"))
+
+    snapshot_ref = obj.get("flow_snapshot")
+    max_age = obj.get("flow_snapshot_max_age_hours")
+    if snapshot_ref:
+        from builder.core.flow_snapshot import read_snapshot
+
+        snap = read_snapshot(
+            path.parent / str(snapshot_ref),
+            max_age=timedelta(hours=float(max_age)) if max_age is not None else None,
+        )
+        sequences = sequences or snap.sequences or None
+        assets = assets or snap.assets or None
 
     # Enforce mode consistency
     if mode == "shots" and not sequences:
@@ -88,11 +111,19 @@ def read_job_config(path: Path) -> JobConfig:
         template_id=str(obj["template_id"]),
         mode=mode,
         overwrite=bool(obj["overwrite"]),
-        sequences=sequences if isinstance(sequences, dict) else None,
-        assets=assets if isinstance(assets, dict) else None,
+        sequences=sequences,
+        assets=assets,
+        flow_snapshot=str(snapshot_ref) if snapshot_ref else None,
+        flow_snapshot_max_age_hours=float(max_age) if max_age is not None else None,
     )
 
 
+def _expand_groups(obj: Any) -> dict[str, Sequence[str]] | None:
+    if not isinstance(obj, dict):
+        return None
+    return {str(k): names_from_json(v) for k, v in obj.items() if isinstance(v, list)}
+
+
 def config_to_text_for_ui(cfg: JobConfig) -> str:
     """
     Convert config content back into multiline format for the UI text boxes.
@@ -100,11 +131,11 @@ def config_to_text_for_ui(cfg: JobConfig) -> str:
     if cfg.mode == "shots" and cfg.sequences:
         lines: list[str] = []
         for seq, shots in cfg.sequences.items():
-            lines.append(f"{seq}: {', '.join(shots)}")
+            lines.append(f"{seq}: {', '.join(name_tokens(shots))}")
         return "\n".join(lines).strip()
     if cfg.mode == "assets" and cfg.assets:
         lines = []
         for cat, items in cfg.assets.items():
-            lines.append(f"{cat}: {', '.join(items)}")
+            lines.append(f"{cat}: {', '.join(name_tokens(items))}")
         return "\n".join(lines).strip()
     return ""
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+from builder.core.job_config import JobConfig
+from builder.core.planner import plan_asset_build, plan_shot_build
+from builder.models import PlanAction
+from builder.util.name_ranges import NameList, name_tokens
+
+
+class JobDiffError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class JobDelta:
+    """
+    Names added and removed between two configs of the same project, per
+    sequence (shots mode) or category (assets mode). Removed names are only
+    reported; folders are never deleted.
+    """
+    mode: str
+    added: dict[str, list[str]]
+    removed: dict[str, list[str]]
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.added
+
+    def pretty(self) -> str:
+        unit = "shot(s)" if self.mode == "shots" else "asset(s)"
+        added = sum(len(v) for v in self.added.values())
+        removed = sum(len(v) for v in self.removed.values())
+        line = f"Delta: +{added} {unit} in {len(self.added)} group(s)"
+        if removed:
+            line += f", {removed} removed from the config (folders kept)"
+        return line
+
+
+def diff_job_configs(old: JobConfig, new: JobConfig) -> JobDelta:
+    """
+    Raises JobDiffError unless both configs target the same project,
+    template and mode. Groups whose token lists are unchanged are skipped
+    without expanding their ranges, so the cost follows the edited groups.
+    """
+    for key in ("root", "project", "template_id", "mode"):
+        a, b = getattr(old, key), getattr(new, key)
+        if key == "root":
+            # "D:/shows" and "D:/shows/" are the same root
+            a, b = Path(a).as_posix(), Path(b).as_posix()
+        if a != b:
+            raise JobDiffError(f"configs differ in {key} ({a!r} vs {b!r}); build the new config in full instead")
+
+    groups_old = _groups(old)
+    groups_new = _groups(new)
+    return JobDelta(
+        mode=new.mode,
+        added=_missing(groups_new, groups_old),
+        removed=_missing(groups_old, groups_new),
+    )
+
+
+def plan_delta(config: JobConfig, template_raw: dict[str, Any], delta: JobDelta) -> list[PlanAction]:
+    """
+    Plans only the added names with the regular planner. Project-level
+    folders are included (they are cheap and usually skipped as existing).
+    """
+    if delta.is_empty:
+        return []
+    root = Path(config.root)
+    if delta.mode == "shots":
+        return plan_shot_build(root, config.project, template_raw, delta.added)
+    return plan_asset_build(root, config.project, template_raw, delta.added)
+
+
+def _groups(config: JobConfig) -> dict[str, Sequence[str]]:
+    return dict((config.sequences if config.mode == "shots" else config.assets) or {})
+
+
+def _missing(ours: dict[str, Sequence[str]], theirs: dict[str, Sequence[str]]) -> dict[str, list[str]]:
+    out: dict[str, list[str]] = {}
+    for group, names in ours.items():
+        other = theirs.get(group)
+        if other is None:
+            missing = list(names)
+        elif name_tokens(names) == name_tokens(other):
+            continue
+        else:
+            lookup = other if isinstance(other, NameList) else set(other)  # NameList lookups stay compact
+            missing = [n for n in names if n not in lookup]
+        if missing:
+            out[group] = missing
+    return out
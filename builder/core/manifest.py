@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+import os
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 from builder.core.builder import BuildResult
+from builder.util.name_ranges import json_default
+from builder.util.tracing import span
 
 
 @dataclass(frozen=True)
@@ -21,8 +24,8 @@ class ManifestRecord:
     overwrite: bool
 
     mode: str  # "shots" or "assets"
-    sequences: dict[str, list[str]] | None
-    assets: dict[str, list[str]] | None
+    sequences: dict[str, Sequence[str]] | None
+    assets: dict[str, Sequence[str]] | None
 
     results: dict[str, int]
     actions: list[dict[str, Any]]
@@ -53,8 +56,8 @@ def build_manifest(
     template_version: str,
     template_raw: dict[str, Any],
     mode: str,
-    sequences: dict[str, list[str]] | None,
-    assets: dict[str, list[str]] | None,
+    sequences: dict[str, Sequence[str]] | None,
+    assets: dict[str, Sequence[str]] | None,
     result: BuildResult,
 ) -> ManifestRecord:
     manifest_path = determine_manifest_path(project_root, template_raw)
@@ -86,6 +89,9 @@ def build_manifest(
             "created_files": result.created_files,
             "skipped": result.skipped,
             "errors": result.errors,
+            # a cancelled build lists only the actions that ran
+            "cancelled": int(result.cancelled),
+            "pending": result.pending,
         },
         actions=actions_out,
         manifest_path=manifest_path.as_posix(),
@@ -94,7 +100,102 @@ def build_manifest(
 
 def write_manifest(rec: ManifestRecord) -> Path:
     path = Path(rec.manifest_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    with span("manifest.write", actions=len(rec.actions)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = asdict(rec)
+        path.write_text(json.dumps(payload, indent=2, default=json_default), encoding="utf-8")
+    return path
+
+
+def delta_path(manifest_path: Path) -> Path:
+    return manifest_path.with_name(f"{manifest_path.stem}.deltas.jsonl")
+
+
+def update_manifest(rec: ManifestRecord) -> Path:
+    """
+    Records an incremental rebuild without rewriting the manifest: rec's own
+    actions and results are appended as one line to the delta sidecar
+    (manifest.deltas.jsonl), so the cost follows the size of the change.
+    Once the sidecar outgrows the manifest it is folded in (one full rewrite,
+    amortized over the appends). Falls back to a plain write if there is no
+    manifest yet. Use read_manifest() to see the merged result.
+    """
+    path = Path(rec.manifest_path)
+    if not path.is_file():
+        return write_manifest(rec)
+
     payload = asdict(rec)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    del payload["manifest_path"]
+    deltas = delta_path(path)
+    with span("manifest.append", actions=len(rec.actions)):
+        with deltas.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(payload, separators=(",", ":"), default=json_default) + "\n")
+
+    if deltas.stat().st_size > path.stat().st_size:
+        try:
+            compact_manifest(path)
+        except (OSError, ValueError):
+            pass  # unreadable manifest: keep the sidecar, the next update tries again
     return path
+
+
+def read_manifest(path: Path) -> dict[str, Any]:
+    """
+    The manifest with its delta sidecar applied: actions are keyed by path
+    and the newer outcome wins, except that a "skipped" never hides an
+    earlier "created". Config fields come from the newest delta and the
+    results are recounted from the merged actions. Actions without a path
+    and unreadable delta lines are ignored.
+    """
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(manifest, dict):
+        raise ValueError(f"Not a manifest: {path}")
+
+    merged: dict[str, dict[str, Any]] = {}
+    _merge_actions(merged, manifest.get("actions"))
+
+    deltas = delta_path(path)
+    if deltas.is_file():
+        with deltas.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    delta = json.loads(line)
+                except ValueError:
+                    continue  # e.g. a line cut short by a crash
+                if not isinstance(delta, dict):
+                    continue
+                _merge_actions(merged, delta.pop("actions", None))
+                manifest.update(delta)
+
+    actions = list(merged.values())
+    results = dict(manifest.get("results") or {})
+    results["created_dirs"] = sum(1 for a in actions if a.get("status") == "created" and a.get("type") == "dir")
+    results["created_files"] = sum(1 for a in actions if a.get("status") == "created" and a.get("type") != "dir")
+    results["skipped"] = sum(1 for a in actions if a.get("status") == "skipped")
+    results["errors"] = sum(1 for a in actions if a.get("status") == "error")
+    manifest.update(actions=actions, results=results, manifest_path=path.as_posix())
+    return manifest
+
+
+def compact_manifest(path: Path) -> Path:
+    """
+    Folds the delta sidecar into the manifest and removes it.
+    """
+    with span("manifest.compact"):
+        merged = read_manifest(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        # a crash before this unlink re-applies the deltas: merging is idempotent
+        delta_path(path).unlink(missing_ok=True)
+    return path
+
+
+def _merge_actions(merged: dict[str, dict[str, Any]], actions: Any) -> None:
+    for action in actions if isinstance(actions, list) else ():
+        if not isinstance(action, dict) or not isinstance(action.get("path"), str):
+            continue
+        old = merged.get(action["path"])
+        if old is not None and old.get("status") == "created" and action.get("status") == "skipped":
+            continue
+        merged[action["path"]] = action
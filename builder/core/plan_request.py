@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from builder.core.plan_tree import PlanTree
+from builder.core.planner import plan_asset_build, plan_shot_build
+from builder.models import PlanAction
+from builder.util.name_ranges import RangeTooLargeError
+from builder.util.parse_assets import parse_assets
+from builder.util.parse_input import parse_sequences_and_shots
+from builder.util.tracing import span
+
+
+# largest number of shots/assets a single request may expand to
+MAX_NAMES = 1_000_000
+
+
+class PlanInputError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PlanRequest:
+    """
+    Everything needed to plan, captured from the UI so planning can run off
+    the GUI thread (parsing included).
+    """
+    root: Path
+    project: str
+    template_raw: dict[str, Any]
+    mode: str  # "shots" | "assets"
+    text: str  # Seq/Shots or Assets box contents
+    # already parsed input (job config, shot list file); text is then ignored
+    groups: dict[str, Sequence[str]] | None = None
+
+
+@dataclass(frozen=True)
+class PlanResponse:
+    request: PlanRequest
+    plan: list[PlanAction]
+    tree: PlanTree
+    sequences: dict[str, Sequence[str]] | None
+    assets: dict[str, Sequence[str]] | None
+
+    @property
+    def project_root(self) -> Path:
+        return self.request.root / self.request.project
+
+    def summary(self) -> str:
+        if self.sequences is not None:
+            shots = sum(len(v) for v in self.sequences.values())
+            return f"Sequences: {len(self.sequences)} | Shots: {shots}"
+        assets = self.assets or {}
+        return f"Categories: {len(assets)} | Assets: {sum(len(v) for v in assets.values())}"
+
+
+def run_plan_request(req: PlanRequest, should_cancel: Callable[[], bool] | None = None) -> PlanResponse:
+    """
+    Parses the input box (unless req.groups is set) and plans. Raises
+    PlanInputError for empty or oversized input and PlanCancelled (from the
+    planner) when should_cancel fires.
+    """
+    groups = req.groups
+    if groups is None and req.mode == "shots":
+        with span("parse.shots", chars=len(req.text)):
+            groups = _parse(parse_sequences_and_shots, req.text).sequences
+    elif groups is None:
+        with span("parse.assets", chars=len(req.text)):
+            groups = _parse(parse_assets, req.text).assets
+
+    plan = plan_groups(req.root, req.project, req.template_raw, req.mode, groups, should_cancel)
+    tree = PlanTree(plan, req.root / req.project)
+    if req.mode == "shots":
+        return PlanResponse(req, plan, tree, groups, None)
+    return PlanResponse(req, plan, tree, None, groups)
+
+
+def plan_groups(
+    root: Path,
+    project: str,
+    template_raw: dict[str, Any],
+    mode: str,
+    groups: dict[str, Sequence[str]] | None,
+    should_cancel: Callable[[], bool] | None = None,
+) -> list[PlanAction]:
+    """
+    Plans parsed sequences/shots or categories/assets, with the same input
+    checks as run_plan_request() but no parsing and no PlanTree.
+    """
+    if mode == "shots":
+        if not groups:
+            raise PlanInputError("Seq/Shots input is required (at least one sequence with shots).")
+        _check_size(groups, "shots")
+        return plan_shot_build(root, project, template_raw, groups, should_cancel=should_cancel)
+
+    if not groups:
+        raise PlanInputError("Assets input is required (at least one category with assets).")
+    _check_size(groups, "assets")
+    return plan_asset_build(root, project, template_raw, groups, should_cancel=should_cancel)
+
+
+def _parse(parser: Callable[[str], Any], text: str) -> Any:
+    try:
+        return parser(text)
+    except RangeTooLargeError as exc:
+        raise PlanInputError(str(exc)) from exc
+
+
+def _check_size(groups: dict[str, Sequence[str]], unit: str) -> None:
+    total = sum(len(v) for v in groups.values())
+    if total > MAX_NAMES:
+        raise PlanInputError(f"input expands to {total:,} {unit} (limit {MAX_NAMES:,})")
+
+
+class PlanGenerations:
+    """
+    Monotonic request counter: only the newest generation is current, and
+    every older request sees its cancel check turn True.
+    """
+
+    def __init__(self) -> None:
+        self._current = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> int:
+        return self._current
+
+    def bump(self) -> int:
+        with self._lock:
+            self._current += 1
+            return self._current
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._current
+
+    def canceller(self, generation: int) -> Callable[[], bool]:
+        return lambda: generation != self._current
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Sequence
+
+from builder.models import PlanAction
+
+ROOT = -1  # parent id of top-level nodes
+
+
+class PlanTree:
+    """
+    Parent/child index over a flat plan, for tree views.
+
+    Nodes are plan indices. A node's parent is its nearest ancestor folder
+    that is also in the plan; everything else is top-level. Building the
+    index is one pass over the plan; nothing is copied per node.
+    """
+
+    def __init__(self, actions: Sequence[PlanAction], base: Path | None = None) -> None:
+        self.actions = actions
+        self._base = base.as_posix().rstrip("/") + "/" if base is not None else ""
+        self._parent: list[int] = [ROOT] * len(actions)
+        self._children: dict[int, list[int]] = {}
+        self._lower: list[str] | None = None
+
+        # string keys: hashing/walking Path objects is several times slower
+        self._paths = [a.path.as_posix() for a in actions]
+        index = {p: i for i, p in enumerate(self._paths)}
+        for i, path in enumerate(self._paths):
+            parent = ROOT
+            cut = path.rfind("/")
+            while cut > 0:
+                j = index.get(path[:cut])
+                if j is not None:
+                    parent = j
+                    break
+                cut = path.rfind("/", 0, cut)
+            self._parent[i] = parent
+            self._children.setdefault(parent, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def parent(self, node: int) -> int:
+        return self._parent[node]
+
+    def children(self, node: int = ROOT) -> list[int]:
+        return self._children.get(node, [])
+
+    def label(self, node: int) -> str:
+        """
+        Path relative to the parent node (relative to base for top-level nodes).
+        """
+        path = self._paths[node]
+        parent = self._parent[node]
+        if parent == ROOT:
+            return path[len(self._base):] if self._base and path.startswith(self._base) else path
+        return path[len(self._paths[parent]) + 1:]
+
+    def filter(self, text: str) -> set[int] | None:
+        """
+        Nodes to show for a filter string, or None for "show everything".
+
+        Whitespace-separated terms must all appear in a node's path
+        (case-insensitive), e.g. "SQ010 SH0020" or "comp/work". Matching
+        nodes keep their ancestors visible so the tree stays navigable.
+        """
+        terms = [t for t in text.lower().split() if t]
+        if not terms:
+            return None
+        if self._lower is None:
+            self._lower = [p.lower() for p in self._paths]
+
+        visible: set[int] = set()
+        for i, path in enumerate(self._lower):
+            if all(t in path for t in terms):
+                node = i
+                while node != ROOT and node not in visible:
+                    visible.add(node)
+                    node = self._parent[node]
+        return visible
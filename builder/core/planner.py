@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Iterable, Tuple
+from typing import Any, Callable, Iterable, Sequence, Tuple
 
 from builder.models import PlanAction, PlanActionType
 from builder.core.template_schema import is_starter_file
+from builder.util.tracing import span
+
+
+class PlanCancelled(Exception):
+    """
+    Raised when a planner's should_cancel hook returns True (the request was superseded).
+    """
 
 
 # ---------------- SHOTS MODE ----------------
@@ -13,27 +20,36 @@ def plan_shot_build(
     root: Path,
     project: str,
     template_raw: dict[str, Any],
-    sequences: dict[str, list[str]],
+    sequences: dict[str, Sequence[str]],
+    should_cancel: Callable[[], bool] | None = None,
 ) -> list[PlanAction]:
-    project_root = root / project
-    actions: list[PlanAction] = []
+    """
+    Shot lists may be NameList objects with unexpanded ranges; they are
+    expanded here, one shot at a time, while the plan is generated.
+    should_cancel is polled once per shot; PlanCancelled aborts the plan.
+    """
+    with span("plan.shots", sequences=len(sequences)):
+        project_root = root / project
+        actions: list[PlanAction] = []
 
-    for name in template_raw.get("project_folders", []):
-        actions.append(PlanAction(PlanActionType.DIR, project_root / name))
+        for name in template_raw.get("project_folders", []):
+            actions.append(PlanAction(PlanActionType.DIR, project_root / name))
 
-    sequences_root = project_root / "sequences"
-    actions.append(PlanAction(PlanActionType.DIR, sequences_root))
+        sequences_root = project_root / "sequences"
+        actions.append(PlanAction(PlanActionType.DIR, sequences_root))
 
-    shot_tree = template_raw.get("shot_tree", {})
-    for seq, shots in sequences.items():
-        seq_root = sequences_root / seq
-        actions.append(PlanAction(PlanActionType.DIR, seq_root))
+        shot_tree = template_raw.get("shot_tree", {})
+        for seq, shots in sequences.items():
+            seq_root = sequences_root / seq
+            actions.append(PlanAction(PlanActionType.DIR, seq_root))
 
-        for shot in shots:
-            shot_root = seq_root / shot
-            actions.append(PlanAction(PlanActionType.DIR, shot_root))
-            actions.extend(_expand_tree(shot_root, shot_tree))
+            for shot in shots:
+                _check(should_cancel)
+                shot_root = seq_root / shot
+                actions.append(PlanAction(PlanActionType.DIR, shot_root))
+                actions.extend(_expand_tree(shot_root, shot_tree))
 
+    _check(should_cancel)
     return _dedupe_sorted(actions)
 
 
@@ -43,7 +59,8 @@ def plan_asset_build(
     root: Path,
     project: str,
     template_raw: dict[str, Any],
-    assets: dict[str, list[str]],
+    assets: dict[str, Sequence[str]],
+    should_cancel: Callable[[], bool] | None = None,
 ) -> list[PlanAction]:
     """
     Build plan:
@@ -51,55 +68,63 @@ def plan_asset_build(
     If template.asset_tree[category] is a list[str], those are subfolders under asset root.
     If it's a dict, it's treated like shot_tree (folder -> children list).
     """
-    project_root = root / project
-    actions: list[PlanAction] = []
-
-    for name in template_raw.get("project_folders", []):
-        actions.append(PlanAction(PlanActionType.DIR, project_root / name))
-
-    assets_root = project_root / "assets"
-    actions.append(PlanAction(PlanActionType.DIR, assets_root))
-
-    asset_tree = template_raw.get("asset_tree", {})
-
-    for cat, names in assets.items():
-        cat_root = assets_root / cat
-        actions.append(PlanAction(PlanActionType.DIR, cat_root))
-
-        # category spec in template
-        spec = asset_tree.get(cat)
-
-        for asset_name in names:
-            asset_root = cat_root / asset_name
-            actions.append(PlanAction(PlanActionType.DIR, asset_root))
-
-            if isinstance(spec, list):
-                # list of folders under asset_root
-                for item in spec:
-                    if not isinstance(item, str) or not item.strip():
-                        continue
-                    p = asset_root / item
-                    if is_starter_file(item):
-                        actions.append(PlanAction(PlanActionType.FILE, p))
-                    else:
-                        actions.append(PlanAction(PlanActionType.DIR, p))
-
-            elif isinstance(spec, dict):
-                # nested dict like shot_tree: { work:[...], publish:[...] }
-                actions.extend(_expand_tree(asset_root, spec))
-
-            else:
-                # fallback if category not in template: create minimal structure
-                actions.append(PlanAction(PlanActionType.DIR, asset_root / "work"))
-                actions.append(PlanAction(PlanActionType.DIR, asset_root / "publish"))
-                actions.append(PlanAction(PlanActionType.DIR, asset_root / "docs"))
-                actions.append(PlanAction(PlanActionType.FILE, asset_root / "docs" / "notes.md"))
-
+    with span("plan.assets", categories=len(assets)):
+        project_root = root / project
+        actions: list[PlanAction] = []
+
+        for name in template_raw.get("project_folders", []):
+            actions.append(PlanAction(PlanActionType.DIR, project_root / name))
+
+        assets_root = project_root / "assets"
+        actions.append(PlanAction(PlanActionType.DIR, assets_root))
+
+        asset_tree = template_raw.get("asset_tree", {})
+
+        for cat, names in assets.items():
+            cat_root = assets_root / cat
+            actions.append(PlanAction(PlanActionType.DIR, cat_root))
+
+            # category spec in template
+            spec = asset_tree.get(cat)
+
+            for asset_name in names:
+                _check(should_cancel)
+                asset_root = cat_root / asset_name
+                actions.append(PlanAction(PlanActionType.DIR, asset_root))
+
+                if isinstance(spec, list):
+                    # list of folders under asset_root
+                    for item in spec:
+                        if not isinstance(item, str) or not item.strip():
+                            continue
+                        p = asset_root / item
+                        if is_starter_file(item):
+                            actions.append(PlanAction(PlanActionType.FILE, p))
+                        else:
+                            actions.append(PlanAction(PlanActionType.DIR, p))
+
+                elif isinstance(spec, dict):
+                    # nested dict like shot_tree: { work:[...], publish:[...] }
+                    actions.extend(_expand_tree(asset_root, spec))
+
+                else:
+                    # fallback if category not in template: create minimal structure
+                    actions.append(PlanAction(PlanActionType.DIR, asset_root / "work"))
+                    actions.append(PlanAction(PlanActionType.DIR, asset_root / "publish"))
+                    actions.append(PlanAction(PlanActionType.DIR, asset_root / "docs"))
+                    actions.append(PlanAction(PlanActionType.FILE, asset_root / "docs" / "notes.md"))
+
+    _check(should_cancel)
     return _dedupe_sorted(actions)
 
 
 # ---------------- Shared helpers ----------------
 
+def _check(should_cancel: Callable[[], bool] | None) -> None:
+    if should_cancel is not None and should_cancel():
+        raise PlanCancelled()
+
+
 def _expand_tree(base: Path, tree: dict[str, Any]) -> list[PlanAction]:
     actions: list[PlanAction] = []
 
@@ -123,18 +148,19 @@ def _expand_tree(base: Path, tree: dict[str, Any]) -> list[PlanAction]:
 
 
 def _dedupe_sorted(actions: Iterable[PlanAction]) -> list[PlanAction]:
-    seen: set[tuple[str, str]] = set()
-    unique: list[PlanAction] = []
-    for a in actions:
-        key = (a.type.value, str(a.path))
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(a)
+    with span("plan.dedupe_sort"):
+        seen: set[tuple[str, str]] = set()
+        unique: list[PlanAction] = []
+        for a in actions:
+            key = (a.type.value, str(a.path))
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(a)
 
-    def sort_key(a: PlanAction) -> Tuple[str, int, str]:
-        t = 0 if a.type == PlanActionType.DIR else 1
-        return (str(a.path).lower(), t, a.type.value)
+        def sort_key(a: PlanAction) -> Tuple[str, int, str]:
+            t = 0 if a.type == PlanActionType.DIR else 1
+            return (str(a.path).lower(), t, a.type.value)
 
-    unique.sort(key=sort_key)
+        unique.sort(key=sort_key)
     return unique
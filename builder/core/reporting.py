@@ -4,6 +4,9 @@ from builder.core.builder import BuildResult
 
 
 def format_build_summary(result: BuildResult) -> str:
+    cancelled = (
+        f"  Cancelled:     {result.pending} action(s) not attempted\n" if result.cancelled else ""
+    )
     return (
         f"Build Summary:\n"
         f"  Created dirs:  {result.created_dirs}\n"
@@ -11,4 +14,5 @@ def format_build_summary(result: BuildResult) -> str:
         f"  Skipped:       {result.skipped}\n"
         f"  Errors:        {result.errors}\n"
         f"  Overwrite:     {'ON' if result.overwrite else 'OFF'}\n"
+        f"{cancelled}"
     )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from builder.core.template_loader import TemplateLoader
+from builder.core.template_schema import TemplateIssue
+
+
+@dataclass(frozen=True)
+class LibraryReport:
+    templates_dir: str
+    files: dict[str, list[TemplateIssue]]  # filename -> issues ([] = valid)
+    seconds: float
+    workers: int
+
+    @property
+    def valid_count(self) -> int:
+        return sum(1 for issues in self.files.values() if not issues)
+
+    @property
+    def invalid(self) -> dict[str, list[TemplateIssue]]:
+        return {name: issues for name, issues in self.files.items() if issues}
+
+    @property
+    def ok(self) -> bool:
+        return not self.invalid
+
+    def pretty(self) -> str:
+        lines = [
+            f"Template library: {self.templates_dir}",
+            f"  Files:   {len(self.files)}",
+            f"  Valid:   {self.valid_count}",
+            f"  Invalid: {len(self.invalid)}",
+            f"  Time:    {self.seconds:.2f}s ({self.workers} worker(s))",
+        ]
+        for name, issues in self.invalid.items():
+            lines.append("")
+            lines.append(name)
+            for issue in issues:
+                lines.append(f"  - {issue.pretty()}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "templates_dir": self.templates_dir,
+            "seconds": round(self.seconds, 4),
+            "workers": self.workers,
+            "valid": self.valid_count,
+            "invalid": len(self.invalid),
+            "files": {
+                name: [{"code": i.code, "message": i.message, "path": i.path} for i in issues]
+                for name, issues in self.files.items()
+            },
+        }
+
+
+def validate_library(
+    templates_dir: Path,
+    workers: int | None = None,
+    chunk_size: int = 64,
+) -> LibraryReport:
+    """
+    Validates every template in a folder and returns one aggregated report.
+
+    Files are parsed and validated in a process pool (chunked, so thousands of
+    small files don't pay one IPC round trip each). Templates using "extends"
+    are resolved in the worker too; each chunk reads a shared base once.
+    """
+    started = time.perf_counter()
+    loader = TemplateLoader(templates_dir)
+    paths = loader.discover()
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    folder = str(templates_dir)
+
+    results: list[tuple[str, list[TemplateIssue]]] = []
+    if workers == 1 or len(paths) <= chunk_size:
+        workers = 1
+        results = _validate_chunk((folder, [str(p) for p in paths]))
+    else:
+        chunks = [(folder, [str(p) for p in paths[i:i + chunk_size]]) for i in range(0, len(paths), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            for part in pool.map(_validate_chunk, chunks):
+                results.extend(part)
+
+    files = {Path(path_str).name: issues for path_str, issues in results}
+
+    return LibraryReport(
+        templates_dir=templates_dir.as_posix(),
+        files=files,
+        seconds=time.perf_counter() - started,
+        workers=workers,
+    )
+
+
+def _validate_chunk(arg: tuple[str, list[str]]) -> list[tuple[str, list[TemplateIssue]]]:
+    """
+    Worker: returns (path, issues) per file, with "extends" resolved. The
+    loader is created per chunk, so bases are read fresh for every run.
+    """
+    templates_dir, paths = arg
+    loader = TemplateLoader(Path(templates_dir))
+    return [(path_str, loader.issues_for(Path(path_str))) for path_str in paths]
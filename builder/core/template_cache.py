@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from builder import __version__
+from builder.core.template_schema import TemplateIssue
+
+CACHE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    mtime_ns: int
+    size: int
+    sha256: str
+    data: dict[str, Any] | None          # parsed template (None if it failed to load)
+    issues: list[TemplateIssue]          # validation issues for this file
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+class TemplateCache:
+    """
+    Persistent per-file cache of parsed + validated templates.
+
+    Entries are keyed by absolute path and checked against (mtime, size) first;
+    if the stat changed but the content hash did not, the entry is reused too.
+    Pass path=None for an in-memory cache (nothing is written to disk).
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: dict[str, CacheEntry] = {}
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---------------- Lookup ----------------
+
+    def get(self, path: Path, st: os.stat_result) -> CacheEntry | None:
+        entry = self._entries.get(_key(path))
+        if entry and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return entry
+        return None
+
+    def get_by_hash(self, path: Path, st: os.stat_result, digest: str) -> CacheEntry | None:
+        """
+        Content-hash fallback: the file was touched (or copied) but not changed.
+        Refreshes the stored stat so the next lookup hits the fast path.
+        """
+        entry = self._entries.get(_key(path))
+        if not entry or entry.sha256 != digest:
+            return None
+        entry = CacheEntry(st.st_mtime_ns, st.st_size, digest, entry.data, entry.issues)
+        self._entries[_key(path)] = entry
+        self._dirty = True
+        return entry
+
+    def put(
+        self,
+        path: Path,
+        st: os.stat_result,
+        digest: str,
+        data: dict[str, Any] | None,
+        issues: list[TemplateIssue],
+    ) -> CacheEntry:
+        entry = CacheEntry(st.st_mtime_ns, st.st_size, digest, data, list(issues))
+        self._entries[_key(path)] = entry
+        self._dirty = True
+        return entry
+
+    def prune(self, directory: Path, keep: Iterable[Path]) -> None:
+        """
+        Drops entries for files in `directory` that no longer exist.
+        Entries belonging to other template folders are left alone.
+        """
+        folder = _key(directory)
+        alive = {_key(p) for p in keep}
+        stale = [k for k in self._entries if os.path.dirname(k) == folder and k not in alive]
+        for k in stale:
+            del self._entries[k]
+        if stale:
+            self._dirty = True
+
+    # ---------------- Persistence ----------------
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+
+        payload = {
+            "format": CACHE_FORMAT,
+            "tool_version": __version__,
+            "entries": {k: _entry_to_json(e) for k, e in self._entries.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # Cache is best-effort; a read-only profile must not break loading.
+            return
+        self._dirty = False
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            obj = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        # Validation rules may change between releases; start fresh if so.
+        if not isinstance(obj, dict) or obj.get("format") != CACHE_FORMAT or obj.get("tool_version") != __version__:
+            return
+
+        entries = obj.get("entries")
+        if not isinstance(entries, dict):
+            return
+        for k, v in entries.items():
+            try:
+                self._entries[k] = _entry_from_json(v)
+            except (KeyError, TypeError, ValueError):
+                continue
+
+
+def _key(path: Path) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _entry_to_json(e: CacheEntry) -> dict[str, Any]:
+    return {
+        "mtime_ns": e.mtime_ns,
+        "size": e.size,
+        "sha256": e.sha256,
+        "data": e.data,
+        "issues": [{"code": i.code, "message": i.message, "path": i.path} for i in e.issues],
+    }
+
+
+def _entry_from_json(obj: dict[str, Any]) -> CacheEntry:
+    return CacheEntry(
+        mtime_ns=int(obj["mtime_ns"]),
+        size=int(obj["size"]),
+        sha256=str(obj["sha256"]),
+        data=obj["data"] if isinstance(obj["data"], dict) else None,
+        issues=[TemplateIssue(str(i["code"]), str(i["message"]), i.get("path")) for i in obj["issues"]],
+    )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+EXTENDS_KEY = "extends"
+
+# Prefix on a tree key that appends to the base entry instead of replacing it.
+EXTEND_PREFIX = "+"
+
+
+def merge_template(base: dict[str, Any], child: dict[str, Any]) -> dict[str, Any]:
+    """
+    Applies a child template on top of its (already resolved) base.
+
+      - name/version/other scalars: always taken from the child
+      - project_folders: base folders followed by the child's new ones
+      - shot_tree / asset_tree: child keys replace base keys;
+        "+key" appends to the base entry (list items or nested dict keys)
+    """
+    out: dict[str, Any] = {k: v for k, v in base.items() if k not in ("name", "version", EXTENDS_KEY)}
+    out.update({k: v for k, v in child.items() if k not in ("project_folders", "shot_tree", "asset_tree")})
+
+    base_folders = base.get("project_folders", [])
+    child_folders = child.get("project_folders", [])
+    if isinstance(base_folders, list) and isinstance(child_folders, list):
+        out["project_folders"] = base_folders + [f for f in child_folders if f not in base_folders]
+    elif "project_folders" in child:
+        out["project_folders"] = child_folders
+
+    for key in ("shot_tree", "asset_tree"):
+        if key in child:
+            out[key] = _merge_tree(base.get(key), child[key])
+
+    return out
+
+
+def _merge_tree(base: Any, child: Any) -> Any:
+    if not isinstance(child, dict):
+        return child
+    # no dict to extend: "+key" entries append onto nothing (prefix dropped)
+    merged = dict(base) if isinstance(base, dict) else {}
+    for k, v in child.items():
+        if isinstance(k, str) and k.startswith(EXTEND_PREFIX):
+            name = k[len(EXTEND_PREFIX):]
+            merged[name] = _extend_value(merged.get(name), v)
+        else:
+            # a replaced entry has no base either
+            merged[k] = _merge_tree(None, v)
+    return merged
+
+
+def _extend_value(base: Any, extra: Any) -> Any:
+    if isinstance(base, list) and isinstance(extra, list):
+        return base + [x for x in extra if x not in base]
+    if isinstance(extra, dict):
+        return _merge_tree(base, extra)
+    # nothing to extend (or mismatched types): behave like a plain override
+    return extra
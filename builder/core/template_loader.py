@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from builder.core.template_cache import TemplateCache, content_hash
+from builder.core.template_inherit import EXTENDS_KEY, merge_template
 from builder.core.template_schema import TemplateIssue, validate_template
+from builder.core.template_watcher import TemplateChanges
+from builder.util.tracing import span
+
+# Header scan reads only this much of each file while discovering templates.
+HEADER_BYTES = 4096
+
+_HEADER_FIELD = re.compile(rb'"(name|version)"\s*:\s*("(?:[^"\\]|\\.)*")')
 
 
 @dataclass(frozen=True)
@@ -17,60 +27,335 @@ class TemplateInfo:
     raw: dict[str, Any]       # full loaded json
 
 
+@dataclass(frozen=True)
+class TemplateHandle:
+    """
+    Lightweight discovery result: enough for the template dropdown.
+    The full template is parsed and validated by TemplateLoader.load().
+    """
+    template_id: str
+    name: str
+    version: str
+    path: Path
+
+
 @dataclass(frozen=True)
 class TemplateLoadResult:
     templates: list[TemplateInfo]
     problems: dict[str, list[TemplateIssue]]  # filename -> issues
+    cached: int = 0                           # files served from the template cache
+
+
+class TemplateLoadError(ValueError):
+    def __init__(self, file_key: str, issues: list[TemplateIssue]) -> None:
+        super().__init__(f"{file_key}: " + "; ".join(i.pretty() for i in issues))
+        self.file_key = file_key
+        self.issues = issues
 
 
 class TemplateLoader:
-    def __init__(self, templates_dir: Path):
+    def __init__(self, templates_dir: Path, cache: TemplateCache | None = None):
         self.templates_dir = templates_dir
+        self.cache = cache
+        # memoized full loads (phase 2), keyed by template file path
+        self._loaded: dict[Path, TemplateInfo] = {}
+        self._problems: dict[Path, list[TemplateIssue]] = {}
+        # inheritance graph: resolved raw dicts and base -> children edges
+        self._files: dict[Path, tuple[dict[str, Any] | None, list[TemplateIssue], bool]] = {}
+        self._resolved: dict[Path, dict[str, Any]] = {}
+        self._dependents: dict[Path, set[Path]] = {}
+
+    # ---------------- Phase 1: discovery ----------------
 
     def discover(self) -> list[Path]:
         if not self.templates_dir.exists():
             return []
         return sorted(self.templates_dir.glob("*.json"))
 
+    def scan(self) -> list[TemplateHandle]:
+        """
+        Discovers templates reading only name/version from each file header.
+        Nothing is validated here; broken files show up when first loaded.
+        """
+        paths = self.discover()
+        handles = [self._read_header(path) for path in paths]
+        handles.sort(key=lambda h: (h.name.lower(), h.template_id.lower()))
+
+        if self.cache is not None:
+            self.cache.prune(self.templates_dir, paths)
+            self.cache.save()
+        return handles
+
+    def refresh(self, handles: list[TemplateHandle], changes: TemplateChanges) -> list[TemplateHandle]:
+        """
+        Applies watcher changes to a previously scanned handle list.
+        Only added/changed files have their header re-read; memoized loads are
+        dropped just for the touched files and templates extending them.
+        """
+        for path in changes.added + changes.changed + changes.removed:
+            self.invalidate(path)
+
+        stale = set(changes.added) | set(changes.changed) | set(changes.removed)
+        updated = [h for h in handles if h.path not in stale]
+        updated.extend(self._read_header(p) for p in changes.added + changes.changed)
+        updated.sort(key=lambda h: (h.name.lower(), h.template_id.lower()))
+        return updated
+
+    def _read_header(self, path: Path) -> TemplateHandle:
+        fields: dict[str, str] = {}
+
+        if self.cache is not None:
+            try:
+                entry = self.cache.get(path, path.stat())
+            except OSError:
+                entry = None
+            if entry is not None and entry.data is not None:
+                fields = {k: str(entry.data.get(k, "")) for k in ("name", "version")}
+
+        if not fields:
+            try:
+                with path.open("rb") as fh:
+                    head = fh.read(HEADER_BYTES)
+                for m in _HEADER_FIELD.finditer(head):
+                    fields.setdefault(m.group(1).decode("ascii"), str(json.loads(m.group(2))))
+            except (OSError, ValueError):
+                pass
+
+        return TemplateHandle(
+            template_id=path.stem,
+            name=fields.get("name") or path.stem,
+            version=fields.get("version") or "?",
+            path=path,
+        )
+
+    # ---------------- Phase 2: full load (memoized) ----------------
+
+    def load(self, handle: TemplateHandle) -> TemplateInfo:
+        """
+        Parses and validates one template on first use; later calls are memoized.
+        Raises TemplateLoadError with the validation issues if it is invalid.
+        """
+        path = handle.path
+        if path in self._loaded:
+            return self._loaded[path]
+        if path in self._problems:
+            raise TemplateLoadError(path.name, self._problems[path])
+
+        with span("template.load", template=handle.template_id):
+            data, issues, _ = self._load_resolved(path)
+            if self.cache is not None:
+                self.cache.save()
+
+        if data is None or issues:
+            self._problems[path] = issues
+            raise TemplateLoadError(path.name, issues)
+
+        info = self._make_info(path, data)
+        self._loaded[path] = info
+        return info
+
+    def problems(self) -> dict[str, list[TemplateIssue]]:
+        """
+        Issues for every template that failed to load so far (filename -> issues).
+        """
+        return {p.name: issues for p, issues in sorted(self._problems.items())}
+
+    def issues_for(self, path: Path) -> list[TemplateIssue]:
+        """
+        Validation issues of one template file, after resolving "extends".
+        """
+        _, issues, _ = self._load_resolved(path)
+        return issues
+
+    def is_memoized(self, path: Path) -> bool:
+        return path in self._loaded or path in self._problems
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """
+        Forgets memoized loads (all of them, or one file plus every template
+        that extends it, directly or indirectly).
+        """
+        if path is None:
+            self._loaded.clear()
+            self._problems.clear()
+            self._files.clear()
+            self._resolved.clear()
+            self._dependents.clear()
+            return
+
+        pending = [path]
+        while pending:
+            p = pending.pop()
+            self._loaded.pop(p, None)
+            self._problems.pop(p, None)
+            self._files.pop(p, None)
+            self._resolved.pop(p, None)
+            pending.extend(self._dependents.pop(p, ()))
+
+    # ---------------- Eager load ----------------
+
     def load_all(self) -> TemplateLoadResult:
         templates: list[TemplateInfo] = []
         problems: dict[str, list[TemplateIssue]] = {}
+        cached = 0
+        self.invalidate()
 
-        for path in self.discover():
+        paths = self.discover()
+        for path in paths:
             file_key = path.name
-            try:
-                data = self._read_json(path)
-            except Exception as exc:
-                problems[file_key] = [TemplateIssue("LOAD_FAIL", str(exc))]
-                continue
+            data, issues, from_cache = self._load_resolved(path)
+            cached += int(from_cache)
 
-            issues = validate_template(data)
-            if issues:
+            if data is None or issues:
                 problems[file_key] = issues
+                self._problems[path] = issues
                 continue
 
-            template_id = path.stem
-            templates.append(
-                TemplateInfo(
-                    template_id=template_id,
-                    name=str(data["name"]),
-                    version=str(data["version"]),
-                    path=path,
-                    raw=data,
-                )
-            )
+            info = self._make_info(path, data)
+            self._loaded[path] = info
+            templates.append(info)
+
+        if self.cache is not None:
+            self.cache.prune(self.templates_dir, paths)
+            self.cache.save()
 
         # Sort templates by display name for nicer UX
         templates.sort(key=lambda t: (t.name.lower(), t.template_id.lower()))
-        return TemplateLoadResult(templates=templates, problems=problems)
+        return TemplateLoadResult(templates=templates, problems=problems, cached=cached)
+
+    def _make_info(self, path: Path, data: dict[str, Any]) -> TemplateInfo:
+        return TemplateInfo(
+            template_id=path.stem,
+            name=str(data["name"]),
+            version=str(data["version"]),
+            path=path,
+            raw=data,
+        )
+
+    # ---------------- Inheritance ----------------
+
+    def _load_resolved(self, path: Path) -> tuple[dict[str, Any] | None, list[TemplateIssue], bool]:
+        """
+        Like _load_file(), but templates with "extends" are merged onto their
+        base first and the merged result is what gets validated.
+        """
+        data, issues, from_cache = self._load_file(path)
+        if data is None or issues or EXTENDS_KEY not in data:
+            return data, issues, from_cache
 
-    def _read_json(self, path: Path) -> dict[str, Any]:
-        text = path.read_text(encoding="utf-8")
         try:
-            obj = json.loads(text)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON (line {e.lineno}, col {e.colno})") from e
+            resolved = self._resolve(path, ())
+        except TemplateLoadError as exc:
+            return None, exc.issues, from_cache
+        return resolved, validate_template(resolved), from_cache
+
+    def _resolve(self, path: Path, chain: tuple[Path, ...]) -> dict[str, Any]:
+        """
+        Memoized, cycle-checked resolution of the inheritance chain. Each base
+        is merged once per reload however many templates extend it.
+        """
+        if path in self._resolved:
+            return self._resolved[path]
+
+        data, issues, _ = self._load_file(path)
+        if data is None:
+            raise TemplateLoadError(path.name, issues)
+
+        base_id = data.get(EXTENDS_KEY)
+        if base_id is None:
+            resolved = data
+        else:
+            if not isinstance(base_id, str) or not base_id.strip():
+                raise TemplateLoadError(
+                    path.name, [TemplateIssue("BAD_TYPE", "'extends' must be a template id string", EXTENDS_KEY)]
+                )
+
+            base_path = self.templates_dir / f"{base_id.strip()}.json"
+            # register the edge first so adding a missing base later invalidates us
+            self._dependents.setdefault(base_path, set()).add(path)
+
+            if base_path == path or base_path in chain:
+                cycle = " -> ".join(p.stem for p in chain + (path, base_path))
+                raise TemplateLoadError(
+                    path.name, [TemplateIssue("EXTENDS_CYCLE", f"Inheritance cycle: {cycle}", EXTENDS_KEY)]
+                )
+            if not base_path.is_file():
+                raise TemplateLoadError(
+                    path.name, [TemplateIssue("EXTENDS_MISSING", f"Base template '{base_id}' not found", EXTENDS_KEY)]
+                )
+
+            try:
+                base = self._resolve(base_path, chain + (path,))
+            except TemplateLoadError as exc:
+                if exc.issues and exc.issues[0].code == "EXTENDS_CYCLE":
+                    raise TemplateLoadError(path.name, exc.issues) from None
+                raise TemplateLoadError(
+                    path.name,
+                    [TemplateIssue("EXTENDS_BASE", f"Base template '{base_id}' could not be loaded: {exc}", EXTENDS_KEY)],
+                ) from None
+            resolved = merge_template(base, data)
+
+        self._resolved[path] = resolved
+        return resolved
+
+    def _load_file(self, path: Path) -> tuple[dict[str, Any] | None, list[TemplateIssue], bool]:
+        # a file is read at most once per reload, whether as a template or as a base
+        if path not in self._files:
+            self._files[path] = self._read_file(path)
+        return self._files[path]
+
+    def _read_file(self, path: Path) -> tuple[dict[str, Any] | None, list[TemplateIssue], bool]:
+        """
+        Returns (data, issues, from_cache). Only files whose stat and content
+        hash both changed are parsed and validated again. Templates that extend
+        another one are not validated here (see _load_resolved).
+        """
+        if self.cache is None:
+            try:
+                data = self._read_json(path)
+            except Exception as exc:
+                return None, [TemplateIssue("LOAD_FAIL", str(exc))], False
+            return data, self._validate_own(data), False
+
+        try:
+            st = path.stat()
+            entry = self.cache.get(path, st)
+            if entry is not None:
+                return entry.data, entry.issues, True
+
+            raw = path.read_bytes()
+        except Exception as exc:
+            return None, [TemplateIssue("LOAD_FAIL", str(exc))], False
+
+        digest = content_hash(raw)
+        entry = self.cache.get_by_hash(path, st, digest)
+        if entry is not None:
+            return entry.data, entry.issues, True
+
+        try:
+            data = parse_template_json(raw.decode("utf-8"))
+        except Exception as exc:
+            issues = [TemplateIssue("LOAD_FAIL", str(exc))]
+            self.cache.put(path, st, digest, None, issues)
+            return None, issues, False
+
+        issues = self._validate_own(data)
+        self.cache.put(path, st, digest, data, issues)
+        return data, issues, False
+
+    def _validate_own(self, data: dict[str, Any]) -> list[TemplateIssue]:
+        return [] if EXTENDS_KEY in data else validate_template(data)
+
+    def _read_json(self, path: Path) -> dict[str, Any]:
+        return parse_template_json(path.read_text(encoding="utf-8"))
+
+
+def parse_template_json(text: str) -> dict[str, Any]:
+    try:
+        obj = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON (line {e.lineno}, col {e.colno})") from e
 
-        if not isinstance(obj, dict):
-            raise ValueError("Template root must be a JSON object")
-        return obj
+    if not isinstance(obj, dict):
+        raise ValueError("Template root must be a JSON object")
+    return obj
@@ -12,6 +12,8 @@ def format_template_preview(template_raw: dict[str, Any]) -> str:
     name = template_raw.get("name", "Unnamed Template")
     version = template_raw.get("version", "0.0")
     lines.append(f"{name} (v{version})")
+    if template_raw.get("extends"):
+        lines.append(f"Extends: {template_raw['extends']}")
     lines.append("-" * 40)
 
     pf = template_raw.get("project_folders", [])
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class TemplateChanges:
+    added: list[Path] = field(default_factory=list)
+    changed: list[Path] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+class TemplateWatcher:
+    """
+    Polling watcher for a templates folder (no external dependencies).
+
+    Each poll() lists the folder once and compares (mtime, size) per *.json file
+    against the previous snapshot. Cheap enough to run on a timer; the UI also
+    triggers it from QFileSystemWatcher where native notifications work.
+    """
+
+    def __init__(self, templates_dir: Path) -> None:
+        self.templates_dir = templates_dir
+        self._snapshot = self._take_snapshot() or {}
+
+    def reset(self) -> None:
+        self._snapshot = self._take_snapshot() or {}
+
+    def watched_files(self) -> list[Path]:
+        return sorted(self._snapshot)
+
+    def poll(self) -> TemplateChanges:
+        current = self._take_snapshot()
+        if current is None:
+            return TemplateChanges()
+        previous = self._snapshot
+        self._snapshot = current
+
+        added = sorted(p for p in current if p not in previous)
+        removed = sorted(p for p in previous if p not in current)
+        changed = sorted(p for p, sig in current.items() if p in previous and previous[p] != sig)
+        return TemplateChanges(added=added, changed=changed, removed=removed)
+
+    def _take_snapshot(self) -> dict[Path, tuple[int, int]] | None:
+        snap: dict[Path, tuple[int, int]] = {}
+        try:
+            with os.scandir(self.templates_dir) as it:
+                for entry in it:
+                    if not entry.name.lower().endswith(".json") or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    snap[self.templates_dir / entry.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            # folder unreachable (e.g. network share hiccup): keep the last known state
+            return None
+        return snap
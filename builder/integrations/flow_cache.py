@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from builder.core.flow_snapshot import FlowSnapshot
+
+if TYPE_CHECKING:
+    from builder.integrations.flow_client import FlowCredentials
+
+CACHE_FORMAT = 3
+UNASSIGNED = "UNASSIGNED"
+# asset types become category folders / "category: names" lines
+_CATEGORY_CHARS = re.compile(r"[^A-Za-z0-9_\-]+")
+
+
+@dataclass
+class ProjectCache:
+    """
+    Local copy of one Flow/PT project's sequences, shots and assets.
+    synced_at is the UTC time the last sync started (ISO string), or None.
+    filter_key identifies the server-side filter the data was fetched with.
+    """
+    project_id: int
+    synced_at: str | None = None
+    filter_key: str = ""
+    sequences: Dict[int, str] = field(default_factory=dict)             # id -> code
+    shots: Dict[int, Dict[str, Any]] = field(default_factory=dict)      # id -> {"code", "seq"}
+    assets: Dict[int, Dict[str, Any]] = field(default_factory=dict)     # id -> {"code", "type"}
+
+    @property
+    def is_empty(self) -> bool:
+        return self.synced_at is None
+
+    def reset(self, filter_key: str = "") -> None:
+        self.synced_at = None
+        self.filter_key = filter_key
+        self.sequences.clear()
+        self.shots.clear()
+        self.assets.clear()
+
+    def to_sequences(self) -> Dict[str, List[str]]:
+        # set per sequence: O(1) per shot (duplicate codes collapse)
+        groups: Dict[str, set[str]] = {}
+        for shot in self.shots.values():
+            code = shot.get("code") or ""
+            if not code:
+                continue
+            # If no sequence system, group under UNASSIGNED
+            seq_code = self.sequences.get(shot.get("seq")) or UNASSIGNED
+            groups.setdefault(seq_code, set()).add(code)
+
+        return {k: sorted(v) for k, v in groups.items()}
+
+    def to_snapshot(self, site: str) -> FlowSnapshot:
+        if self.synced_at is None:
+            raise ValueError("Nothing synced from Flow/PT yet; load from Flow/PT first.")
+        return FlowSnapshot(
+            created_at=self.synced_at,
+            site=site,
+            project_id=self.project_id,
+            sequences=self.to_sequences(),
+            assets=self.to_assets(),
+            filter_key=self.filter_key,
+        )
+
+    def to_assets(self) -> Dict[str, List[str]]:
+        groups: Dict[str, set[str]] = {}
+        for asset in self.assets.values():
+            code = asset.get("code") or ""
+            if code:
+                groups.setdefault(asset_category(asset.get("type")), set()).add(code)
+        return {k: sorted(v) for k, v in groups.items()}
+
+
+class FlowCache:
+    """
+    On-disk cache of ProjectCache files, one JSON file per site + project id.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        self.folder = folder
+
+    def path_for(self, creds: FlowCredentials) -> Path:
+        site = hashlib.sha1(creds.url.strip().lower().encode("utf-8")).hexdigest()[:10]
+        return self.folder / f"project_{creds.project_id}_{site}.json"
+
+    def load(self, creds: FlowCredentials) -> ProjectCache:
+        path = self.path_for(creds)
+        try:
+            obj = json.loads(path.read_text(encoding="utf-8"))
+            if obj.get("format") != CACHE_FORMAT or int(obj["project_id"]) != creds.project_id:
+                raise ValueError("stale cache format")
+            return ProjectCache(
+                project_id=creds.project_id,
+                synced_at=obj.get("synced_at"),
+                filter_key=str(obj.get("filter_key") or ""),
+                sequences={int(k): str(v) for k, v in obj["sequences"].items()},
+                shots={int(k): {"code": str(v["code"]), "seq": v.get("seq")} for k, v in obj["shots"].items()},
+                assets={int(k): {"code": str(v["code"]), "type": v.get("type")} for k, v in obj["assets"].items()},
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # missing or unreadable cache: start over with a full sync
+            return ProjectCache(project_id=creds.project_id)
+
+    def save(self, creds: FlowCredentials, cache: ProjectCache) -> Path:
+        path = self.path_for(creds)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": CACHE_FORMAT,
+            "project_id": cache.project_id,
+            "synced_at": cache.synced_at,
+            "filter_key": cache.filter_key,
+            "sequences": cache.sequences,
+            "shots": cache.shots,
+            "assets": cache.assets,
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+
+def asset_category(asset_type: Any) -> str:
+    name = _CATEGORY_CHARS.sub("_", str(asset_type or "").strip().lower()).strip("_")
+    return name or UNASSIGNED
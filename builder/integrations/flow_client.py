@@ -1,8 +1,30 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import json
+import math
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+from builder.integrations.flow_cache import ProjectCache
+from builder.integrations.flow_resilience import CircuitBreaker, RetryPolicy, breaker_for, is_retryable
+from builder.util.format_input import format_assets_text, format_seq_shots_text  # noqa: F401 (re-export)
+from builder.util.tracing import span
+
+if TYPE_CHECKING:
+    from builder.core.flow_snapshot import FlowSnapshot
+    from builder.integrations.flow_cache import FlowCache
+    from builder.integrations.flow_pool import FlowConnectionPool
+
+# Incremental syncs look back a little further than the last sync time to
+# tolerate clock skew between this machine and the Flow/PT server.
+SYNC_OVERLAP = timedelta(minutes=2)
 
 
 @dataclass(frozen=True)
@@ -13,82 +35,349 @@ class FlowCredentials:
     project_id: int
 
 
+@dataclass(frozen=True)
+class FlowQueryOptions:
+    """
+    What to ask the server for. An empty shot_statuses means "all shots".
+    """
+    shot_statuses: tuple[str, ...] = ()
+    status_field: str = "sg_status_list"
+
+    def cache_key(self) -> str:
+        # cached data is only valid for the filter it was fetched with
+        return f"{self.status_field}:{','.join(sorted(self.shot_statuses))}" if self.shot_statuses else ""
+
+
+@dataclass
+class FetchStats:
+    requests: int = 0
+    rows: int = 0
+    payload_bytes: int = 0   # JSON size of the returned rows (approximate wire payload)
+    seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, rows: list[dict[str, Any]]) -> None:
+        size = len(json.dumps(rows, default=str))
+        with self._lock:
+            self.requests += 1
+            self.rows += len(rows)
+            self.payload_bytes += size
+
+    def pretty(self) -> str:
+        return (
+            f"{self.rows} row(s) in {self.requests} request(s), "
+            f"{self.payload_bytes / 1024:.1f} KB, {self.seconds:.2f}s"
+        )
+
+
 class FlowClientError(RuntimeError):
     pass
 
 
+class FlowUnavailableError(FlowClientError):
+    """
+    Flow/PT could not be reached in time (retries exhausted, deadline hit or
+    circuit breaker open). Cached data is still a reasonable answer.
+    """
+
+
+class FlowTimeoutError(FlowUnavailableError):
+    pass
+
+
+@dataclass(frozen=True)
+class FlowQuery:
+    entity_type: str
+    filters: list[Any]
+    fields: list[str]
+    retired_only: bool = False  # retired lookups are small and fetched unpaged
+
+
 class FlowClient:
     """
     Thin wrapper around the ShotGrid (Flow/PT) Python API.
+
+    Large queries are fetched page by page on a bounded thread pool. Shotgun
+    connections are not thread-safe, so each request checks a connection out
+    of a FlowConnectionPool (process-wide by default) and returns it after;
+    new connections come from `connect` (defaults to shotgun_api3.Shotgun).
+
+    Each request gets `request_timeout` seconds (socket timeout) and is
+    retried per `retry` on network errors; a whole sync gives up after
+    `deadline` seconds. Repeated failures open the site's circuit breaker,
+    after which requests fail fast with FlowUnavailableError.
     """
 
-    def __init__(self, creds: FlowCredentials) -> None:
+    def __init__(
+        self,
+        creds: FlowCredentials,
+        connect: Callable[[], Any] | None = None,
+        page_size: int = 500,
+        max_workers: int = 4,
+        connections: FlowConnectionPool | None = None,
+        options: FlowQueryOptions | None = None,
+        request_timeout: float = 20.0,
+        deadline: float = 60.0,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        from builder.integrations.flow_pool import default_pool
+
         self.creds = creds
-        try:
-            from shotgun_api3 import Shotgun  # type: ignore
-        except Exception as exc:
-            raise FlowClientError(
-                "Flow/PT integration requires 'shotgun_api3'. Install it with: pip install shotgun_api3"
-            ) from exc
+        self.options = options or FlowQueryOptions()
+        self.last_stats = FetchStats()
+        self.page_size = page_size
+        self.deadline = deadline
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker if breaker is not None else breaker_for(creds)
+        self.stale_reason: str | None = None   # set when cached data was served instead
+        self._deadline_at = math.inf
+        self._rng = random.Random()
+        self._connect = connect or _shotgun_connector(creds, request_timeout)
+        self._connections = connections if connections is not None else default_pool()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="flow")
 
-        self._sg = Shotgun(creds.url, script_name=creds.script_name, api_key=creds.script_key)
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
 
-    def fetch_sequences_and_shots(self) -> Dict[str, List[str]]:
-        project = {"type": "Project", "id": self.creds.project_id}
+    def __enter__(self) -> "FlowClient":
+        return self
 
-        # Try to fetch sequences first
-        seq_fields = ["id", "code"]
-        seq_filters = [["project", "is", project]]
-        sequences = self._sg.find("Sequence", seq_filters, seq_fields) or []
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
-        seq_id_to_code: dict[int, str] = {}
-        for s in sequences:
-            sid = int(s["id"])
-            code = str(s.get("code") or "").strip()
-            if code:
-                seq_id_to_code[sid] = code
+    def fetch_sequences_and_shots(self, cache: FlowCache | None = None) -> Dict[str, List[str]]:
+        """
+        Without a cache every sequence/shot is downloaded. With one, only
+        entities changed since the last sync are fetched and folded into the
+        project's cache file, which is then saved.
+        """
+        return self._synced(cache).to_sequences()
+
+    def fetch_assets(self, cache: FlowCache | None = None) -> Dict[str, List[str]]:
+        """
+        Assets grouped by asset type (category -> names), the shape
+        plan_asset_build() takes. Fetched in the same round as shots.
+        """
+        return self._synced(cache).to_assets()
+
+    def snapshot(self, cache: FlowCache | None = None) -> FlowSnapshot:
+        """
+        Everything the builder needs from Flow/PT, for write_snapshot().
+        """
+        state = self._synced(cache)
+        if self.stale_reason:
+            raise FlowUnavailableError(f"Not exporting a snapshot of stale data: {self.stale_reason}")
+        return state.to_snapshot(self.creds.url)
+
+    def _synced(self, cache: FlowCache | None) -> ProjectCache:
+        state = cache.load(self.creds) if cache is not None else ProjectCache(self.creds.project_id)
+        self.stale_reason = None
+        try:
+            self.sync(state)
+        except FlowUnavailableError as exc:
+            if state.is_empty:
+                raise
+            # serve the last synced copy; the next call tries again
+            self.stale_reason = str(exc)
+            return state
+        if cache is not None:
+            cache.save(self.creds, state)
+        return state
+
+    def sync(self, state: ProjectCache) -> ProjectCache:
+        project = {"type": "Project", "id": self.creds.project_id}
+        opts = self.options
+        started = datetime.now(timezone.utc)
+        t0 = time.perf_counter()
+        self.last_stats = FetchStats()
+        self._deadline_at = time.monotonic() + self.deadline
 
-        # Always fetch shots (some studios don't use Sequence entity)
-        shot_fields = ["id", "code", "sg_sequence"]
-        shot_filters = [["project", "is", project]]
-        shots = self._sg.find("Shot", shot_filters, shot_fields) or []
+        if state.filter_key != opts.cache_key():
+            # cache was filled with another status filter: start over
+            state.reset(filter_key=opts.cache_key())
 
-        if not shots:
-            return {}
+        base_filters: list[Any] = [["project", "is", project]]
+        # minimal projection: id/type always come back; the linked code saves a
+        # separate Sequence query on full syncs
+        shot_fields = ["code", "sg_sequence", "sg_sequence.Sequence.code"]
+        asset_fields = ["code", "sg_asset_type"]
+        incremental = bool(state.synced_at)
 
-        out: Dict[str, List[str]] = {}
+        if incremental:
+            since = datetime.fromisoformat(state.synced_at) - SYNC_OVERLAP
+            changed = base_filters + [["updated_at", "greater_than", since]]
+            shot_filters = changed
+            if opts.shot_statuses:
+                # a shot may have changed *to* a filtered-out status: fetch its status, drop it below
+                shot_fields = shot_fields + [opts.status_field]
+        else:
+            changed = base_filters
+            shot_filters = base_filters
+            if opts.shot_statuses:
+                shot_filters = base_filters + [[opts.status_field, "in", list(opts.shot_statuses)]]
 
+        # Shots and assets go out in one concurrent round
+        # (always fetch shots: some studios don't use the Sequence entity)
+        queries = [
+            FlowQuery("Shot", shot_filters, shot_fields),
+            FlowQuery("Asset", changed, asset_fields),
+        ]
+        if incremental:
+            # renamed sequences don't touch their shots; deletions don't show up as updates
+            queries += [
+                FlowQuery("Sequence", changed, ["code"]),
+                FlowQuery("Sequence", base_filters, [], retired_only=True),
+                FlowQuery("Shot", base_filters, [], retired_only=True),
+                FlowQuery("Asset", base_filters, [], retired_only=True),
+            ]
+        with span("flow.fetch", queries=len(queries), incremental=incremental) as sp:
+            results = self._find_many(queries)
+            sp.set(rows=sum(len(r) for r in results))
+        shots, assets = results[0], results[1]
+
+        allowed = set(opts.shot_statuses)
         for sh in shots:
+            shot_id = int(sh["id"])
             code = str(sh.get("code") or "").strip()
-            if not code:
+            if not code or (allowed and opts.status_field in sh and sh[opts.status_field] not in allowed):
+                state.shots.pop(shot_id, None)
                 continue
 
+            # If sequence link exists, keep its id (resolved to a code when grouping)
             seq = sh.get("sg_sequence")
-            seq_code = None
-
-            # If sequence link exists and we have sequence codes
-            if isinstance(seq, dict) and seq.get("id"):
-                sid = int(seq["id"])
-                seq_code = seq_id_to_code.get(sid)
-
-            # If no sequence system, group under UNASSIGNED
-            if not seq_code:
-                seq_code = "UNASSIGNED"
-
-            out.setdefault(seq_code, [])
-            if code not in out[seq_code]:
-                out[seq_code].append(code)
-
-        for k in out:
-            out[k].sort()
-
-        return out
-
-def format_seq_shots_text(data: Dict[str, List[str]]) -> str:
-    lines: list[str] = []
-    for seq in sorted(data.keys()):
-        shots = data[seq]
-        if not shots:
-            continue
-        lines.append(f"{seq}: {', '.join(shots)}")
-    return "\n".join(lines).strip()
+            seq_id = int(seq["id"]) if isinstance(seq, dict) and seq.get("id") else None
+            seq_code = str(sh.get("sg_sequence.Sequence.code") or "").strip()
+            if seq_id is not None and seq_code:
+                state.sequences[seq_id] = seq_code
+            state.shots[shot_id] = {"code": code, "seq": seq_id}
+
+        for a in assets:
+            asset_id = int(a["id"])
+            code = str(a.get("code") or "").strip()
+            if code:
+                state.assets[asset_id] = {"code": code, "type": a.get("sg_asset_type")}
+            else:
+                state.assets.pop(asset_id, None)
+
+        if incremental:
+            for s in results[2]:
+                code = str(s.get("code") or "").strip()
+                if code:
+                    state.sequences[int(s["id"])] = code
+            for row in results[3]:
+                state.sequences.pop(int(row["id"]), None)
+            for row in results[4]:
+                state.shots.pop(int(row["id"]), None)
+            for row in results[5]:
+                state.assets.pop(int(row["id"]), None)
+
+        state.synced_at = started.isoformat()
+        self.last_stats.seconds = time.perf_counter() - t0
+        return state
+
+    # ---------------- Paged retrieval ----------------
+
+    def _find_many(self, queries: list[FlowQuery]) -> list[list[dict[str, Any]]]:
+        """
+        Runs several find() queries concurrently, each split into pages.
+
+        The first page of every query goes out in one concurrent round; only
+        queries whose first page came back full are counted, and their
+        remaining pages are then queued at once on the same bounded pool
+        (no nested waits, no deadlock). Small projects cost one round trip.
+        """
+        first = [
+            self._pool.submit(self._find_page, q, 0 if q.retired_only else 1)
+            for q in queries
+        ]
+        results: list[list[dict[str, Any]]] = [list(rows) for rows in self._wait(first)]
+
+        more = [qi for qi, q in enumerate(queries) if not q.retired_only and len(results[qi]) >= self.page_size]
+        counts = dict(zip(more, self._wait([self._pool.submit(self._count, queries[qi]) for qi in more])))
+
+        jobs: list[tuple[int, Future]] = []
+        for qi in more:
+            pages = max(1, math.ceil(counts[qi] / self.page_size))
+            for page in range(2, pages + 1):
+                jobs.append((qi, self._pool.submit(self._find_page, queries[qi], page)))
+
+        for (qi, _), rows in zip(jobs, self._wait([f for _, f in jobs])):
+            results[qi].extend(rows)
+        return results
+
+    def _wait(self, futures: list[Future]) -> list[Any]:
+        try:
+            return [f.result(timeout=max(0.0, self._deadline_at - time.monotonic())) for f in futures]
+        except FutureTimeout:
+            raise FlowTimeoutError(f"Flow/PT did not answer within {self.deadline:g}s") from None
+        finally:
+            # nothing left to wait for on failure: drop queued pages
+            for f in futures:
+                f.cancel()
+
+    def _call(self, fn: Callable[[Any], Any]) -> Any:
+        """
+        One request with retries, guarded by the circuit breaker.
+        """
+        attempt = 0
+        while True:
+            # a half-open breaker's trial may be in flight: wait for it, within the deadline
+            if not self.breaker.allow(wait=max(0.0, self._deadline_at - time.monotonic())):
+                raise FlowUnavailableError(
+                    f"Flow/PT is unavailable after repeated failures; retrying in {self.breaker.retry_in():.0f}s"
+                )
+            try:
+                with self._connections.connection(self.creds, self._connect) as sg:
+                    result = fn(sg)
+            except Exception as exc:
+                if not is_retryable(exc):
+                    # the server answered; it just didn't like the request
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                attempt += 1
+                delay = self.retry.delay(attempt - 1, self._rng)
+                if attempt >= self.retry.attempts or time.monotonic() + delay >= self._deadline_at:
+                    raise FlowUnavailableError(f"Flow/PT request failed: {exc}") from exc
+                time.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    def _count(self, query: FlowQuery) -> int:
+        summary = self._call(
+            lambda sg: sg.summarize(query.entity_type, query.filters, [{"field": "id", "type": "count"}])
+        )
+        return int((summary or {}).get("summaries", {}).get("id") or 0)
+
+    def _find_page(self, query: FlowQuery, page: int) -> list[dict[str, Any]]:
+        # page 0 = everything in one call
+        with span("flow.page", entity=query.entity_type, page=page) as sp:
+            rows = self._call(
+                lambda sg: sg.find(
+                    query.entity_type,
+                    query.filters,
+                    query.fields,
+                    order=[{"field_name": "id", "direction": "asc"}],
+                    limit=self.page_size if page else 0,
+                    page=page,
+                    retired_only=query.retired_only,
+                )
+            ) or []
+            sp.set(rows=len(rows))
+        self.last_stats.add(rows)
+        return rows
+
+
+def _shotgun_connector(creds: FlowCredentials, timeout: float) -> Callable[[], Any]:
+    try:
+        from shotgun_api3 import Shotgun  # type: ignore
+    except Exception as exc:
+        raise FlowClientError(
+            "Flow/PT integration requires 'shotgun_api3'. Install it with: pip install shotgun_api3"
+        ) from exc
+
+    return lambda: Shotgun(
+        creds.url, script_name=creds.script_name, api_key=creds.script_key, timeout_secs=timeout
+    )
@@ -5,7 +5,7 @@ import json
 import os
 from pathlib import Path
 
-from builder.integrations.flow_client import FlowCredentials
+from builder.integrations.flow_client import FlowCredentials, FlowQueryOptions
 
 
 def load_flow_credentials() -> FlowCredentials:
@@ -28,8 +28,7 @@ def load_flow_credentials() -> FlowCredentials:
             project_id=int(env_pid),
         )
 
-    repo_root = Path(__file__).resolve().parents[2]
-    path = repo_root / "flow_config.json"
+    path = _config_path()
     if not path.exists():
         raise ValueError(
             "Missing Flow/PT credentials. Set env vars (FLOW_URL, FLOW_SCRIPT_NAME, FLOW_SCRIPT_KEY, FLOW_PROJECT_ID) "
@@ -43,3 +42,37 @@ def load_flow_credentials() -> FlowCredentials:
         script_key=str(obj["script_key"]).strip(),
         project_id=int(obj["project_id"]),
     )
+
+
+def load_flow_options() -> FlowQueryOptions:
+    """
+    Optional query settings; nothing configured means every shot is fetched.
+      1) FLOW_SHOT_STATUSES=ip,rdy  (and FLOW_STATUS_FIELD)
+      2) "shot_statuses" / "status_field" in flow_config.json
+    """
+    obj: dict = {}
+    path = _config_path()
+    if path.exists():
+        try:
+            obj = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            obj = {}
+        if not isinstance(obj, dict):
+            obj = {}
+
+    env_statuses = os.getenv("FLOW_SHOT_STATUSES")
+    if env_statuses is not None:
+        statuses = env_statuses.split(",")
+    else:
+        statuses = list(obj.get("shot_statuses") or [])
+
+    field = (os.getenv("FLOW_STATUS_FIELD") or str(obj.get("status_field") or "")).strip()
+    return FlowQueryOptions(
+        shot_statuses=tuple(s.strip() for s in statuses if str(s).strip()),
+        status_field=field or FlowQueryOptions.status_field,
+    )
+
+
+def _config_path() -> Path:
+    repo_root = Path(__file__).resolve().parents[2]
+    return repo_root / "flow_config.json"
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+
+class FakeShotgun:
+    """
+    In-process stand-in for shotgun_api3.Shotgun, for tests and benchmarks.
+
+    Supports the subset FlowClient uses: find() with simple filters, field
+    projection (including "link.Entity.field" lookups), ordering by id and
+    limit/page paging, plus summarize() counts. Every call sleeps `latency`
+    seconds to mimic a server round trip and is recorded in `calls`.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.entities: Dict[str, List[Dict[str, Any]]] = {}
+        self.calls: List[tuple[str, str]] = []   # (method, entity_type)
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    # ---------------- Test data ----------------
+
+    def add(self, entity_type: str, **fields: Any) -> Dict[str, Any]:
+        with self._lock:
+            entity = {"type": entity_type, "id": self._next_id, "updated_at": _now(), **fields}
+            self._next_id += 1
+            self.entities.setdefault(entity_type, []).append(entity)
+        return entity
+
+    def update(self, entity_type: str, entity_id: int, **fields: Any) -> Dict[str, Any]:
+        with self._lock:
+            entity = next(e for e in self.entities[entity_type] if e["id"] == entity_id)
+            entity.update(fields, updated_at=_now())
+        return entity
+
+    def retire(self, entity_type: str, entity_id: int) -> None:
+        self.update(entity_type, entity_id, retired=True)
+
+    @classmethod
+    def with_show(cls, project_id: int, sequences: int, shots_per_sequence: int, latency: float = 0.0) -> "FakeShotgun":
+        sg = cls(latency=latency)
+        project = {"type": "Project", "id": project_id}
+        for s in range(1, sequences + 1):
+            seq = sg.add("Sequence", code=f"SQ{s * 10:03d}", project=project)
+            link = {"type": "Sequence", "id": seq["id"], "name": seq["code"]}
+            for n in range(1, shots_per_sequence + 1):
+                sg.add("Shot", code=f"SH{n * 10:04d}", project=project, sg_sequence=link)
+        return sg
+
+    # ---------------- API subset ----------------
+
+    def find(
+        self,
+        entity_type: str,
+        filters: List[Any],
+        fields: List[str] | None = None,
+        order: List[Dict[str, str]] | None = None,
+        filter_operator: str | None = None,
+        limit: int = 0,
+        retired_only: bool = False,
+        page: int = 0,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        self._record("find", entity_type)
+        rows = self._matching(entity_type, filters, retired_only)
+
+        for spec in reversed(order or []):
+            rows.sort(key=lambda e: e.get(spec["field_name"]) or 0, reverse=spec.get("direction") == "desc")
+
+        if limit:
+            start = (max(page, 1) - 1) * limit
+            rows = rows[start:start + limit]
+
+        return [self._project(e, fields or []) for e in rows]
+
+    def find_one(self, entity_type: str, filters: List[Any], fields: List[str] | None = None, **kwargs: Any) -> Dict[str, Any] | None:
+        rows = self.find(entity_type, filters, fields, limit=1, **kwargs)
+        return rows[0] if rows else None
+
+    def summarize(self, entity_type: str, filters: List[Any], summary_fields: List[Dict[str, str]], **kwargs: Any) -> Dict[str, Any]:
+        self._record("summarize", entity_type)
+        rows = self._matching(entity_type, filters, False)
+        return {"summaries": {f["field"]: len(rows) for f in summary_fields if f.get("type") == "count"}, "groups": []}
+
+    def info(self) -> Dict[str, Any]:
+        self._record("info", "")
+        return {"version": [8, 0, 0], "fake": True}
+
+    def close(self) -> None:
+        return None
+
+    # ---------------- Helpers ----------------
+
+    def _record(self, method: str, entity_type: str) -> None:
+        with self._lock:
+            self.calls.append((method, entity_type))
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _matching(self, entity_type: str, filters: List[Any], retired_only: bool) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = list(self.entities.get(entity_type, []))
+        rows = [e for e in rows if bool(e.get("retired")) == retired_only]
+        return [e for e in rows if all(_match(e, f) for f in filters)]
+
+    def _project(self, entity: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+        out = {"type": entity["type"], "id": entity["id"]}
+        for f in fields:
+            out[f] = self._field(entity, f)
+        return out
+
+    def _field(self, entity: Dict[str, Any], field: str) -> Any:
+        if "." not in field:
+            return entity.get(field)
+        # linked field: "sg_sequence.Sequence.code"
+        link_field, link_type, target = field.split(".", 2)
+        link = entity.get(link_field)
+        if not isinstance(link, dict) or link.get("type") != link_type:
+            return None
+        with self._lock:
+            linked = next((e for e in self.entities.get(link_type, []) if e["id"] == link.get("id")), None)
+        return self._field(linked, target) if linked else None
+
+
+class FlakyShotgun(FakeShotgun):
+    """
+    FakeShotgun that injects faults, for resilience tests.
+
+    The next `fail_next` calls raise `error`; after that each call fails with
+    probability `failure_rate` (seeded, so runs are repeatable). `stall` adds
+    extra seconds to every call, like a server that stopped answering.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        fail_next: int = 0,
+        failure_rate: float = 0.0,
+        error: type[Exception] = ConnectionResetError,
+        stall: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(latency=latency)
+        self.fail_next = fail_next
+        self.failure_rate = failure_rate
+        self.error = error
+        self.stall = stall
+        self.failures = 0
+        self._rng = random.Random(seed)
+
+    def _record(self, method: str, entity_type: str) -> None:
+        super()._record(method, entity_type)
+        if self.stall:
+            time.sleep(self.stall)
+        with self._lock:
+            fail = self.fail_next > 0 or self._rng.random() < self.failure_rate
+            if self.fail_next > 0:
+                self.fail_next -= 1
+            if fail:
+                self.failures += 1
+        if fail:
+            raise self.error(f"injected fault in {method}({entity_type})")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _match(entity: Dict[str, Any], flt: List[Any]) -> bool:
+    field, op, value = flt[0], flt[1], flt[2] if len(flt) > 2 else None
+    actual = entity.get(field)
+    if isinstance(actual, dict):
+        actual = actual.get("id")
+    if isinstance(value, dict):
+        value = value.get("id")
+
+    if op == "is":
+        return actual == value
+    if op == "is_not":
+        return actual != value
+    if op == "in":
+        return actual in flt[2:] if not isinstance(value, list) else actual in value
+    if op == "not_in":
+        return actual not in (value if isinstance(value, list) else flt[2:])
+    if op == "greater_than":
+        return actual is not None and actual > value
+    if op == "less_than":
+        return actual is not None and actual < value
+    raise ValueError(f"FakeShotgun does not support filter operator '{op}'")
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from builder.integrations.flow_client import FlowCredentials
+
+# Connections are shared by site + script, not by project.
+PoolKey = Tuple[str, str, str]
+
+
+@dataclass
+class _Idle:
+    sg: Any
+    since: float
+
+
+class FlowConnectionPool:
+    """
+    Process-wide pool of authenticated Shotgun connections.
+
+    A Shotgun object is not thread-safe, so a connection is checked out by one
+    thread at a time and returned afterwards. Idle connections are reused by
+    later loads (skipping the connect/auth round trip), health-checked with
+    info() when they have been idle for a while, and closed after idle_timeout.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = 300.0,
+        health_check_after: float = 30.0,
+        max_idle_per_key: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.max_idle_per_key = max_idle_per_key
+        self._clock = clock
+        self._idle: Dict[PoolKey, List[_Idle]] = {}
+        self._lock = threading.Lock()
+        self.created = 0  # connections opened so far (for logging/tests)
+
+    @contextmanager
+    def connection(self, creds: FlowCredentials, connect: Callable[[], Any]) -> Iterator[Any]:
+        sg = self.acquire(creds, connect)
+        try:
+            yield sg
+        except BaseException:
+            # the connection may be half-way through a request; don't reuse it
+            _close(sg)
+            raise
+        else:
+            self.release(creds, sg)
+
+    def acquire(self, creds: FlowCredentials, connect: Callable[[], Any]) -> Any:
+        key = _key(creds)
+        while True:
+            with self._lock:
+                self._expire_locked()
+                idle = self._idle.get(key)
+                item = idle.pop() if idle else None
+            if item is None:
+                break
+            if self._clock() - item.since < self.health_check_after or _healthy(item.sg):
+                return item.sg
+            _close(item.sg)
+
+        sg = connect()
+        with self._lock:
+            self.created += 1
+        return sg
+
+    def release(self, creds: FlowCredentials, sg: Any) -> None:
+        key = _key(creds)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(_Idle(sg, self._clock()))
+                return
+        _close(sg)
+
+    def idle_count(self, creds: FlowCredentials | None = None) -> int:
+        with self._lock:
+            if creds is not None:
+                return len(self._idle.get(_key(creds), []))
+            return sum(len(v) for v in self._idle.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            items = [i for idle in self._idle.values() for i in idle]
+            self._idle.clear()
+        for item in items:
+            _close(item.sg)
+
+    def _expire_locked(self) -> None:
+        now = self._clock()
+        for idle in self._idle.values():
+            keep: List[_Idle] = []
+            for item in idle:
+                if now - item.since < self.idle_timeout:
+                    keep.append(item)
+                else:
+                    _close(item.sg)
+            idle[:] = keep
+
+
+_default_pool: FlowConnectionPool | None = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> FlowConnectionPool:
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = FlowConnectionPool()
+        return _default_pool
+
+
+def _key(creds: FlowCredentials) -> PoolKey:
+    return (creds.url.strip().lower(), creds.script_name, creds.script_key)
+
+
+def _healthy(sg: Any) -> bool:
+    try:
+        sg.info()
+        return True
+    except Exception:
+        return False
+
+
+def _close(sg: Any) -> None:
+    try:
+        sg.close()
+    except Exception:
+        pass
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import http.client
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:
+    from builder.integrations.flow_client import FlowCredentials
+
+# shotgun_api3 wraps transport problems in these (matched by name: the
+# module is optional and may not be importable here)
+_RETRYABLE_NAMES = {"ProtocolError", "ResponseError"}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Jittered exponential backoff: attempt n waits base * 2**n (capped),
+    scaled by a random factor in [1 - jitter, 1].
+    """
+    attempts: int = 4
+    base_delay: float = 0.25
+    max_delay: float = 4.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int, rng: random.Random | None = None) -> float:
+        raw = min(self.max_delay, self.base_delay * (2 ** attempt))
+        r = (rng or random).random()
+        return raw * (1.0 - self.jitter * r)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Network trouble and server hiccups are worth another try; bad filters,
+    permissions or credentials are not.
+    """
+    if isinstance(exc, (OSError, TimeoutError, http.client.HTTPException)):
+        return True
+    return type(exc).__name__ in _RETRYABLE_NAMES
+
+
+class CircuitBreaker:
+    """
+    Fails fast after `failure_threshold` consecutive failed requests.
+
+    While open, allow() returns False until `reset_after` seconds have passed;
+    then a single trial request is let through (half-open). Its success
+    closes the breaker again, its failure re-opens it for another period.
+    Requests arriving while the trial is in flight wait for its outcome.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+        self._lock = threading.Lock()
+        self._trial_done = threading.Condition(self._lock)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.reset_after:
+                return "half_open"
+            return "open"
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open"
+
+    def allow(self, wait: float = 0.0) -> bool:
+        """
+        While the half-open trial runs, waits up to `wait` seconds for it:
+        True once it closed the breaker, False if it failed or time ran out.
+        """
+        deadline = time.monotonic() + wait
+        with self._lock:
+            while True:
+                if self._opened_at is None:
+                    return True
+                if self._clock() - self._opened_at < self.reset_after:
+                    return False
+                if not self._trial:
+                    self._trial = True
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._trial_done.wait(None if math.isinf(remaining) else remaining)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+            self._trial_done.notify_all()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial = False
+            self._trial_done.notify_all()
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_after - (self._clock() - self._opened_at))
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(creds: FlowCredentials) -> CircuitBreaker:
+    """
+    One process-wide breaker per site, shared by every FlowClient.
+    """
+    key = creds.url.strip().lower()
+    with _breakers_lock:
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker()
+        return _breakers[key]
@@ -1,46 +1,60 @@
 from __future__ import annotations
 
+import os
+import threading
 from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QFileSystemWatcher, Qt, QTimer
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QFileDialog,
     QFormLayout,
     QGroupBox,
+    QHeaderView,
     QHBoxLayout,
     QLabel,
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
+    QProgressBar,
     QPushButton,
     QTextEdit,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
-from builder.core.template_loader import TemplateInfo, TemplateLoader, TemplateLoadResult
-from builder.core.planner import plan_shot_build, plan_asset_build
-from builder.core.builder import PlanBuilder
+from builder.core.template_cache import TemplateCache
+from builder.core.template_loader import TemplateHandle, TemplateInfo, TemplateLoader, TemplateLoadError
+from builder.core.template_watcher import TemplateWatcher
+from builder.core.plan_request import PlanGenerations, PlanInputError, PlanRequest, PlanResponse, run_plan_request
+from builder.core.planner import PlanCancelled
+from builder.core.builder import BuildProgress, BuildResult, PlanBuilder
 from builder.core.reporting import format_build_summary
-from builder.core.manifest import build_manifest, write_manifest
 from builder.core.template_preview import format_template_preview
+from builder.ui.plan_model import PlanTreeModel
 from builder.util.parse_input import parse_sequences_and_shots
 from builder.util.parse_assets import parse_assets
-from builder.util.fs import open_in_file_explorer
+from builder.util.fs import open_in_file_explorer, user_cache_dir
+from builder.util.log_sink import LogSink
 from builder.models import PlanAction
 from PySide6.QtWidgets import QDialog
-from builder.core.job_config import (
-    make_job_config,
-    write_job_config,
-    read_job_config,
-    config_to_text_for_ui,
-)
 from PySide6.QtCore import QObject, QThread, Signal
-from builder.integrations.flow_client import FlowClient, format_seq_shots_text
-from builder.integrations.flow_config import load_flow_credentials
+
+# Flow, snapshots, manifests, job configs and shot-file import are imported
+# where they are used: none of them is needed to show the window.
+if TYPE_CHECKING:
+    from builder.integrations.flow_cache import ProjectCache
+    from builder.util.startup import StartupProfile
+
+# snapshots older than this still load, with a warning in the log
+SNAPSHOT_WARN_AGE = timedelta(hours=24)
+
 
 @dataclass
 class UiState:
@@ -50,41 +64,196 @@ class UiState:
     mode: str = "shots"  # "shots" | "assets"
 
 class FlowWorker(QObject):
-    finished = Signal(dict)      # sequences dict
+    cached = Signal(dict)        # sequences/assets dict from the local cache (before syncing)
+    finished = Signal(dict)      # sequences dict (shots mode) or category -> assets (assets mode)
     failed = Signal(str)
+    stats = Signal(str)          # fetch summary (rows, payload size, time)
+    stale = Signal(str)          # Flow/PT unreachable; the cached copy was served
+
+    def __init__(self, mode: str = "shots") -> None:
+        super().__init__()
+        self.mode = mode
+
+    def _result(self, state: ProjectCache) -> dict:
+        # shots and assets are synced together; hand back the one the UI asked for
+        return state.to_assets() if self.mode == "assets" else state.to_sequences()
 
     def run(self) -> None:
         try:
+            from builder.integrations.flow_cache import FlowCache
+            from builder.integrations.flow_client import FlowClient, FlowUnavailableError
+            from builder.integrations.flow_config import load_flow_credentials, load_flow_options
+
             creds = load_flow_credentials()
-            client = FlowClient(creds)
-            data = client.fetch_sequences_and_shots()
-            self.finished.emit(data)
+            cache = FlowCache(user_cache_dir() / "flow")
+            state = cache.load(creds)
+            if not state.is_empty:
+                self.cached.emit(self._result(state))
+
+            # incremental: only entities changed since the last sync are fetched
+            with FlowClient(creds, options=load_flow_options()) as client:
+                try:
+                    client.sync(state)
+                except FlowUnavailableError as exc:
+                    if state.is_empty:
+                        raise
+                    self.stale.emit(str(exc))
+                    self.finished.emit(self._result(state))
+                    return
+                self.stats.emit(client.last_stats.pretty())
+            cache.save(creds, state)
+            self.finished.emit(self._result(state))
+        except Exception as exc:
+            self.failed.emit(str(exc))
+
+
+class PlanWorker(QObject):
+    """
+    Lives on its own thread for the window's lifetime; requests arrive as
+    queued signals. A request that is no longer current is skipped or
+    cancelled part-way through (PlanGenerations), so a burst of edits only
+    plans the last one in full.
+    """
+    planned = Signal(int, object)   # generation, PlanResponse
+    failed = Signal(int, str)       # generation, message
+
+    def __init__(self, generations: PlanGenerations) -> None:
+        super().__init__()
+        self._generations = generations
+
+    def run(self, generation: int, req: PlanRequest) -> None:
+        if not self._generations.is_current(generation):
+            return
+        try:
+            resp = run_plan_request(req, should_cancel=self._generations.canceller(generation))
+        except PlanCancelled:
+            return
+        except PlanInputError as exc:
+            self.failed.emit(generation, str(exc))
+            return
+        except Exception as exc:
+            self.failed.emit(generation, f"Planning failed: {exc}")
+            return
+        self.planned.emit(generation, resp)
+
+
+@dataclass(frozen=True)
+class ManifestInputs:
+    project_root: Path
+    template_name: str
+    template_version: str
+    template_raw: dict
+    mode: str
+    sequences: dict | None
+    assets: dict | None
+
+
+class BuildWorker(QObject):
+    progress = Signal(object)         # BuildProgress, throttled by PlanBuilder
+    finished = Signal(object, str)    # BuildResult, manifest path ("" if none)
+    failed = Signal(str)
+
+    def __init__(self, plan: list[PlanAction], overwrite: bool, manifest: ManifestInputs | None) -> None:
+        super().__init__()
+        self._plan = plan
+        self._overwrite = overwrite
+        self._manifest = manifest
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        # called from the GUI thread while run() is busy; an Event needs no event loop
+        self._cancel.set()
+
+    def run(self) -> None:
+        try:
+            builder = PlanBuilder(overwrite=self._overwrite, progress_interval=0.1)
+            result = builder.execute(self._plan, progress=self.progress.emit, should_cancel=self._cancel.is_set)
+
+            manifest_path = ""
+            m = self._manifest
+            if m is not None:
+                from builder.core.manifest import build_manifest, write_manifest
+
+                # written for cancelled builds too: it lists exactly what was done
+                rec = build_manifest(
+                    project_root=m.project_root,
+                    template_name=m.template_name,
+                    template_version=m.template_version,
+                    template_raw=m.template_raw,
+                    mode=m.mode,
+                    sequences=m.sequences,
+                    assets=m.assets,
+                    result=result,
+                )
+                manifest_path = write_manifest(rec).as_posix()
+            self.finished.emit(result, manifest_path)
         except Exception as exc:
             self.failed.emit(str(exc))
 
 
 class MainWindow(QMainWindow):
+    _plan_requested = Signal(int, object)   # generation, PlanRequest -> PlanWorker
+    first_shown = Signal()                  # once, after the first show has been processed
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Studio Folder Builder")
         self.resize(1180, 880)
 
         self._state = UiState()
-        self._templates: list[TemplateInfo] = []
-        self._last_load: TemplateLoadResult | None = None
+        self._templates: list[TemplateHandle] = []
 
         self._last_plan: list[PlanAction] = []
+        self._flow_cached_text: str | None = None
+        self._flow_mode = "shots"
+        self._build_thread: QThread | None = None
+        self._build_worker: BuildWorker | None = None
+
+        # Planning thread (manual and live preview)
+        self._plan_generations = PlanGenerations()
+        self._plan_live = False  # whether the current generation is a live preview (quiet log)
+        self._plan_thread = QThread(self)
+        self._plan_worker = PlanWorker(self._plan_generations)
+        self._plan_worker.moveToThread(self._plan_thread)
+        self._plan_thread.finished.connect(self._plan_worker.deleteLater)
+        self._live_preview_timer = QTimer(self)
+        self._live_preview_timer.setSingleShot(True)
+        self._live_preview_timer.setInterval(400)
         self._last_sequences: dict[str, list[str]] | None = None
         self._last_assets: dict[str, list[str]] | None = None
 
         self._templates_dir = Path(__file__).resolve().parents[2] / "templates"
-        self._loader = TemplateLoader(self._templates_dir)
+        self._loader = TemplateLoader(
+            self._templates_dir,
+            cache=TemplateCache(user_cache_dir() / "template_cache.json"),
+        )
+
+        # Template hot reload: native notifications where available, polling as fallback
+        # (notifications are unreliable on network shares).
+        self._template_watcher = TemplateWatcher(self._templates_dir)
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._template_poll_timer = QTimer(self)
+        self._template_poll_timer.setInterval(3000)
+        self._template_debounce = QTimer(self)
+        self._template_debounce.setSingleShot(True)
+        self._template_debounce.setInterval(250)
+
+        # Output log: buffered, bounded, flushed on a timer (optional spill file)
+        spill = os.getenv("SFB_LOG_FILE")
+        self._log_sink = LogSink(max_lines=5000, spill_path=Path(spill) if spill else None)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
 
         self._build_ui()
         self._wire_signals()
-        self._reload_templates()
+        self._plan_thread.start()
         self._apply_mode_visibility()
 
+        # Templates are scanned after the first paint (_on_first_shown), not here.
+        self._shown = False
+        self.template_combo.addItem("Loading templates...", None)
+
     # ---------------- UI ----------------
 
     def _build_ui(self) -> None:
@@ -150,8 +319,13 @@ class MainWindow(QMainWindow):
         self.seq_shot_edit.setMinimumHeight(130)
         self.seq_shot_edit.setPlaceholderText("SQ010: SH010, SH020\nSQ020: SH010\n")
         self.fill_shots_example_btn = QPushButton("Fill Example")
+        self.import_shots_btn = QPushButton("Import...")
+        shots_btns = QVBoxLayout()
+        shots_btns.addWidget(self.fill_shots_example_btn)
+        shots_btns.addWidget(self.import_shots_btn)
+        shots_btns.addStretch(1)
         shots_row.addWidget(self.seq_shot_edit, 1)
-        shots_row.addWidget(self.fill_shots_example_btn)
+        shots_row.addLayout(shots_btns)
         self.shots_row_widget = QWidget()
         self.shots_row_widget.setLayout(shots_row)
         inputs_layout.addRow("Seq/Shots:", self.shots_row_widget)
@@ -182,12 +356,26 @@ class MainWindow(QMainWindow):
         self.build_btn = QPushButton("Build")
         self.build_btn.setEnabled(False)
         btn_row.addWidget(self.preview_btn)
+        self.live_preview_checkbox = QCheckBox("Live preview")
+        self.live_preview_checkbox.setToolTip("Re-plan in the background shortly after each edit")
+        btn_row.addWidget(self.live_preview_checkbox)
         btn_row.addWidget(self.build_btn)
+        self.cancel_build_btn = QPushButton("Cancel Build")
+        self.cancel_build_btn.setVisible(False)
+        btn_row.addWidget(self.cancel_build_btn)
+        self.build_progress = QProgressBar()
+        self.build_progress.setVisible(False)
+        self.build_progress.setTextVisible(True)
+        btn_row.addWidget(self.build_progress, 1)
         btn_row.addStretch(1)
         root_layout.addLayout(btn_row)
         flow_row = QHBoxLayout()
         self.load_flow_btn = QPushButton("Load Seq/Shots from Flow/PT")
         flow_row.addWidget(self.load_flow_btn)
+        self.load_snapshot_btn = QPushButton("Load Snapshot...")
+        self.save_snapshot_btn = QPushButton("Save Snapshot...")
+        flow_row.addWidget(self.load_snapshot_btn)
+        flow_row.addWidget(self.save_snapshot_btn)
         flow_row.addStretch(1)
         root_layout.addLayout(flow_row)
 
@@ -208,31 +396,83 @@ class MainWindow(QMainWindow):
         self.template_preview.setMinimumHeight(170)
         root_layout.addWidget(self.template_preview)
 
+        # Plan preview: model/view, rows are only created for what is on screen
+        plan_header = QHBoxLayout()
+        plan_header.addWidget(QLabel("Plan Preview"))
+        self.plan_filter_edit = QLineEdit()
+        self.plan_filter_edit.setPlaceholderText("Filter by sequence, shot or path (e.g. SQ010 SH0020, comp/work)")
+        self.plan_filter_edit.setClearButtonEnabled(True)
+        plan_header.addWidget(self.plan_filter_edit, 1)
+        self.plan_count_label = QLabel("")
+        plan_header.addWidget(self.plan_count_label)
+        root_layout.addLayout(plan_header)
+
+        self.plan_model = PlanTreeModel(self)
+        self.plan_view = QTreeView()
+        self.plan_view.setModel(self.plan_model)
+        self.plan_view.setUniformRowHeights(True)
+        self.plan_view.setMinimumHeight(170)
+        self.plan_view.header().setStretchLastSection(False)
+        self.plan_view.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        root_layout.addWidget(self.plan_view, 1)
+
+        self._plan_filter_timer = QTimer(self)
+        self._plan_filter_timer.setSingleShot(True)
+        self._plan_filter_timer.setInterval(200)
+
         # Output
         root_layout.addWidget(QLabel("Output"))
-        self.output = QTextEdit()
+        self.output = QPlainTextEdit()
         self.output.setReadOnly(True)
+        self.output.setMaximumBlockCount(self._log_sink.max_lines)
         root_layout.addWidget(self.output, 1)
 
     def _wire_signals(self) -> None:
         self.root_browse_btn.clicked.connect(self._pick_root_dir)
         self.preview_btn.clicked.connect(self._on_preview_clicked)
         self.build_btn.clicked.connect(self._on_build_clicked)
+        self.cancel_build_btn.clicked.connect(self._on_cancel_build_clicked)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        self._plan_requested.connect(self._plan_worker.run)
+        self._plan_worker.planned.connect(self._on_plan_ready)
+        self._plan_worker.failed.connect(self._on_plan_failed)
+        self.live_preview_checkbox.toggled.connect(self._on_live_preview_toggled)
+        self._live_preview_timer.timeout.connect(lambda: self._request_plan(live=True))
+        for signal in (
+            self.root_path_edit.textChanged,
+            self.project_edit.textChanged,
+            self.template_combo.currentIndexChanged,
+            self.mode_combo.currentIndexChanged,
+            self.seq_shot_edit.textChanged,
+            self.assets_edit.textChanged,
+        ):
+            signal.connect(self._schedule_live_preview)
         self.open_project_btn.clicked.connect(self._open_project_folder)
 
         self.project_edit.textChanged.connect(self._on_project_changed)
         self.template_combo.currentIndexChanged.connect(self._on_template_changed)
         self.reload_templates_btn.clicked.connect(self._reload_templates)
         self.show_template_errors_btn.clicked.connect(self._show_template_errors_dialog)
+        self._fs_watcher.directoryChanged.connect(self._template_debounce.start)
+        self._fs_watcher.fileChanged.connect(self._template_debounce.start)
+        self._template_debounce.timeout.connect(self._poll_templates)
+        self._template_poll_timer.timeout.connect(self._poll_templates)
+
+        self.plan_filter_edit.textChanged.connect(self._plan_filter_timer.start)
+        self._plan_filter_timer.timeout.connect(self._apply_plan_filter)
 
         self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
         self.fill_shots_example_btn.clicked.connect(self._fill_shots_example)
+        self.import_shots_btn.clicked.connect(self._on_import_shots)
         self.fill_assets_example_btn.clicked.connect(self._fill_assets_example)
 
         self.save_config_btn.clicked.connect(self._on_save_config)
         self.load_config_btn.clicked.connect(self._on_load_config)
 
         self.load_flow_btn.clicked.connect(self._on_load_flow_clicked)
+        self.load_snapshot_btn.clicked.connect(self._on_load_snapshot)
+        self.save_snapshot_btn.clicked.connect(self._on_save_snapshot)
 
     # ---------------- Mode ----------------
 
@@ -246,7 +486,7 @@ class MainWindow(QMainWindow):
         is_shots = self._state.mode == "shots"
         self.shots_row_widget.setVisible(is_shots)
         self.assets_row_widget.setVisible(not is_shots)
-        self.load_flow_btn.setEnabled(self._state.mode == "shots")
+        self.load_flow_btn.setText(self._flow_btn_text())
 
     # ---------------- Templates ----------------
 
@@ -254,42 +494,97 @@ class MainWindow(QMainWindow):
         self.template_combo.blockSignals(True)
         self.template_combo.clear()
 
-        self._last_load = self._loader.load_all()
-        self._templates = self._last_load.templates
-        problems = self._last_load.problems
-        problem_count = len(problems)
+        # Header-only discovery; each template is parsed/validated on first selection.
+        self._loader.invalidate()
+        self._template_watcher.reset()
+        self._templates = self._loader.scan()
+        self._sync_fs_watcher()
 
         if not self._templates:
-            self.template_combo.addItem("No valid templates found", None)
+            self.template_combo.addItem("No templates found", None)
             self._state.template = None
             self.template_preview.setPlainText("")
         else:
-            for t in self._templates:
-                self.template_combo.addItem(f"{t.name} (v{t.version})", t.template_id)
+            for h in self._templates:
+                self.template_combo.addItem(f"{h.name} (v{h.version})", h.template_id)
             self.template_combo.setCurrentIndex(0)
-            self._state.template = self._templates[0]
-            self._refresh_template_preview()
+            self._select_template(self._templates[0])
+
+        self.template_combo.blockSignals(False)
+
+        self._invalidate_plan()
+        self._log(f"Found {len(self._templates)} template(s).")
 
+    def _poll_templates(self) -> None:
+        changes = self._template_watcher.poll()
+        if not changes:
+            return
+
+        selected_id = self.template_combo.currentData()
+        selected = next((h for h in self._templates if h.template_id == selected_id), None)
+        self._templates = self._loader.refresh(self._templates, changes)
+        self._sync_fs_watcher()
+
+        # Repopulate the combo from the in-memory handles (no other template is re-read).
+        self.template_combo.blockSignals(True)
+        self.template_combo.clear()
+        if not self._templates:
+            self.template_combo.addItem("No templates found", None)
+        for h in self._templates:
+            self.template_combo.addItem(f"{h.name} (v{h.version})", h.template_id)
+        idx = self.template_combo.findData(selected_id)
+        self.template_combo.setCurrentIndex(max(idx, 0))
+        self.template_combo.blockSignals(False)
+
+        self._log(
+            f"Templates changed on disk: {len(changes.added)} added, "
+            f"{len(changes.changed)} changed, {len(changes.removed)} removed."
+        )
+
+        # Only the selected template's preview/plan depends on what changed
+        # (its own file, or a base template it extends).
+        if idx < 0 or (selected is not None and not self._loader.is_memoized(selected.path)):
+            self._on_template_changed(self.template_combo.currentIndex())
+        else:
+            self._refresh_template_warnings()
+
+    def _sync_fs_watcher(self) -> None:
+        watched = self._fs_watcher.directories() + self._fs_watcher.files()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        if self._templates_dir.is_dir():
+            self._fs_watcher.addPath(str(self._templates_dir))
+        files = [str(p) for p in self._template_watcher.watched_files()]
+        if files:
+            self._fs_watcher.addPaths(files)
+
+    def _select_template(self, handle: TemplateHandle | None) -> None:
+        if handle is None:
+            self._state.template = None
+        else:
+            try:
+                self._state.template = self._loader.load(handle)
+            except TemplateLoadError as exc:
+                self._state.template = None
+                self._log(f"Template {exc.file_key} is invalid and cannot be used.")
+        self._refresh_template_preview()
+        self._refresh_template_warnings()
+
+    def _refresh_template_warnings(self) -> None:
+        problem_count = len(self._loader.problems())
         if problem_count > 0:
-            self.template_warning_label.setText(f"{problem_count} template file(s) have errors and were skipped.")
+            self.template_warning_label.setText(f"{problem_count} template file(s) have errors and cannot be used.")
             self.show_template_errors_btn.setEnabled(True)
         else:
-            self.template_warning_label.setText("All templates loaded successfully.")
+            self.template_warning_label.setText("No template errors found so far.")
             self.show_template_errors_btn.setEnabled(False)
 
-        self.template_combo.blockSignals(False)
-
-        self._invalidate_plan()
-        self._log(f"Loaded {len(self._templates)} valid template(s). Skipped {problem_count} file(s).")
-
     def _refresh_template_preview(self) -> None:
         t = self._state.template
         self.template_preview.setPlainText(format_template_preview(t.raw) if t else "")
 
     def _show_template_errors_dialog(self) -> None:
-        if not self._last_load:
-            return
-        problems = self._last_load.problems
+        problems = self._loader.problems()
         if not problems:
             QMessageBox.information(self, "Template Errors", "No template errors.")
             return
@@ -305,19 +600,17 @@ class MainWindow(QMainWindow):
         box = QMessageBox(self)
         box.setWindowTitle("Template Errors")
         box.setIcon(QMessageBox.Icon.Warning)
-        box.setText("Some templates could not be loaded and were skipped.")
+        box.setText("Some templates could not be loaded and cannot be used.")
         box.setDetailedText(msg)
         box.exec()
 
     def _on_template_changed(self, idx: int) -> None:
         if idx < 0 or not self._templates:
-            self._state.template = None
-            self._refresh_template_preview()
+            self._select_template(None)
             self._invalidate_plan()
             return
         template_id = self.template_combo.itemData(idx)
-        self._state.template = next((t for t in self._templates if t.template_id == template_id), None)
-        self._refresh_template_preview()
+        self._select_template(next((h for h in self._templates if h.template_id == template_id), None))
         self._invalidate_plan()
 
     # ---------------- State ----------------
@@ -336,21 +629,75 @@ class MainWindow(QMainWindow):
         self._invalidate_plan()
 
     def _invalidate_plan(self) -> None:
+        self._plan_generations.bump()  # results still in flight are now stale
         self._last_plan = []
         self._last_sequences = None
         self._last_assets = None
         self.build_btn.setEnabled(False)
         self.open_project_btn.setEnabled(False)
+        self.plan_model.clear()
+        self.plan_count_label.setText("")
+
+    def _apply_plan_filter(self) -> None:
+        self.plan_model.set_filter(self.plan_filter_edit.text())
+        total = len(self._last_plan)
+        shown = self.plan_model.visible_count()
+        self.plan_count_label.setText(f"{shown} of {total}" if shown != total else f"{total} item(s)")
 
     def _fill_shots_example(self) -> None:
         self.seq_shot_edit.setPlainText("SQ010: SH010, SH020\nSQ020: SH010\n")
 
+    def _on_import_shots(self) -> None:
+        path_str, _ = QFileDialog.getOpenFileName(
+            self, "Import Shot List", "", "Shot lists (*.txt *.csv *.tsv *.edl);;All Files (*)"
+        )
+        if not path_str:
+            return
+
+        from builder.util.format_input import format_seq_shots_text
+        from builder.util.import_shots import import_shots_file
+
+        try:
+            parsed = import_shots_file(Path(path_str))
+        except Exception as exc:
+            QMessageBox.warning(self, "Import Failed", str(exc))
+            return
+
+        # one line per sequence keeps the text box small for huge lists
+        self.seq_shot_edit.setPlainText(format_seq_shots_text(parsed.sequences))
+        self._invalidate_plan()
+        shot_count = sum(len(v) for v in parsed.sequences.values())
+        self._log(f"Imported {shot_count} shot(s) in {len(parsed.sequences)} sequence(s) from {path_str}. Click Preview Plan.")
+        if parsed.skipped:
+            preview = ", ".join(parsed.skipped[:5]) + (", ..." if len(parsed.skipped) > 5 else "")
+            self._log(f"Skipped {len(parsed.skipped)} row(s) with no sequence: {preview}")
+
     def _fill_assets_example(self) -> None:
         self.assets_edit.setPlainText("characters: Hero, Villain\nprops: Sword, Shield\nenvironments: City\n")
 
     # ---------------- Actions ----------------
 
     def _on_preview_clicked(self) -> None:
+        self._request_plan(live=False)
+
+    def _schedule_live_preview(self) -> None:
+        if self.live_preview_checkbox.isChecked():
+            self._live_preview_timer.start()
+
+    def _on_live_preview_toggled(self, on: bool) -> None:
+        if on:
+            self._live_preview_timer.start()
+        else:
+            self._live_preview_timer.stop()
+
+    def _request_plan(self, live: bool) -> None:
+        """
+        Planning (parsing included) runs on the planning thread; only the
+        newest request's result is shown, older ones are cancelled.
+        """
+        if self._build_thread is not None:
+            return
+
         root_text = self.root_path_edit.text().strip()
         root_dir = Path(root_text) if root_text else None
         self._state.root_dir = root_dir
@@ -365,92 +712,166 @@ class MainWindow(QMainWindow):
 
         t = self._state.template
         if errors:
-            self._log("Cannot preview - fix the following:")
-            for e in errors:
-                self._log(f"  - {e}")
             self._invalidate_plan()
+            if not live:
+                self._log("Cannot preview - fix the following:")
+                for e in errors:
+                    self._log(f"  - {e}")
             return
 
         assert t is not None
         assert root_dir is not None
 
-        project_root = root_dir / self._state.project_name
+        text = self.seq_shot_edit.toPlainText() if self._state.mode == "shots" else self.assets_edit.toPlainText()
+        req = PlanRequest(root_dir, self._state.project_name, t.raw, self._state.mode, text)
 
-        if self._state.mode == "shots":
-            parsed = parse_sequences_and_shots(self.seq_shot_edit.toPlainText())
-            if not parsed.sequences:
-                self._log("Seq/Shots input is required (at least one sequence with shots).")
-                self._invalidate_plan()
-                return
-
-            plan = plan_shot_build(root_dir, self._state.project_name, t.raw, parsed.sequences)
-            self._last_sequences = parsed.sequences
-            self._last_assets = None
+        self._invalidate_plan()  # also supersedes whatever is still planning
+        generation = self._plan_generations.current
+        self._plan_live = live
+        self.plan_count_label.setText("Planning...")
+        self._plan_requested.emit(generation, req)
 
-            self._log("Preview Plan (Shots Mode)")
-            self._log(f"Project path: {project_root.as_posix()}")
-            self._log(f"Sequences: {len(parsed.sequences)} | Shots: {sum(len(v) for v in parsed.sequences.values())}")
+    def _on_plan_ready(self, generation: int, resp: PlanResponse) -> None:
+        if not self._plan_generations.is_current(generation):
+            return  # superseded while it was planning
+        live = self._plan_live
 
-        else:
-            parsed = parse_assets(self.assets_edit.toPlainText())
-            if not parsed.assets:
-                self._log("Assets input is required (at least one category with assets).")
-                self._invalidate_plan()
-                return
-
-            plan = plan_asset_build(root_dir, self._state.project_name, t.raw, parsed.assets)
-            self._last_assets = parsed.assets
-            self._last_sequences = None
-
-            self._log("Preview Plan (Assets Mode)")
-            self._log(f"Project path: {project_root.as_posix()}")
-            self._log(f"Categories: {len(parsed.assets)} | Assets: {sum(len(v) for v in parsed.assets.values())}")
-
-        self._last_plan = plan
+        self._last_plan = resp.plan
+        self._last_sequences = resp.sequences
+        self._last_assets = resp.assets
         self.build_btn.setEnabled(True)
         self.open_project_btn.setEnabled(True)
+        self.plan_model.set_tree(resp.tree)
+        self._apply_plan_filter()
 
-        self._log(f"Template: {t.name} (v{t.version})")
-        self._log("")
-        for action in plan:
-            self._log(action.pretty())
-        self._log("")
-        self._log(f"Plan totals - folders/files: {len(plan)} (deduped).")
+        t = self._state.template
+        if live:
+            return
+        self._log(f"Preview Plan ({'Shots' if resp.sequences is not None else 'Assets'} Mode)")
+        self._log(f"Project path: {resp.project_root.as_posix()}")
+        self._log(resp.summary())
+        if t is not None:
+            self._log(f"Template: {t.name} (v{t.version})")
+        self._log(f"Plan totals - folders/files: {len(resp.plan)} (deduped). See Plan Preview.")
+
+    def _on_plan_failed(self, generation: int, msg: str) -> None:
+        if not self._plan_generations.is_current(generation):
+            return
+        self.plan_count_label.setText("")
+        if not self._plan_live:
+            self._log(msg)
 
     def _on_build_clicked(self) -> None:
         if not self._last_plan:
             self._log("No plan available. Click Preview Plan first.")
             self.build_btn.setEnabled(False)
             return
+        if self._build_thread is not None:
+            return
 
         overwrite = self.overwrite_checkbox.isChecked()
-        builder = PlanBuilder(overwrite=overwrite)
-
-        self._log("")
-        self._log(f"Building... (overwrite={'ON' if overwrite else 'OFF'})")
-        result = builder.execute(self._last_plan)
-        self._log("")
-        self._log(format_build_summary(result))
-
-        # Manifest
+        manifest = None
         root_dir = self._state.root_dir
         t = self._state.template
         if root_dir and t:
-            project_root = root_dir / self._state.project_name
-            rec = build_manifest(
-                project_root=project_root,
+            manifest = ManifestInputs(
+                project_root=root_dir / self._state.project_name,
                 template_name=t.name,
                 template_version=t.version,
                 template_raw=t.raw,
                 mode=self._state.mode,
                 sequences=self._last_sequences,
                 assets=self._last_assets,
-                result=result,
             )
-            manifest_path = write_manifest(rec)
-            self._log(f"Manifest written: {manifest_path.as_posix()}")
 
-        self._log("Build finished.")
+        self._log("")
+        self._log(f"Building... (overwrite={'ON' if overwrite else 'OFF'})")
+
+        self._build_thread = QThread(self)
+        self._build_worker = BuildWorker(list(self._last_plan), overwrite, manifest)
+        self._build_worker.moveToThread(self._build_thread)
+
+        self._build_thread.started.connect(self._build_worker.run)
+        self._build_worker.progress.connect(self._on_build_progress)
+        self._build_worker.finished.connect(self._on_build_finished)
+        self._build_worker.failed.connect(self._on_build_failed)
+
+        self._build_worker.finished.connect(self._build_thread.quit)
+        self._build_worker.failed.connect(self._build_thread.quit)
+        self._build_thread.finished.connect(self._build_worker.deleteLater)
+        self._build_thread.finished.connect(self._build_thread.deleteLater)
+
+        self._set_building(True, total=len(self._last_plan))
+        self._build_thread.start()
+
+    def _on_cancel_build_clicked(self) -> None:
+        if self._build_worker is not None:
+            self._build_worker.cancel()
+            self.cancel_build_btn.setEnabled(False)
+            self._log("Cancelling build after the current action...")
+
+    def _set_building(self, busy: bool, total: int = 0) -> None:
+        # Inputs stay editable, but nothing that would start another plan/build.
+        self.build_btn.setEnabled(not busy and bool(self._last_plan))
+        self.build_btn.setText("Building..." if busy else "Build")
+        self.preview_btn.setEnabled(not busy)
+        self.load_config_btn.setEnabled(not busy)
+        self.cancel_build_btn.setVisible(busy)
+        self.cancel_build_btn.setEnabled(busy)
+        self.build_progress.setVisible(busy)
+        if busy:
+            self.build_progress.setRange(0, max(1, total))
+            self.build_progress.setValue(0)
+            self.build_progress.setFormat("Starting...")
+
+    def _on_build_progress(self, p: BuildProgress) -> None:
+        self.build_progress.setValue(p.done)
+        self.build_progress.setFormat(p.pretty())
+
+    def _on_build_finished(self, result: BuildResult, manifest_path: str) -> None:
+        self._build_thread = None
+        self._build_worker = None
+        self._set_building(False)
+
+        self._log("")
+        self._log(format_build_summary(result))
+        if manifest_path:
+            self._log(f"Manifest written: {manifest_path}")
+        self._log("Build cancelled." if result.cancelled else "Build finished.")
+
+    def _on_build_failed(self, msg: str) -> None:
+        self._build_thread = None
+        self._build_worker = None
+        self._set_building(False)
+        QMessageBox.warning(self, "Build Failed", msg)
+        self._log(f"Build failed: {msg}")
+
+    def showEvent(self, event: Any) -> None:
+        super().showEvent(event)
+        if not self._shown:
+            self._shown = True
+            # queued: runs once the window has actually been painted
+            QTimer.singleShot(0, self._on_first_shown)
+
+    def _on_first_shown(self) -> None:
+        self.first_shown.emit()
+        self._reload_templates()
+        self._template_poll_timer.start()
+
+    def log_startup(self, profile: StartupProfile) -> None:
+        self._log(profile.pretty())
+
+    def closeEvent(self, event: Any) -> None:
+        self._plan_generations.bump()
+        self._plan_thread.quit()
+        self._plan_thread.wait(5_000)
+        # Let a running build stop at an action boundary so its manifest is written.
+        if self._build_worker is not None and self._build_thread is not None:
+            self._build_worker.cancel()
+            self._build_thread.quit()
+            self._build_thread.wait(10_000)
+        self._log_sink.close()
+        super().closeEvent(event)
 
     def _open_project_folder(self) -> None:
         root_text = self.root_path_edit.text().strip()
@@ -467,7 +888,21 @@ class MainWindow(QMainWindow):
     # ---------------- Logging ----------------
 
     def _log(self, msg: str) -> None:
-        self.output.append(msg)
+        # buffered; _flush_log moves it to the widget in batches
+        self._log_sink.write(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        lines = self._log_sink.drain()
+        if not lines:
+            return
+        # one insert (one layout pass) per batch; keep the view pinned to the end
+        bar = self.output.verticalScrollBar()
+        at_end = bar.value() >= bar.maximum() - 2
+        self.output.appendPlainText("\n".join(lines))
+        if at_end:
+            bar.setValue(bar.maximum())
 
     def _on_save_config(self) -> None:
         root_text = self.root_path_edit.text().strip()
@@ -486,13 +921,17 @@ class MainWindow(QMainWindow):
         assets = self._last_assets if self._state.mode == "assets" else None
 
         # If user hasn't previewed yet, parse directly from UI so save still works
-        if self._state.mode == "shots" and not sequences:
-            parsed = parse_sequences_and_shots(self.seq_shot_edit.toPlainText())
-            sequences = parsed.sequences if parsed.sequences else None
-
-        if self._state.mode == "assets" and not assets:
-            parsed = parse_assets(self.assets_edit.toPlainText())
-            assets = parsed.assets if parsed.assets else None
+        try:
+            if self._state.mode == "shots" and not sequences:
+                parsed = parse_sequences_and_shots(self.seq_shot_edit.toPlainText())
+                sequences = parsed.sequences if parsed.sequences else None
+
+            if self._state.mode == "assets" and not assets:
+                parsed_assets = parse_assets(self.assets_edit.toPlainText())
+                assets = parsed_assets.assets if parsed_assets.assets else None
+        except ValueError as exc:  # oversized range
+            QMessageBox.warning(self, "Save Config", str(exc))
+            return
 
         if self._state.mode == "shots" and not sequences:
             QMessageBox.warning(self, "Save Config", "Shots mode requires at least one sequence with shots.")
@@ -502,6 +941,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Save Config", "Assets mode requires at least one category with assets.")
             return
 
+        from builder.core.job_config import make_job_config, write_job_config
+
         cfg = make_job_config(
             root=root_dir,
             project=project,
@@ -529,6 +970,8 @@ class MainWindow(QMainWindow):
         if not path_str:
             return
 
+        from builder.core.job_config import config_to_text_for_ui, read_job_config
+
         try:
             cfg = read_job_config(Path(path_str))
         except Exception as exc:
@@ -574,20 +1017,21 @@ class MainWindow(QMainWindow):
         self._log("Click Preview Plan to regenerate the plan from the loaded config.")
 
     def _on_load_flow_clicked(self) -> None:
-        if self._state.mode != "shots":
-            QMessageBox.information(self, "Flow/PT", "Switch to Shots Mode to load sequences/shots from Flow/PT.")
-            return
+        self._flow_mode = self._state.mode
 
         # UI hint
-        self._log("Loading sequences/shots from Flow/PT...")
+        self._log(f"Loading {self._flow_what()} from Flow/PT...")
 
         # Thread setup
         self._flow_thread = QThread(self)  # keep refs on self to avoid GC
-        self._flow_worker = FlowWorker()
+        self._flow_worker = FlowWorker(self._flow_mode)
         self._flow_worker.moveToThread(self._flow_thread)
 
         self._flow_thread.started.connect(self._flow_worker.run)
+        self._flow_worker.cached.connect(self._on_flow_cached)
         self._flow_worker.finished.connect(self._on_flow_loaded)
+        self._flow_worker.stats.connect(lambda text: self._log(f"Flow/PT fetch: {text}"))
+        self._flow_worker.stale.connect(lambda text: self._log(f"Flow/PT unavailable, keeping cached data: {text}"))
         self._flow_worker.failed.connect(self._on_flow_failed)
 
         # Ensure cleanup
@@ -596,32 +1040,114 @@ class MainWindow(QMainWindow):
         self._flow_thread.finished.connect(self._flow_worker.deleteLater)
         self._flow_thread.finished.connect(self._flow_thread.deleteLater)
 
+        self._flow_cached_text = None
         self._load_flow_btn_state(True)
         self._flow_thread.start()
 
 
     def _load_flow_btn_state(self, busy: bool) -> None:
         self.load_flow_btn.setEnabled(not busy)
-        self.load_flow_btn.setText("Loading..." if busy else "Load Seq/Shots from Flow/PT")
+        self.load_flow_btn.setText("Loading..." if busy else self._flow_btn_text())
+
+    def _flow_btn_text(self) -> str:
+        return "Load Assets from Flow/PT" if self._state.mode == "assets" else "Load Seq/Shots from Flow/PT"
+
+    def _flow_what(self) -> str:
+        return "assets" if self._flow_mode == "assets" else "sequences/shots"
+
+    def _flow_target(self) -> tuple[QTextEdit, Callable[[dict], str]]:
+        from builder.util.format_input import format_assets_text, format_seq_shots_text
+
+        if self._flow_mode == "assets":
+            return self.assets_edit, format_assets_text
+        return self.seq_shot_edit, format_seq_shots_text
 
 
+    def _on_flow_cached(self, data: dict) -> None:
+        if not data:
+            return
+        # Show the cached copy right away; the background sync may replace it.
+        edit, fmt = self._flow_target()
+        self._flow_cached_text = fmt(data)
+        edit.setPlainText(self._flow_cached_text)
+        self._invalidate_plan()
+        self._log(f"Loaded from local Flow/PT cache: {len(data)} group(s). Refreshing in the background...")
+
     def _on_flow_loaded(self, data: dict) -> None:
         self._load_flow_btn_state(False)
+        cached_text, self._flow_cached_text = self._flow_cached_text, None
 
         if not data:
-            self._log("Flow/PT returned no sequences/shots (check project_id or permissions).")
+            self._log(f"Flow/PT returned no {self._flow_what()} (check project_id or permissions).")
             return
 
         # Fill the text box with formatted output
-        text = format_seq_shots_text(data)
-        self.seq_shot_edit.setPlainText(text)
+        edit, fmt = self._flow_target()
+        text = fmt(data)
+        if cached_text is not None:
+            if text == cached_text:
+                self._log("Flow/PT refresh finished: cached data is up to date.")
+                return
+            if edit.toPlainText() != cached_text:
+                self._log("Flow/PT refresh finished with changes, but the input box was edited; kept your edits.")
+                return
+        edit.setPlainText(text)
 
         # Invalidate plan; user should preview again
         self._invalidate_plan()
-        self._log(f"Loaded from Flow/PT: {len(data)} sequence(s). Click Preview Plan.")
+        what = "categories" if self._flow_mode == "assets" else "sequence(s)"
+        self._log(f"Loaded from Flow/PT: {len(data)} {what}. Click Preview Plan.")
 
 
     def _on_flow_failed(self, msg: str) -> None:
         self._load_flow_btn_state(False)
+        self._flow_cached_text = None
         QMessageBox.warning(self, "Flow/PT Load Failed", msg)
         self._log(f"Flow/PT load failed: {msg}")
+
+    def _on_save_snapshot(self) -> None:
+        from builder.core.flow_snapshot import write_snapshot
+        from builder.integrations.flow_cache import FlowCache
+        from builder.integrations.flow_config import load_flow_credentials
+
+        try:
+            creds = load_flow_credentials()
+            snap = FlowCache(user_cache_dir() / "flow").load(creds).to_snapshot(creds.url)
+        except ValueError as exc:
+            QMessageBox.warning(self, "Save Snapshot", str(exc))
+            return
+
+        default_path = str(Path.cwd() / f"flow_snapshot_{creds.project_id}.json")
+        path_str, _ = QFileDialog.getSaveFileName(self, "Save Flow/PT Snapshot", default_path, "JSON Files (*.json)")
+        if not path_str:
+            return
+        try:
+            write_snapshot(Path(path_str), snap)
+        except Exception as exc:
+            QMessageBox.warning(self, "Save Snapshot Failed", str(exc))
+            return
+        self._log(f"Flow/PT snapshot saved: {path_str} (synced {snap.created_at})")
+
+    def _on_load_snapshot(self) -> None:
+        path_str, _ = QFileDialog.getOpenFileName(self, "Load Flow/PT Snapshot", "", "JSON Files (*.json)")
+        if not path_str:
+            return
+        from builder.core.flow_snapshot import SnapshotError, read_snapshot
+        from builder.util.format_input import format_assets_text, format_seq_shots_text
+
+        try:
+            snap = read_snapshot(Path(path_str))
+        except SnapshotError as exc:
+            QMessageBox.warning(self, "Load Snapshot Failed", str(exc))
+            return
+
+        if self._state.mode == "assets":
+            self.assets_edit.setPlainText(format_assets_text(snap.assets))
+        else:
+            self.seq_shot_edit.setPlainText(format_seq_shots_text(snap.sequences))
+        self._invalidate_plan()
+
+        hours = snap.age().total_seconds() / 3600
+        self._log(f"Loaded Flow/PT snapshot {Path(path_str).name} (project {snap.project_id}, {hours:.1f}h old).")
+        if not snap.is_fresh(SNAPSHOT_WARN_AGE):
+            self._log("Warning: snapshot is more than a day old; load from Flow/PT for current data.")
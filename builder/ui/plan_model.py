@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Sequence
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+
+from builder.core.plan_tree import ROOT, PlanTree
+from builder.models import PlanAction, PlanActionType
+
+Index = QModelIndex | QPersistentModelIndex
+
+
+class PlanTreeModel(QAbstractItemModel):
+    """
+    Read-only tree model over a plan.
+
+    Children are handed to the view in batches as folders are expanded
+    (canFetchMore/fetchMore), and only visible rows are ever rendered, so a
+    100k-action plan costs a PlanTree index, not 100k widgets or text lines.
+    Filtering swaps the visible node set and resets the model.
+    """
+
+    BATCH = 500
+    COLUMNS = ("Path", "Type")
+
+    def __init__(self, parent: Any = None) -> None:
+        super().__init__(parent)
+        self._tree: PlanTree | None = None
+        self._visible: set[int] | None = None
+        self._kids: dict[int, list[int]] = {}
+        self._rows: dict[int, int] = {}      # node -> row under its parent
+        self._loaded: dict[int, int] = {}    # node -> children handed to the view
+
+    # ---------------- Content ----------------
+
+    def set_plan(self, actions: Sequence[PlanAction], base: Path | None = None) -> None:
+        self.set_tree(PlanTree(actions, base) if actions else None)
+
+    def set_tree(self, tree: PlanTree | None) -> None:
+        # trees can be built off the GUI thread (see PlanResponse)
+        self.beginResetModel()
+        self._tree = tree
+        self._visible = None
+        self._clear_caches()
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_plan([])
+
+    def set_filter(self, text: str) -> None:
+        self.beginResetModel()
+        self._visible = self._tree.filter(text) if self._tree is not None else None
+        self._clear_caches()
+        self.endResetModel()
+
+    def visible_count(self) -> int:
+        if self._tree is None:
+            return 0
+        return len(self._tree) if self._visible is None else len(self._visible)
+
+    # ---------------- QAbstractItemModel ----------------
+
+    def index(self, row: int, column: int, parent: Index = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        kids = self._children(node)
+        if not 0 <= row < self._loaded.get(node, 0) or not 0 <= column < len(self.COLUMNS):
+            return QModelIndex()
+        return self.createIndex(row, column, kids[row])
+
+    def parent(self, index: Index = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid() or self._tree is None:
+            return QModelIndex()
+        parent = self._tree.parent(index.internalId())
+        if parent == ROOT:
+            return QModelIndex()
+        self._children(self._tree.parent(parent))  # fills _rows for parent's siblings
+        return self.createIndex(self._rows[parent], 0, parent)
+
+    def rowCount(self, parent: Index = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return self._loaded.get(self._node(parent), 0)
+
+    def columnCount(self, parent: Index = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent: Index = QModelIndex()) -> bool:
+        if parent.column() > 0:
+            return False
+        return bool(self._children(self._node(parent)))
+
+    def canFetchMore(self, parent: Index) -> bool:
+        node = self._node(parent)
+        return self._loaded.get(node, 0) < len(self._children(node))
+
+    def fetchMore(self, parent: Index) -> None:
+        node = self._node(parent)
+        loaded = self._loaded.get(node, 0)
+        count = min(self.BATCH, len(self._children(node)) - loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, loaded, loaded + count - 1)
+        self._loaded[node] = loaded + count
+        self.endInsertRows()
+
+    def data(self, index: Index, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or self._tree is None:
+            return None
+        node = index.internalId()
+        action = self._tree.actions[node]
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return self._tree.label(node)
+            return "folder" if action.type == PlanActionType.DIR else "file"
+        if role == Qt.ToolTipRole:
+            return action.path.as_posix()
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    # ---------------- Helpers ----------------
+
+    def _node(self, index: Index) -> int:
+        return index.internalId() if index.isValid() else ROOT
+
+    def _children(self, node: int) -> list[int]:
+        kids = self._kids.get(node)
+        if kids is None:
+            if self._tree is None:
+                return []
+            kids = self._tree.children(node)
+            if self._visible is not None:
+                kids = [k for k in kids if k in self._visible]
+            self._kids[node] = kids
+            for row, kid in enumerate(kids):
+                self._rows[kid] = row
+        return kids
+
+    def _clear_caches(self) -> None:
+        self._kids.clear()
+        self._rows.clear()
+        self._loaded.clear()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Dict, Sequence
+
+from builder.util.name_ranges import name_tokens
+
+
+def format_seq_shots_text(data: Dict[str, Sequence[str]]) -> str:
+    """
+    Seq/Shots text box contents for parsed or fetched data; the inverse of
+    parse_sequences_and_shots().
+    """
+    lines: list[str] = []
+    for seq in sorted(data.keys()):
+        shots = data[seq]
+        if not shots:
+            continue
+        lines.append(f"{seq}: {', '.join(name_tokens(shots))}")
+    return "\n".join(lines).strip()
+
+
+def format_assets_text(data: Dict[str, Sequence[str]]) -> str:
+    """
+    Assets text box contents; the inverse of parse_assets().
+    """
+    lines: list[str] = []
+    for category in sorted(data.keys()):
+        names = data[category]
+        if not names:
+            continue
+        lines.append(f"{category}: {', '.join(name_tokens(names))}")
+    return "\n".join(lines).strip()
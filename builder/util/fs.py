@@ -22,3 +22,15 @@ def open_in_file_explorer(path: Path) -> None:
         subprocess.run(["open", str(path)], check=False)
     else:
         subprocess.run(["xdg-open", str(path)], check=False)
+
+
+def user_cache_dir() -> Path:
+    """
+    Per-user cache folder for the tool (kept off shared template/project storage).
+    Windows: %LOCALAPPDATA%/StudioFolderBuilder, elsewhere: $XDG_CACHE_HOME/studio-folder-builder.
+    """
+    if sys.platform.startswith("win"):
+        base = os.getenv("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "StudioFolderBuilder"
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "studio-folder-builder"
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import csv
+import re
+from pathlib import Path
+from typing import IO, Iterable
+
+from builder.util.parse_input import OrderedGroups, ParsedShotInput, parse_shot_lines
+
+_SEQ_HEADERS = ("sequence", "seq", "sequence_code", "sg_sequence")
+_SHOT_HEADERS = ("shot", "shot_code", "code", "name")
+
+# EDL: "001  TAPE  V  C  01:00:00:00 01:00:01:00 ..." starts a new event
+_EDL_EVENT = re.compile(r"^\s*\d{3,}\s+\S")
+_EDL_NAME = re.compile(r"^\s*\*\s*(LOC|FROM CLIP NAME)\s*:\s*(.+?)\s*$", re.IGNORECASE)
+# "SQ010_SH010", "SQ010-SH010", "sq010.sh010a"
+_SEQ_SHOT_NAME = re.compile(r"^([A-Za-z]+\d+)[_\-.]([A-Za-z]*\d+[A-Za-z0-9]*)$")
+
+
+def import_shots_file(path: Path, fmt: str | None = None) -> ParsedShotInput:
+    """
+    Streams a shot list from disk into the same ParsedShotInput the UI parser returns.
+
+    Formats (picked from the suffix unless fmt is given):
+      - "text": same syntax as the Seq/Shots box (.txt and anything unknown)
+      - "csv":  sequence/shot columns (header optional)
+      - "edl":  CMX-style event list; shot names from "* LOC:" or "* FROM CLIP NAME:"
+    Files are read line by line; memory grows with the number of unique shots only.
+    CSV rows and EDL events whose sequence can't be told are not imported;
+    their names are listed in `skipped`.
+    """
+    fmt = (fmt or _format_from_suffix(path)).lower()
+    groups = OrderedGroups()
+    skipped: list[str] = []
+
+    with path.open("r", encoding="utf-8-sig", newline="") as fh:
+        if fmt == "text":
+            return parse_shot_lines(fh, groups)
+        if fmt == "csv":
+            _read_csv(fh, groups, skipped)
+        elif fmt == "edl":
+            _read_edl(fh, groups, skipped)
+        else:
+            raise ValueError(f"Unsupported shot list format: {fmt}")
+
+    return ParsedShotInput(sequences=groups.to_dict(), skipped=skipped)
+
+
+def _format_from_suffix(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in (".csv", ".tsv"):
+        return "csv"
+    if suffix == ".edl":
+        return "edl"
+    return "text"
+
+
+def _read_csv(fh: IO[str], groups: OrderedGroups, skipped: list[str]) -> None:
+    sample = fh.read(4096)
+    fh.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+
+    rows = csv.reader(fh, dialect)
+    first = next(rows, None)
+    if first is None:
+        return
+
+    header = [c.strip().lower() for c in first]
+    seq_col = next((header.index(h) for h in _SEQ_HEADERS if h in header), None)
+    shot_col = next((header.index(h) for h in _SHOT_HEADERS if h in header), None)
+
+    if shot_col is None:
+        # no recognizable header: "sequence, shot" or a single shot column
+        seq_col, shot_col = (0, 1) if len(first) > 1 else (None, 0)
+        _add_csv_row(first, seq_col, shot_col, groups, skipped)
+
+    for row in rows:
+        _add_csv_row(row, seq_col, shot_col, groups, skipped)
+
+
+def _add_csv_row(
+    row: list[str], seq_col: int | None, shot_col: int, groups: OrderedGroups, skipped: list[str]
+) -> None:
+    if shot_col >= len(row):
+        return
+    shot = row[shot_col].strip()
+    if not shot:
+        return
+    seq = row[seq_col].strip() if seq_col is not None and seq_col < len(row) else ""
+    if not seq:
+        split = _split_shot_name(shot)
+        if split is None:
+            skipped.append(shot)
+            return
+        seq, shot = split
+    groups.add(seq, shot)
+
+
+def _read_edl(lines: Iterable[str], groups: OrderedGroups, skipped: list[str]) -> None:
+    # Per event, a LOC marker name wins over the source clip name.
+    loc_name: str | None = None
+    clip_name: str | None = None
+
+    def flush() -> None:
+        name = loc_name or clip_name
+        if name:
+            split = _split_shot_name(name.split()[-1])
+            if split is None:
+                skipped.append(name.split()[-1])
+            else:
+                groups.add(*split)
+
+    for line in lines:
+        if _EDL_EVENT.match(line):
+            flush()
+            loc_name = clip_name = None
+            continue
+        m = _EDL_NAME.match(line)
+        if not m:
+            continue
+        if m.group(1).upper() == "LOC":
+            loc_name = m.group(2)
+        else:
+            clip_name = m.group(2)
+    flush()
+
+
+def _split_shot_name(name: str) -> tuple[str, str] | None:
+    m = _SEQ_SHOT_NAME.match(name)
+    return (m.group(1), m.group(2)) if m else None
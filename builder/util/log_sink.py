@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from pathlib import Path
+from typing import IO
+
+
+class LogSink:
+    """
+    Buffers log lines for a widget that is refreshed on a timer.
+
+    write() is cheap and thread-safe; drain() hands back everything written
+    since the last drain, in one batch. Only the newest max_lines are kept
+    (both for the pending batch and the in-memory history); if spill_path is
+    set, every line is also appended to that file so nothing is lost.
+    """
+
+    def __init__(self, max_lines: int = 5000, spill_path: Path | None = None) -> None:
+        self.max_lines = max_lines
+        self.spill_path = spill_path
+        self._history: deque[str] = deque(maxlen=max_lines)
+        self._pending: deque[str] = deque(maxlen=max_lines)
+        self._dropped = 0   # pending lines pushed out before a drain
+        self._spill: list[str] = []
+        self._fh: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def write(self, msg: str) -> None:
+        lines = msg.split("\n") if "\n" in msg else [msg]
+        with self._lock:
+            overflow = len(self._pending) + len(lines) - self.max_lines
+            if overflow > 0:
+                self._dropped += min(overflow, len(self._pending) + len(lines))
+            self._pending.extend(lines)
+            self._history.extend(lines)
+            if self.spill_path is not None:
+                self._spill.extend(lines)
+
+    def drain(self) -> list[str]:
+        """
+        Lines written since the last drain (oldest first). If more than
+        max_lines arrived in between, a marker line says how many were skipped.
+        """
+        with self._lock:
+            out = list(self._pending)
+            self._pending.clear()
+            if self._dropped:
+                out.insert(0, f"... {self._dropped} line(s) not shown" + (f" (see {self.spill_path})" if self.spill_path else ""))
+                self._dropped = 0
+            spill, self._spill = self._spill, []
+        if spill:
+            self._write_spill(spill)
+        return out
+
+    def history(self) -> list[str]:
+        with self._lock:
+            return list(self._history)
+
+    def close(self) -> None:
+        self.drain()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _write_spill(self, lines: list[str]) -> None:
+        try:
+            if self._fh is None:
+                assert self.spill_path is not None
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.spill_path.open("a", encoding="utf-8")
+            self._fh.write("\n".join(lines) + "\n")
+            self._fh.flush()
+        except OSError:
+            # a broken log file must never break the app; keep the in-memory log
+            self.spill_path = None
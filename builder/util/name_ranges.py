@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+# SH010-SH990x10 (prefix repeated on both sides)  |  SH[010-990x10]_suffix
+# "SH010-020" is a plain name, as is anything in double quotes ("SH010-SH020")
+_RANGE = re.compile(r"^(?P<prefix>.*[^0-9])(?P<start>\d+)-(?P=prefix)(?P<stop>\d+)(?:x(?P<step>\d+))?$")
+_PATTERN = re.compile(r"^(?P<prefix>[^\[\]]*)\[(?P<start>\d+)-(?P<stop>\d+)(?:x(?P<step>\d+))?\](?P<suffix>[^\[\]]*)$")
+
+# largest range a single token may expand to
+MAX_RANGE_NAMES = 1_000_000
+
+
+class RangeTooLargeError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class NameRange(Sequence):
+    """
+    Zero-padded numeric name range, e.g. SH010..SH990 step 10.
+    Behaves like a read-only sequence of names but is never materialized.
+    """
+    prefix: str
+    start: int
+    stop: int       # inclusive, always start + k * step
+    step: int = 1
+    width: int = 0  # zero padding of the number
+    suffix: str = ""
+
+    def __len__(self) -> int:
+        return (self.stop - self.start) // self.step + 1
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("NameRange index out of range")
+        return self._name(self.start + index * self.step)
+
+    def __iter__(self) -> Iterator[str]:
+        for num in range(self.start, self.stop + 1, self.step):
+            yield self._name(num)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str) or not name.startswith(self.prefix) or not name.endswith(self.suffix):
+            return False
+        digits = name[len(self.prefix):len(name) - len(self.suffix)]
+        if not digits.isdigit():
+            return False
+        num = int(digits)
+        if num < self.start or num > self.stop or (num - self.start) % self.step:
+            return False
+        return self._name(num) == name
+
+    def token(self) -> str:
+        step = f"x{self.step}" if self.step != 1 else ""
+        first, last = f"{self.start:0{self.width}d}", f"{self.stop:0{self.width}d}"
+        if self.suffix or not self.prefix or self.prefix[-1].isdigit():
+            return f"{self.prefix}[{first}-{last}{step}]{self.suffix}"
+        return f"{self.prefix}{first}-{self.prefix}{last}{step}"
+
+    def _name(self, num: int) -> str:
+        return f"{self.prefix}{num:0{self.width}d}{self.suffix}"
+
+
+def is_range_token(token: str) -> bool:
+    """
+    True if token uses range syntax (without building or size-checking it).
+    """
+    return "-" in token and bool(_PATTERN.match(token) or _RANGE.match(token))
+
+
+def literal_token(name: str) -> str:
+    """
+    Text token for a plain name: quoted if it would otherwise read as a range.
+    """
+    return f'"{name}"' if is_range_token(name) or name.startswith('"') else name
+
+
+def parse_range_token(token: str) -> NameRange | None:
+    """
+    Returns a NameRange for range/pattern syntax, or None for a plain name.
+    Raises RangeTooLargeError past MAX_RANGE_NAMES names.
+    """
+    if "-" not in token:
+        return None
+    m = _PATTERN.match(token) or _RANGE.match(token)
+    if not m:
+        return None
+
+    start, stop = int(m.group("start")), int(m.group("stop"))
+    step = int(m.group("step") or 1)
+    if step < 1 or stop < start:
+        return None
+    count = (stop - start) // step + 1
+    if count > MAX_RANGE_NAMES:
+        raise RangeTooLargeError(f"range '{token}' expands to {count:,} names (limit {MAX_RANGE_NAMES:,})")
+
+    return NameRange(
+        prefix=m.group("prefix"),
+        start=start,
+        stop=start + (stop - start) // step * step,
+        step=step,
+        width=len(m.group("start")),
+        suffix=m.groupdict().get("suffix") or "",
+    )
+
+
+class NameList(Sequence):
+    """
+    Order-preserving list of unique names where ranges stay compact.
+
+    Plain names and NameRange segments are kept as entered; nothing is
+    expanded until someone iterates (the planner). A range overlapping
+    earlier entries is expanded on insert so every name is listed once.
+    """
+
+    def __init__(self, items: Iterable[str] = ()) -> None:
+        self._segments: list[str | NameRange] = []
+        self._names: set[str] = set()
+        self._ranges: list[NameRange] = []
+        self._by_prefix: dict[str, list[NameRange]] = {}  # lookups only try prefixes a name has
+        self._offsets: list[int] | None = None
+        self._len = 0
+        for item in items:
+            self.add(item)
+
+    @property
+    def has_ranges(self) -> bool:
+        return bool(self._ranges)
+
+    def add(self, name: str) -> None:
+        if name in self:
+            return
+        self._names.add(name)
+        self._segments.append(name)
+        self._len += 1
+        self._offsets = None
+
+    def add_range(self, rng: NameRange) -> None:
+        # scan whichever side is smaller: the range or the plain names
+        if len(rng) <= len(self._names):
+            clash = any(n in self._names for n in rng)
+        else:
+            clash = any(n in rng for n in self._names)
+        if clash or any(_overlaps(rng, other) for other in self._ranges):
+            for name in rng:
+                self.add(name)
+            return
+        self._ranges.append(rng)
+        self._by_prefix.setdefault(rng.prefix, []).append(rng)
+        self._segments.append(rng)
+        self._len += len(rng)
+        self._offsets = None
+
+    def add_token(self, token: str) -> None:
+        if len(token) > 1 and token[0] == token[-1] == '"':
+            self.add(token[1:-1])
+            return
+        rng = parse_range_token(token)
+        if rng is None:
+            self.add(token)
+        else:
+            self.add_range(rng)
+
+    def tokens(self) -> list[str]:
+        """
+        Compact form for text boxes (ranges as tokens, range-like names quoted).
+        """
+        return [literal_token(s) if isinstance(s, str) else s.token() for s in self._segments]
+
+    def json_items(self) -> list[str | dict[str, str]]:
+        """
+        Compact form for JSON: names stay strings, ranges become {"range": token}.
+        """
+        return [s if isinstance(s, str) else {"range": s.token()} for s in self._segments]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        for seg in self._segments:
+            if isinstance(seg, str):
+                yield seg
+            else:
+                yield from seg
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._names:
+            return True
+        if not self._ranges or not isinstance(name, str):
+            return False
+        # a range's prefix always ends where the name's digits start
+        for i, ch in enumerate(name):
+            if ch.isdigit():
+                for r in self._by_prefix.get(name[:i], ()):
+                    if name in r:
+                        return True
+        return False
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("NameList index out of range")
+        if self._offsets is None:
+            offsets, total = [], 0
+            for seg in self._segments:
+                offsets.append(total)
+                total += 1 if isinstance(seg, str) else len(seg)
+            self._offsets = offsets
+        i = bisect_right(self._offsets, index) - 1
+        seg = self._segments[i]
+        return seg if isinstance(seg, str) else seg[index - self._offsets[i]]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (NameList, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"NameList({self.tokens()!r})"
+
+
+def name_tokens(names: Sequence[str]) -> list[str]:
+    """
+    Compact token list for any shot/asset name sequence.
+    """
+    return names.tokens() if isinstance(names, NameList) else [literal_token(n) for n in names]
+
+
+def expand_tokens(tokens: Iterable[str]) -> list[str] | NameList:
+    """
+    Inverse of name_tokens(): plain lists stay lists, range tokens become a NameList.
+    """
+    out = NameList()
+    for token in tokens:
+        out.add_token(str(token))
+    return out if out.has_ranges else list(out)
+
+
+def names_from_json(items: Iterable[Any]) -> list[str] | NameList:
+    """
+    Inverse of NameList.json_items(): strings are always plain names, only
+    {"range": token} items are ranges. Raises ValueError for a bad range.
+    """
+    out = NameList()
+    for item in items:
+        if not isinstance(item, dict):
+            out.add(str(item))
+            continue
+        rng = parse_range_token(str(item.get("range", "")))
+        if rng is None:
+            raise ValueError(f"invalid range item: {item!r}")
+        out.add_range(rng)
+    return out if out.has_ranges else list(out)
+
+
+def json_default(obj: Any) -> Any:
+    """
+    json.dumps(default=...) hook so NameList values are written compactly.
+    """
+    if isinstance(obj, NameList):
+        return obj.json_items()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _overlaps(a: NameRange, b: NameRange) -> bool:
+    """
+    True if the two ranges share a name, decided from their fixed parts and
+    bounds; names are only enumerated when the prefixes or suffixes differ
+    yet one extends the other (e.g. SH[0-999] vs SH1[00-99]).
+    """
+    if a.prefix == b.prefix and a.suffix == b.suffix:
+        lo, hi = max(a.start, b.start), min(a.stop, b.stop)
+        if a.width != b.width:
+            # SH010 vs SH0010: one number is spelled alike only once it outgrows both paddings
+            lo = max(lo, 10 ** (max(a.width, b.width) - 1))
+        if lo > hi:
+            return False
+        # first member of a at or above lo, then one period of b's step
+        n = a.start + -(-(lo - a.start) // a.step) * a.step
+        for _ in range(b.step // math.gcd(a.step, b.step)):
+            if n > hi:
+                return False
+            if (n - b.start) % b.step == 0:
+                return True
+            n += a.step
+        return False
+
+    # every name starts with its prefix and ends with its suffix
+    if not (a.prefix.startswith(b.prefix) or b.prefix.startswith(a.prefix)):
+        return False
+    if not (a.suffix.endswith(b.suffix) or b.suffix.endswith(a.suffix)):
+        return False
+    small, big = (a, b) if len(a) <= len(b) else (b, a)
+    return any(name in big for name in small)
@@ -2,19 +2,21 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+from builder.util.parse_input import OrderedGroups
 
 
 @dataclass(frozen=True)
 class ParsedAssetInput:
-    assets: Dict[str, List[str]]  # category -> [asset_names]
+    assets: Dict[str, Sequence[str]]  # category -> [asset_names] (a NameList if ranges were used)
 
 
 _CAT_LINE = re.compile(r"^\s*([A-Za-z0-9_\-]+)\s*:\s*(.+?)\s*$")
 
 
 def parse_assets(text: str) -> ParsedAssetInput:
-    assets: Dict[str, List[str]] = {}
+    groups = OrderedGroups()
     current_cat: str | None = None
 
     lines = [ln.rstrip() for ln in (text or "").splitlines() if ln.strip()]
@@ -23,32 +25,20 @@ def parse_assets(text: str) -> ParsedAssetInput:
         m = _CAT_LINE.match(line)
         if m:
             cat = m.group(1).strip()
-            items = _split_tokens(m.group(2).strip())
-            assets.setdefault(cat, [])
-            _extend_unique(assets[cat], items)
+            groups.extend(cat, _split_tokens(m.group(2).strip()))
             current_cat = cat
             continue
 
         if current_cat is None:
             cat = line.strip()
-            assets.setdefault(cat, [])
+            groups.ensure(cat)
             current_cat = cat
         else:
-            item = line.strip()
-            _extend_unique(assets[current_cat], [item])
+            groups.add_token(current_cat, line.strip())
 
-    assets = {k: v for k, v in assets.items() if k and v}
-    return ParsedAssetInput(assets=assets)
+    return ParsedAssetInput(assets=groups.to_dict())
 
 
 def _split_tokens(s: str) -> List[str]:
     raw = re.split(r"[,\s]+", s.strip())
     return [t for t in (x.strip() for x in raw) if t]
-
-
-def _extend_unique(dst: List[str], items: List[str]) -> None:
-    seen = set(dst)
-    for it in items:
-        if it not in seen:
-            dst.append(it)
-            seen.add(it)
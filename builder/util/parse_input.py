@@ -1,18 +1,56 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence
+
+from builder.util.name_ranges import NameList
 
 
 @dataclass(frozen=True)
 class ParsedShotInput:
-    sequences: Dict[str, List[str]]  # seq -> [shots]
+    sequences: Dict[str, Sequence[str]]  # seq -> [shots] (a NameList if ranges were used)
+    skipped: List[str] = field(default_factory=list)  # imported names with no sequence
 
 
 _SEQ_LINE = re.compile(r"^\s*([A-Za-z0-9_\-]+)\s*:\s*(.+?)\s*$")
 
 
+class OrderedGroups:
+    """
+    Order-preserving group -> unique items mapping.
+
+    Each group is a NameList, so its dedupe set lives for the whole parse
+    (adding n items costs O(n) in total) and range tokens stay unexpanded.
+    """
+
+    def __init__(self) -> None:
+        self.groups: Dict[str, NameList] = {}
+
+    def ensure(self, group: str) -> NameList:
+        names = self.groups.get(group)
+        if names is None:
+            names = self.groups[group] = NameList()
+        return names
+
+    def add(self, group: str, item: str) -> None:
+        # literal name (e.g. from a file); never treated as a range
+        self.ensure(group).add(item)
+
+    def add_token(self, group: str, token: str) -> None:
+        # user input: "SH010-SH090x10" style tokens become ranges
+        self.ensure(group).add_token(token)
+
+    def extend(self, group: str, tokens: Iterable[str]) -> None:
+        names = self.ensure(group)
+        for token in tokens:
+            names.add_token(token)
+
+    def to_dict(self) -> Dict[str, Sequence[str]]:
+        # prune empty; plain lists unless a group actually holds ranges
+        return {k: (v if v.has_ranges else list(v)) for k, v in self.groups.items() if k and v}
+
+
 def parse_sequences_and_shots(text: str) -> ParsedShotInput:
     """
     Parses a multiline sequences/shots input.
@@ -20,22 +58,33 @@ def parse_sequences_and_shots(text: str) -> ParsedShotInput:
     Supported formats:
       1) "SQ010: SH010, SH020"
       2) "SQ010" then indented shot lines below it
+      3) ranges: "SQ010: SH010-SH990x10" or "SQ010: SH[010-990x10]_bg"
+
+    Ranges are kept as NameRange objects (see name_ranges) until iterated.
 
     Returns dict with unique, order-preserved shots per sequence.
     """
-    sequences: Dict[str, List[str]] = {}
+    return parse_shot_lines((text or "").splitlines())
+
+
+def parse_shot_lines(lines: Iterable[str], groups: OrderedGroups | None = None) -> ParsedShotInput:
+    """
+    Same as parse_sequences_and_shots(), but consumes lines one at a time
+    (e.g. straight from an open file) in linear time.
+    """
+    groups = groups if groups is not None else OrderedGroups()
     current_seq: str | None = None
 
-    lines = [ln.rstrip() for ln in (text or "").splitlines() if ln.strip()]
+    for raw in lines:
+        if not raw.strip():
+            continue
+        line = raw.rstrip()
 
-    for line in lines:
         m = _SEQ_LINE.match(line)
         if m:
             seq = m.group(1).strip()
             shots_part = m.group(2).strip()
-            shots = _split_tokens(shots_part)
-            sequences.setdefault(seq, [])
-            _extend_unique(sequences[seq], shots)
+            groups.extend(seq, _split_tokens(shots_part))
             current_seq = seq
             continue
 
@@ -43,27 +92,16 @@ def parse_sequences_and_shots(text: str) -> ParsedShotInput:
         if current_seq is None:
             # assume this is a sequence line
             seq = line.strip()
-            sequences.setdefault(seq, [])
+            groups.ensure(seq)
             current_seq = seq
         else:
             # treat as shot line under current_seq
-            shot = line.strip()
-            _extend_unique(sequences[current_seq], [shot])
+            groups.add_token(current_seq, line.strip())
 
-    # prune empty
-    sequences = {k: v for k, v in sequences.items() if k and v}
-    return ParsedShotInput(sequences=sequences)
+    return ParsedShotInput(sequences=groups.to_dict())
 
 
 def _split_tokens(s: str) -> List[str]:
     # Split by comma or whitespace, preserve order, remove empties
     raw = re.split(r"[,\s]+", s.strip())
     return [t for t in (x.strip() for x in raw) if t]
-
-
-def _extend_unique(dst: List[str], items: List[str]) -> None:
-    seen = set(dst)
-    for it in items:
-        if it not in seen:
-            dst.append(it)
-            seen.add(it)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+class StartupProfile:
+    """
+    Wall-clock marks from process start to the first shown window.
+
+    The clock starts when this module is imported, so import it before
+    anything heavy (see main.py / builder.app). Each mark records the time
+    since the previous one, e.g. "import Qt", "import app", "window built".
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._t0 = clock()
+        self._last = self._t0
+        self.marks: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> float:
+        now = self._clock()
+        self.marks.append((phase, now - self._last))
+        self._last = now
+        return now - self._t0
+
+    @property
+    def total(self) -> float:
+        return self._last - self._t0
+
+    def pretty(self) -> str:
+        phases = ", ".join(f"{name} {secs * 1000:.0f} ms" for name, secs in self.marks)
+        return f"Startup: {self.total * 1000:.0f} ms ({phases})"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": round(self.total * 1000, 1),
+            "phases": [{"phase": name, "ms": round(secs * 1000, 1)} for name, secs in self.marks],
+            "modules": len(sys.modules),
+        }
+
+    def write_report(self, target: str) -> None:
+        """
+        target "1"/"stderr" prints the summary; anything else is a JSON file path.
+        """
+        if target.lower() in ("1", "true", "stderr"):
+            print(self.pretty(), file=sys.stderr)
+            return
+        path = Path(target)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+
+PROFILE = StartupProfile()
@@ -0,0 +1,141 @@
+"""
+Opt-in timeline tracing, exported as Chrome trace JSON (chrome://tracing,
+https://ui.perfetto.dev).
+
+    with span("plan.shots", shots=120):
+        ...
+
+Tracing is off unless enable() is called (the CLI's --trace, or the
+SFB_TRACE environment variable for the app). While it is off, span()
+returns a shared no-op context manager, so instrumented code pays one
+global lookup per span. Spans are coarse (phases, pages), never per action.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+ENV_VAR = "SFB_TRACE"
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self._t0 = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._threads: dict[int, str] = {}
+        self.events: list[dict[str, Any]] = []   # list.append is atomic; no lock needed
+
+    def now_us(self) -> float:
+        return (time.perf_counter_ns() - self._t0) / 1000
+
+    def add(self, name: str, start_us: float, args: dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident or 0, thread.name)
+        event = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": round(start_us, 3),
+            "dur": round(self.now_us() - start_us, 3),
+            "pid": self._pid,
+            "tid": thread.ident or 0,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def to_dict(self) -> dict[str, Any]:
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.items()
+        ]
+        return {"traceEvents": meta + sorted(self.events, key=lambda e: e["ts"]), "displayTimeUnit": "ms"}
+
+    def export(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+        return path
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_args", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self) -> _Span:
+        self._start = self._tracer.now_us()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.add(self._name, self._start, self._args)
+
+    def set(self, **args: Any) -> None:
+        """
+        Attach values known only at the end of the span (row counts etc.).
+        """
+        self._args.update(args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL = _NullSpan()
+_tracer: Tracer | None = None
+
+
+def span(name: str, **args: Any) -> _Span | _NullSpan:
+    tracer = _tracer
+    if tracer is None:
+        return _NULL
+    return _Span(tracer, name, args)
+
+
+def enable() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable() -> Tracer | None:
+    """
+    Stops tracing and hands back the tracer (for export), if there was one.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def enable_from_env() -> Path | None:
+    """
+    Turns tracing on if SFB_TRACE names an output file; returns that path.
+    """
+    target = os.getenv(ENV_VAR)
+    if not target:
+        return None
+    enable()
+    return Path(target)
@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+from builder.cli import DEFAULT_TEMPLATES_DIR, main
+from builder.core.batch import find_job_configs, run_batch
+from builder.core.filesystem import FlakyFileSystem, LocalFileSystem
+from builder.core.job_config import make_job_config, write_job_config
+from builder.models import PlanActionType
+
+
+def _job(path: Path, root: Path, project: str, sequences: dict) -> Path:
+    cfg = make_job_config(
+        root=root,
+        project=project,
+        template_id="vfx_default",
+        mode="shots",
+        overwrite=False,
+        sequences=sequences,
+        assets=None,
+    )
+    return write_job_config(path, cfg)
+
+
+def test_batch_dedupes_shared_dirs_and_writes_a_manifest_per_job(tmp_path):
+    jobs = tmp_path / "jobs"
+    jobs.mkdir()
+    _job(jobs / "ep01_job_config.json", tmp_path, "Show", {"SQ010": ["SH010", "SH020"]})
+    _job(jobs / "ep02_job_config.json", tmp_path, "Show", {"SQ020": ["SH010"]})
+    _job(jobs / "other_job_config.json", tmp_path, "Other", {"SQ010": ["SH010"]})
+    (jobs / "broken_job_config.json").write_text("{", encoding="utf-8")
+
+    configs = find_job_configs([jobs, jobs / "ep01_job_config.json"])
+    assert len(configs) == 4
+
+    report = run_batch(configs, DEFAULT_TEMPLATES_DIR, workers=1, per_root=2)
+    by_name = {Path(j.config_path).name: j for j in report.jobs}
+
+    assert not report.ok
+    assert by_name["broken_job_config.json"].error
+    ep01, ep02, other = by_name["ep01_job_config.json"], by_name["ep02_job_config.json"], by_name["other_job_config.json"]
+    assert ep01.shared == 0 and ep02.shared > 0 and other.shared == 0
+    assert ep02.result is not None and ep02.result.errors == 0
+    assert (tmp_path / "Show" / "sequences" / "SQ020" / "SH010").is_dir()
+
+    # two jobs in one project folder must not overwrite each other's manifest
+    manifests = {ep01.manifest, ep02.manifest, other.manifest}
+    assert len(manifests) == 3 and all(Path(m).is_file() for m in manifests)
+    rec = json.loads(Path(ep02.manifest).read_text(encoding="utf-8"))
+    assert rec["results"]["skipped"] >= ep02.shared
+
+
+def test_batch_cli_dry_run_writes_summary(tmp_path, capsys):
+    config = _job(tmp_path / "job_config.json", tmp_path, "P", {"SQ010": ["SH010"]})
+    summary_path = tmp_path / "out" / "summary.json"
+
+    assert main(["batch", str(config), "--dry-run", "--workers", "1", "--summary", str(summary_path)]) == 0
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["dry_run"] and summary["jobs"][0]["planned"] > 0
+    assert not (tmp_path / "P").exists()
+    assert "1 job(s), 0 failed" in capsys.readouterr().out
+    assert main(["batch", str(tmp_path / "missing")]) == 2
+
+
+def test_each_batch_sees_current_templates_and_literal_names(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    template = {"name": "Mini", "version": "1.0", "project_folders": [], "shot_tree": {"work": []}, "asset_tree": {}}
+    (templates / "mini.json").write_text(json.dumps(template), encoding="utf-8")
+    config = make_job_config(
+        root=tmp_path, project="Show", template_id="mini", mode="shots", overwrite=False,
+        sequences={"SQ010": ["SH010 A", "SH020,B"]}, assets=None,
+    )
+    path = write_job_config(tmp_path / "job_config.json", config)
+
+    first = run_batch([path], templates, workers=1, dry_run=True)
+    template["shot_tree"]["comp"] = []
+    (templates / "mini.json").write_text(json.dumps(template), encoding="utf-8")
+    second = run_batch([path], templates, workers=1)
+
+    assert first.jobs[0].planned + 2 == second.jobs[0].planned  # one comp folder per shot
+    assert second.ok
+    for shot in ("SH010 A", "SH020,B"):
+        assert (tmp_path / "Show" / "sequences" / "SQ010" / shot / "comp").is_dir()
+
+
+def test_jobs_in_one_project_run_in_order_and_retry_failed_shared_dirs(tmp_path):
+    a = _job(tmp_path / "a_job_config.json", tmp_path, "Show", {"SQ010": ["SH010"]})
+    b = _job(tmp_path / "b_job_config.json", tmp_path, "Show", {"SQ010": ["SH010", "SH020"]})
+    fs = FlakyFileSystem(LocalFileSystem(), fail_next=1)  # a's first folder fails
+
+    report = run_batch([a, b], DEFAULT_TEMPLATES_DIR, workers=1, per_root=2, fs=fs)
+    ja, jb = report.jobs
+
+    # a always runs first, so it creates every file and b finds them
+    a_files = sum(1 for o in ja.result.outcomes if o.action.type != PlanActionType.DIR)
+    assert ja.shared == 0 and ja.result.errors == 1
+    assert ja.result.created_files == a_files
+    assert sum(1 for o in jb.result.outcomes if o.action.type != PlanActionType.DIR and o.status == "skipped") == a_files
+    # b retries the folder a failed to create instead of recording it as shared
+    failed = next(o.action.path for o in ja.result.outcomes if o.status == "error")
+    retried = next(o for o in jb.result.outcomes if o.action.path == failed)
+    assert retried.status != "error" and retried.message != "Shared with another job in the batch"
+    a_dirs = sum(1 for o in ja.result.outcomes if o.action.type == PlanActionType.DIR)
+    assert jb.shared == a_dirs - 1
+    assert jb.result.errors == 0
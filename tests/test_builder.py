@@ -54,3 +54,22 @@ def test_builder_overwrites_when_enabled(tmp_path: Path):
     assert result.created_files == 1
     assert result.skipped == 0
     assert result.errors == 0
+
+
+def test_builder_reports_progress_and_stops_when_cancelled(tmp_path: Path):
+    plan = [PlanAction(PlanActionType.DIR, tmp_path / f"D{i:03d}") for i in range(50)]
+    reports = []
+
+    builder = PlanBuilder(progress_interval=0.0)
+    result = builder.execute(
+        plan,
+        progress=reports.append,
+        should_cancel=lambda: len(reports) >= 10,
+    )
+
+    assert result.cancelled
+    assert result.created_dirs == len(result.outcomes) == 10
+    assert result.pending == 40
+    assert not (tmp_path / "D010").exists()
+    assert reports[-1].done == 10 and reports[-1].total == 50
+    assert all(a.done <= b.done for a, b in zip(reports, reports[1:]))
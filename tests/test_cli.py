@@ -0,0 +1,85 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from builder.cli import main
+from builder.core.job_config import make_job_config, write_job_config
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_build_from_job_config_writes_folders_and_manifest(tmp_path, capsys):
+    cfg = make_job_config(
+        root=tmp_path,
+        project="MyShow",
+        template_id="vfx_default",
+        mode="shots",
+        overwrite=False,
+        sequences={"SQ010": ["SH010", "SH020"]},
+        assets=None,
+    )
+    config_path = write_job_config(tmp_path / "job_config.json", cfg)
+
+    assert main(["build", "--config", str(config_path), "--json"]) == 0
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["results"]["errors"] == 0
+    assert (tmp_path / "MyShow" / "sequences" / "SQ010" / "SH020").is_dir()
+    assert Path(summary["manifest"]).is_file()
+
+
+def test_dry_run_and_usage_errors(tmp_path, capsys):
+    argv = ["build", "--root", str(tmp_path), "--project", "P", "--template", "vfx_default"]
+
+    assert main(argv + ["--assets", "props: Crate01-Crate03", "--dry-run"]) == 0
+    assert "Categories: 1 | Assets: 3" in capsys.readouterr().out
+    assert not (tmp_path / "P").exists()
+
+    assert main(argv) == 2  # no input
+    assert main(argv[:5] + ["--template", "nope", "--shots", "SQ010: SH010"]) == 2
+    assert "not found" in capsys.readouterr().err
+
+
+def test_validate_templates_exit_code(tmp_path):
+    (tmp_path / "bad.json").write_text('{"name": "Bad"}', encoding="utf-8")
+
+    assert main(["validate-templates", "--workers", "1"]) == 0
+    assert main(["validate-templates", "--templates-dir", str(tmp_path), "--workers", "1"]) == 1
+
+
+def test_cli_never_imports_qt(tmp_path):
+    probe = (
+        "import sys; from builder.cli import main; "
+        f"main(['build', '--root', {str(tmp_path)!r}, '--project', 'P', '--template', 'vfx_default', "
+        "'--shots', 'SQ010: SH010', '--no-manifest']); "
+        "print(sorted(m for m in sys.modules if m.startswith(('PySide6', 'builder.ui', 'builder.integrations'))))"
+    )
+    proc = subprocess.run([sys.executable, "-c", probe], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    assert proc.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_config_and_shot_file_names_are_planned_literally(tmp_path, capsys):
+    cfg = make_job_config(
+        root=tmp_path,
+        project="MyShow",
+        template_id="vfx_default",
+        mode="shots",
+        overwrite=False,
+        sequences={"SQ010": ["SH010 A", "SH020,B", "SH030-SH040"]},
+        assets=None,
+    )
+    config_path = write_job_config(tmp_path / "job_config.json", cfg)
+    shots_file = tmp_path / "shots.csv"
+    shots_file.write_text("Sequence,Shot\nSQ010,SH010 A\nSQ010,SH030-SH040\n", encoding="utf-8")
+    argv = ["build", "--root", str(tmp_path), "--project", "P", "--template", "vfx_default", "--dry-run", "--list"]
+
+    for extra in (["--config", str(config_path)], ["--shots-file", str(shots_file)]):
+        assert main(argv + extra) == 0
+        out = capsys.readouterr().out
+        # no round trip through the text syntax: spaces, commas and hyphens survive
+        assert "SQ010/SH010 A" in out and "SQ010/SH030-SH040" in out
+        assert "SQ010/SH035" not in out
+    assert main(argv + ["--config", str(config_path)]) == 0
+    assert "SQ010/SH020,B" in capsys.readouterr().out
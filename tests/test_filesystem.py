@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from builder.cli import main
+from builder.core.builder import PlanBuilder
+from builder.core.filesystem import FlakyFileSystem, LocalFileSystem, MemoryFileSystem
+from builder.models import PlanAction, PlanActionType
+
+
+def _plan(root: Path) -> list[PlanAction]:
+    return [
+        PlanAction(PlanActionType.DIR, root / "A"),
+        PlanAction(PlanActionType.DIR, root / "A" / "B"),
+        PlanAction(PlanActionType.DIR, root / "C"),
+        PlanAction(PlanActionType.FILE, root / "A" / "B" / "notes.md"),
+    ]
+
+
+def test_builder_runs_in_memory_without_touching_disk(tmp_path):
+    fs = MemoryFileSystem()
+    result = PlanBuilder(fs=fs).execute(_plan(tmp_path))
+
+    assert (result.created_dirs, result.created_files, result.errors) == (3, 1, 0)
+    assert "Created by Studio Folder Builder" in fs.read_text(tmp_path / "A" / "B" / "notes.md")
+    assert not (tmp_path / "A").exists()
+
+    again = PlanBuilder(fs=fs).execute(_plan(tmp_path))
+    assert again.skipped == 4
+    with pytest.raises(FileNotFoundError):
+        fs.write_text(tmp_path / "missing" / "x.md", "")
+
+
+def test_overlay_sees_existing_disk_state(tmp_path):
+    (tmp_path / "A").mkdir()
+    fs = MemoryFileSystem(base=LocalFileSystem())
+
+    result = PlanBuilder(fs=fs).execute(_plan(tmp_path))
+
+    assert result.skipped == 1 and result.created_dirs == 2
+    assert not (tmp_path / "C").exists()
+
+
+def test_flaky_filesystem_faults_become_error_outcomes(tmp_path):
+    delays = []
+    fs = FlakyFileSystem(MemoryFileSystem(), latency=0.01, fail_paths=((tmp_path / "C").as_posix(),), sleep=delays.append)
+
+    result = PlanBuilder(fs=fs).execute(_plan(tmp_path))
+
+    assert result.errors == fs.failures == 1
+    errors = [o for o in result.outcomes if o.status == "error"]
+    assert errors[0].action.path == tmp_path / "C" and "injected fault" in errors[0].message
+    assert len(delays) == fs.calls > 0
+
+
+def test_cli_dry_run_reports_what_would_be_created(tmp_path, capsys):
+    argv = ["build", "--root", str(tmp_path), "--project", "P", "--template", "vfx_default",
+            "--shots", "SQ010: SH010", "--dry-run", "--json"]
+
+    assert main(argv) == 0
+
+    would = json.loads(capsys.readouterr().out)["would"]
+    assert would["create_dirs"] > 0 and would["create_files"] > 0 and would["errors"] == 0
+    assert not (tmp_path / "P").exists()
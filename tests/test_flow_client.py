@@ -0,0 +1,138 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from builder.integrations.flow_cache import FlowCache
+from builder.integrations.flow_client import FlowClient, FlowCredentials, FlowQueryOptions, format_assets_text
+from builder.integrations.flow_fake import FakeShotgun
+from builder.integrations.flow_pool import FlowConnectionPool
+
+
+CREDS = FlowCredentials(url="https://fake", script_name="test", script_key="key", project_id=1)
+
+
+def test_fetch_groups_shots_by_sequence_across_pages():
+    sg = FakeShotgun.with_show(project_id=1, sequences=3, shots_per_sequence=7)
+    sg.add("Shot", code="SH9999", project={"type": "Project", "id": 1}, sg_sequence=None)
+    sg.add("Shot", code="OTHER", project={"type": "Project", "id": 2}, sg_sequence=None)
+
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool(), page_size=5) as client:
+        data = client.fetch_sequences_and_shots()
+
+    assert sorted(data) == ["SQ010", "SQ020", "SQ030", "UNASSIGNED"]
+    assert data["SQ020"] == [f"SH{n * 10:04d}" for n in range(1, 8)]
+    assert data["UNASSIGNED"] == ["SH9999"]
+    # 22 shots / 5 per page -> 5 pages; sequence codes come with the shots
+    assert sg.calls.count(("find", "Shot")) == 5
+    assert sg.calls.count(("find", "Sequence")) == 0
+
+
+def test_pages_are_fetched_concurrently():
+    latency = 0.05
+    sg = FakeShotgun.with_show(project_id=1, sequences=4, shots_per_sequence=20, latency=latency)
+
+    started = time.perf_counter()
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool(), page_size=10, max_workers=8) as client:
+        data = client.fetch_sequences_and_shots()
+    elapsed = time.perf_counter() - started
+
+    assert sum(len(v) for v in data.values()) == 80
+    serial = len(sg.calls) * latency  # 8 shot pages + 1 count + 1 asset page
+    assert elapsed < serial / 2
+
+
+def test_incremental_sync_fetches_only_changes(tmp_path):
+    sg = FakeShotgun.with_show(project_id=1, sequences=2, shots_per_sequence=3)
+    cache = FlowCache(tmp_path / "flow")
+
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool()) as client:
+        first = client.fetch_sequences_and_shots(cache=cache)
+    assert first["SQ010"] == ["SH0010", "SH0020", "SH0030"]
+
+    # pretend the last sync happened long ago for everything already on the "server"
+    state = cache.load(CREDS)
+    old = datetime.now(timezone.utc) - timedelta(hours=1)
+    for rows in sg.entities.values():
+        for e in rows:
+            e["updated_at"] = old - timedelta(hours=1)
+    state.synced_at = old.isoformat()
+    cache.save(CREDS, state)
+
+    project = {"type": "Project", "id": 1}
+    seq = sg.entities["Sequence"][0]
+    sg.add("Shot", code="SH0040", project=project, sg_sequence={"type": "Sequence", "id": seq["id"]})
+    sg.update("Shot", sg.entities["Shot"][0]["id"], code="SH0015")
+    sg.retire("Shot", sg.entities["Shot"][1]["id"])
+
+    fetched: list[int] = []
+    original_find = sg.find
+
+    def spy_find(entity_type, filters, fields=None, **kwargs):
+        rows = original_find(entity_type, filters, fields, **kwargs)
+        if not kwargs.get("retired_only"):
+            fetched.append(len(rows))
+        return rows
+
+    sg.find = spy_find
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool()) as client:
+        second = client.fetch_sequences_and_shots(cache=FlowCache(tmp_path / "flow"))
+
+    assert second["SQ010"] == ["SH0015", "SH0030", "SH0040"]
+    assert second["SQ020"] == first["SQ020"]
+    assert sum(fetched) == 2  # only the added + the renamed shot came over the wire
+
+
+def test_status_filter_runs_on_server_and_drops_shots_that_change_status(tmp_path):
+    sg = FakeShotgun.with_show(project_id=1, sequences=1, shots_per_sequence=4)
+    for i, shot in enumerate(sg.entities["Shot"]):
+        shot["sg_status_list"] = "ip" if i % 2 == 0 else "omt"
+    cache = FlowCache(tmp_path / "flow")
+    options = FlowQueryOptions(shot_statuses=("ip",))
+
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool(), options=options) as client:
+        first = client.fetch_sequences_and_shots(cache=cache)
+        assert client.last_stats.rows == 2  # filtered before transfer
+        assert client.last_stats.payload_bytes > 0
+
+        sg.update("Shot", sg.entities["Shot"][0]["id"], sg_status_list="omt")
+        second = client.fetch_sequences_and_shots(cache=cache)
+
+    assert first == {"SQ010": ["SH0010", "SH0030"]}
+    assert second == {"SQ010": ["SH0030"]}
+
+    # a different filter invalidates the cached rows
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool()) as client:
+        third = client.fetch_sequences_and_shots(cache=cache)
+    assert third == {"SQ010": ["SH0010", "SH0020", "SH0030", "SH0040"]}
+
+
+def test_assets_grouped_by_type_in_the_same_round_as_shots(tmp_path):
+    sg = FakeShotgun.with_show(project_id=1, sequences=1, shots_per_sequence=2)
+    project = {"type": "Project", "id": 1}
+    sg.add("Asset", code="Hero", sg_asset_type="Character", project=project)
+    sg.add("Asset", code="Villain", sg_asset_type="Character", project=project)
+    sword = sg.add("Asset", code="Sword", sg_asset_type="Prop", project=project)
+    sg.add("Asset", code="Street", sg_asset_type="Set Dressing", project=project)
+    cache = FlowCache(tmp_path / "flow")
+
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool()) as client:
+        assets = client.fetch_assets(cache=cache)
+        assert sorted(sg.calls) == [("find", "Asset"), ("find", "Shot")]
+
+        sg.retire("Asset", sword["id"])
+        assert client.fetch_sequences_and_shots(cache=cache) == {"SQ010": ["SH0010", "SH0020"]}
+
+    assert assets == {"character": ["Hero", "Villain"], "prop": ["Sword"], "set_dressing": ["Street"]}
+    assert cache.load(CREDS).to_assets() == {"character": ["Hero", "Villain"], "set_dressing": ["Street"]}
+    assert format_assets_text(assets).splitlines()[0] == "character: Hero, Villain"
+
+
+def test_flow_options_ignore_a_config_that_is_not_an_object(tmp_path, monkeypatch):
+    from builder.integrations import flow_config
+
+    path = tmp_path / "flow_config.json"
+    path.write_text('["ip", "rdy"]', encoding="utf-8")
+    monkeypatch.setattr(flow_config, "_config_path", lambda: path)
+    monkeypatch.delenv("FLOW_SHOT_STATUSES", raising=False)
+    monkeypatch.delenv("FLOW_STATUS_FIELD", raising=False)
+
+    assert flow_config.load_flow_options() == FlowQueryOptions()
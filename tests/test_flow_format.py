@@ -1,4 +1,4 @@
-from builder.integrations.flow_client import format_seq_shots_text
+from builder.util.format_input import format_seq_shots_text
 
 
 def test_format_seq_shots_text():
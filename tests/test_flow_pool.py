@@ -0,0 +1,86 @@
+from builder.integrations.flow_client import FlowClient, FlowCredentials
+from builder.integrations.flow_fake import FakeShotgun
+from builder.integrations.flow_pool import FlowConnectionPool
+
+
+CREDS = FlowCredentials(url="https://fake", script_name="test", script_key="key", project_id=1)
+
+
+class Conn:
+    def __init__(self, healthy: bool = True) -> None:
+        self.healthy = healthy
+        self.closed = False
+
+    def info(self):
+        if not self.healthy:
+            raise ConnectionError("session expired")
+        return {}
+
+    def close(self):
+        self.closed = True
+
+
+def test_repeated_loads_reuse_connections():
+    sg = FakeShotgun.with_show(project_id=1, sequences=2, shots_per_sequence=30)
+    pool = FlowConnectionPool()
+    created: list[int] = []
+
+    def connect():
+        created.append(1)
+        return sg
+
+    for _ in range(3):
+        with FlowClient(CREDS, connect=connect, connections=pool, page_size=10, max_workers=4) as client:
+            assert len(client.fetch_sequences_and_shots()["SQ010"]) == 30
+
+    # at most one connection per concurrent request of the first load
+    assert 1 <= len(created) <= 4
+    assert pool.created == len(created)
+
+
+def test_other_projects_on_same_site_share_connections():
+    pool = FlowConnectionPool()
+    conn = Conn()
+    pool.release(CREDS, conn)
+
+    other = FlowCredentials(url="https://FAKE", script_name="test", script_key="key", project_id=2)
+    assert pool.acquire(other, Conn) is conn
+
+
+def test_unhealthy_idle_connection_is_replaced():
+    now = [0.0]
+    pool = FlowConnectionPool(health_check_after=10, clock=lambda: now[0])
+    stale = Conn(healthy=False)
+    pool.release(CREDS, stale)
+
+    now[0] = 60.0
+    fresh = pool.acquire(CREDS, Conn)
+
+    assert fresh is not stale
+    assert stale.closed
+
+
+def test_idle_connections_time_out():
+    now = [0.0]
+    pool = FlowConnectionPool(idle_timeout=100, clock=lambda: now[0])
+    conn = Conn()
+    pool.release(CREDS, conn)
+    assert pool.idle_count(CREDS) == 1
+
+    now[0] = 150.0
+    assert pool.acquire(CREDS, Conn) is not conn
+    assert conn.closed
+    assert pool.idle_count() == 0
+
+
+def test_connection_is_dropped_after_a_failed_request():
+    pool = FlowConnectionPool()
+    conn = Conn()
+    try:
+        with pool.connection(CREDS, lambda: conn):
+            raise TimeoutError("read timed out")
+    except TimeoutError:
+        pass
+
+    assert conn.closed
+    assert pool.idle_count() == 0
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from builder.integrations.flow_cache import FlowCache
+from builder.integrations.flow_client import FlowClient, FlowCredentials, FlowTimeoutError, FlowUnavailableError
+from builder.integrations.flow_fake import FlakyShotgun
+from builder.integrations.flow_pool import FlowConnectionPool
+from builder.integrations.flow_resilience import CircuitBreaker, RetryPolicy
+
+
+CREDS = FlowCredentials(url="https://flaky", script_name="test", script_key="key", project_id=1)
+NO_WAIT = RetryPolicy(attempts=3, base_delay=0.0)
+
+
+def _client(sg, **kwargs):
+    kwargs.setdefault("retry", NO_WAIT)
+    kwargs.setdefault("breaker", CircuitBreaker())
+    return FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool(), **kwargs)
+
+
+def test_transient_errors_are_retried():
+    sg = FlakyShotgun.with_show(project_id=1, sequences=2, shots_per_sequence=3)
+    sg.fail_next = 2
+
+    with _client(sg, max_workers=1) as client:
+        data = client.fetch_sequences_and_shots()
+
+    assert data["SQ020"] == ["SH0010", "SH0020", "SH0030"]
+    assert sg.failures == 2
+
+
+def test_non_retryable_errors_surface_immediately():
+    sg = FlakyShotgun.with_show(project_id=1, sequences=1, shots_per_sequence=1)
+    sg.fail_next, sg.error = 1, ValueError  # a bad request, not a network problem
+
+    with _client(sg, max_workers=1) as client, pytest.raises(ValueError):
+        client.fetch_sequences_and_shots()
+    assert sg.failures == 1
+
+
+def test_open_breaker_fails_fast_and_serves_cached_data(tmp_path):
+    # latency keeps the concurrent page/count requests overlapping, as on a real site
+    sg = FlakyShotgun.with_show(project_id=1, sequences=1, shots_per_sequence=2, latency=0.02)
+    cache = FlowCache(tmp_path / "flow")
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, reset_after=30.0, clock=lambda: now[0])
+
+    with _client(sg, breaker=breaker) as client:
+        cached = client.fetch_sequences_and_shots(cache=cache)
+
+        sg.failure_rate = 1.0
+        assert client.fetch_sequences_and_shots(cache=cache) == cached
+        assert client.stale_reason
+        assert breaker.is_open
+
+        calls = len(sg.calls)
+        assert client.fetch_sequences_and_shots(cache=cache) == cached
+        assert len(sg.calls) == calls  # no request while open
+
+        with pytest.raises(FlowUnavailableError):
+            client.fetch_sequences_and_shots()  # nothing cached to fall back on
+
+        # after the reset period one trial request goes through and closes it
+        # again; concurrent requests wait for its outcome instead of failing
+        sg.failure_rate = 0.0
+        now[0] += 31.0
+        assert client.fetch_sequences_and_shots(cache=cache) == cached
+        assert client.stale_reason is None
+        assert breaker.state == "closed"
+
+
+def test_half_open_requests_wait_for_the_trial():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_after=30.0, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] += 31.0
+    assert breaker.allow()  # the trial
+
+    results = []
+    waiters = [threading.Thread(target=lambda: results.append(breaker.allow(wait=5.0))) for _ in range(3)]
+    for t in waiters:
+        t.start()
+    time.sleep(0.05)
+    assert results == []  # still waiting on the trial
+    breaker.record_success()
+    for t in waiters:
+        t.join(timeout=5.0)
+    assert results == [True, True, True]
+
+    # a failed trial re-opens the breaker: waiters give up at once
+    breaker.record_failure()
+    now[0] += 31.0
+    assert breaker.allow()
+    waiter = threading.Thread(target=lambda: results.append(breaker.allow(wait=5.0)))
+    waiter.start()
+    time.sleep(0.05)
+    breaker.record_failure()
+    waiter.join(timeout=5.0)
+    assert results[-1] is False
+    assert breaker.allow(wait=0.1) is False  # open again: no waiting
+
+
+def test_deadline_caps_a_hanging_server():
+    sg = FlakyShotgun.with_show(project_id=1, sequences=1, shots_per_sequence=1)
+    sg.stall = 1.0
+
+    started = time.perf_counter()
+    with _client(sg, deadline=0.1) as client, pytest.raises(FlowTimeoutError):
+        client.fetch_sequences_and_shots()
+    assert time.perf_counter() - started < 0.5
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0, jitter=0.5)
+    delays = [policy.delay(n) for n in range(6)]
+
+    assert 0.5 <= delays[0] <= 1.0
+    assert all(d <= 4.0 for d in delays)
+    assert max(delays[3:]) >= 2.0
@@ -0,0 +1,98 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from builder.core.flow_snapshot import FlowSnapshot, SnapshotError, StaleSnapshotError, read_snapshot, write_snapshot
+from builder.core.job_config import read_job_config
+from builder.integrations.flow_client import FlowClient, FlowCredentials
+from builder.integrations.flow_fake import FakeShotgun
+from builder.integrations.flow_pool import FlowConnectionPool
+from builder.util.format_input import format_seq_shots_text
+from builder.util.parse_input import parse_sequences_and_shots
+
+
+CREDS = FlowCredentials(url="https://fake", script_name="test", script_key="key", project_id=7)
+
+
+def _snapshot(sequences, shots_per_sequence):
+    sg = FakeShotgun.with_show(project_id=7, sequences=sequences, shots_per_sequence=shots_per_sequence)
+    sg.add("Asset", code="Hero", sg_asset_type="Character", project={"type": "Project", "id": 7})
+    with FlowClient(CREDS, connect=lambda: sg, connections=FlowConnectionPool(), page_size=5000) as client:
+        return client.snapshot()
+
+
+def test_snapshot_roundtrip(tmp_path):
+    snap = _snapshot(sequences=2, shots_per_sequence=3)
+    path = write_snapshot(tmp_path / "snap.json", snap)
+
+    loaded = read_snapshot(path, max_age=timedelta(hours=1))
+
+    assert loaded.project_id == 7
+    assert loaded.sequences == {"SQ010": ["SH0010", "SH0020", "SH0030"], "SQ020": ["SH0010", "SH0020", "SH0030"]}
+    assert loaded.assets == {"character": ["Hero"]}
+    assert loaded.created_at == snap.created_at
+
+
+def test_hyphenated_codes_stay_literal(tmp_path):
+    codes = ["SH010-020", "SH010-SH020", "SH[1-3]"]
+    snap = FlowSnapshot(
+        created_at=datetime.now(timezone.utc).isoformat(), site="https://fake", project_id=7,
+        sequences={"SQ010": codes}, assets={},
+    )
+    loaded = read_snapshot(write_snapshot(tmp_path / "snap.json", snap))
+
+    assert loaded.sequences == {"SQ010": codes}
+    # and through the Seq/Shots box the UI fills from it
+    assert parse_sequences_and_shots(format_seq_shots_text(loaded.sequences)).sequences == {"SQ010": codes}
+
+
+def test_stale_and_foreign_files_are_rejected(tmp_path):
+    path = write_snapshot(tmp_path / "snap.json", _snapshot(sequences=1, shots_per_sequence=1))
+    obj = json.loads(path.read_text(encoding="utf-8"))
+
+    obj["created_at"] = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+    path.write_text(json.dumps(obj), encoding="utf-8")
+    with pytest.raises(StaleSnapshotError):
+        read_snapshot(path, max_age=timedelta(hours=24))
+    assert read_snapshot(path).sequences  # no limit: still usable
+
+    obj["version"] = 99
+    path.write_text(json.dumps(obj), encoding="utf-8")
+    with pytest.raises(SnapshotError):
+        read_snapshot(path)
+
+
+def test_large_snapshot_loads_quickly(tmp_path):
+    path = write_snapshot(tmp_path / "snap.json", _snapshot(sequences=40, shots_per_sequence=500))
+
+    started = time.perf_counter()
+    loaded = read_snapshot(path)
+    elapsed = time.perf_counter() - started
+
+    assert sum(len(v) for v in loaded.sequences.values()) == 20_000
+    assert elapsed < 0.5
+
+
+def test_job_config_takes_shots_from_snapshot(tmp_path):
+    write_snapshot(tmp_path / "snap.json", _snapshot(sequences=1, shots_per_sequence=2))
+    config = {
+        "tool": "Studio Folder Builder",
+        "version": "0.8.0",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "root": tmp_path.as_posix(),
+        "project": "Show",
+        "template_id": "vfx_default",
+        "mode": "shots",
+        "overwrite": False,
+        "flow_snapshot": "snap.json",
+        "flow_snapshot_max_age_hours": 12,
+    }
+    path = tmp_path / "job.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+
+    cfg = read_job_config(path)
+
+    assert cfg.sequences == {"SQ010": ["SH0010", "SH0020"]}
+    assert cfg.flow_snapshot == "snap.json"
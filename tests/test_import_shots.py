@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from builder.util.import_shots import import_shots_file
+from builder.util.parse_input import parse_sequences_and_shots
+
+
+def test_text_file_matches_ui_parser(tmp_path: Path):
+    text = "SQ010: SH010, SH020, SH010\n  SH030\n\nSQ020: SH010 SH020\n  SH010\nSQ010: SH030, SH040\n"
+    path = tmp_path / "shots.txt"
+    path.write_text(text, encoding="utf-8")
+
+    imported = import_shots_file(path)
+
+    assert imported == parse_sequences_and_shots(text)
+    assert imported.sequences == {"SQ010": ["SH010", "SH020", "SH030", "SH040"], "SQ020": ["SH010", "SH020"]}
+
+
+def test_csv_with_header_and_combined_names(tmp_path: Path):
+    path = tmp_path / "shots.csv"
+    path.write_text(
+        "Status,Sequence,Shot\nip,SQ010,SH010\nip,SQ010,SH020\nfin,SQ010,SH010\nip,,SQ020_SH050\n",
+        encoding="utf-8",
+    )
+
+    imported = import_shots_file(path)
+
+    assert imported.sequences == {"SQ010": ["SH010", "SH020"], "SQ020": ["SH050"]}
+
+
+def test_csv_without_header(tmp_path: Path):
+    path = tmp_path / "shots.csv"
+    path.write_text("SQ010,SH010\nSQ010,SH020\n", encoding="utf-8")
+
+    assert import_shots_file(path).sequences == {"SQ010": ["SH010", "SH020"]}
+
+
+def test_edl_events_prefer_loc_names(tmp_path: Path):
+    path = tmp_path / "cut.edl"
+    path.write_text(
+        "TITLE: REEL 1\n"
+        "FCM: NON-DROP FRAME\n"
+        "\n"
+        "001  A001C003 V     C        01:00:00:00 01:00:02:00 00:00:00:00 00:00:02:00\n"
+        "* FROM CLIP NAME: A001C003_220101.MOV\n"
+        "* LOC: 01:00:01:00 YELLOW  SQ010_SH010\n"
+        "002  A001C004 V     C        01:00:02:00 01:00:04:00 00:00:02:00 00:00:04:00\n"
+        "* FROM CLIP NAME: SQ010_SH020\n"
+        "003  A001C005 V     C        01:00:04:00 01:00:06:00 00:00:04:00 00:00:06:00\n"
+        "* FROM CLIP NAME: SQ010_SH010\n"
+        "004  BL       V     C        00:00:00:00 00:00:01:00 00:00:06:00 00:00:07:00\n",
+        encoding="utf-8",
+    )
+
+    assert import_shots_file(path).sequences == {"SQ010": ["SH010", "SH020"]}
+
+
+def test_names_without_a_sequence_are_skipped(tmp_path: Path):
+    csv_path = tmp_path / "shots.csv"
+    csv_path.write_text("Sequence,Shot\nSQ010,SH010\n,SH020\n,SQ020_SH030\n", encoding="utf-8")
+    edl_path = tmp_path / "cut.edl"
+    edl_path.write_text(
+        "001  A001C003 V     C        01:00:00:00 01:00:02:00 00:00:00:00 00:00:02:00\n"
+        "* FROM CLIP NAME: SQ010_SH010\n"
+        "002  A001C004 V     C        01:00:02:00 01:00:04:00 00:00:02:00 00:00:04:00\n"
+        "* FROM CLIP NAME: SH020\n",
+        encoding="utf-8",
+    )
+
+    from_csv = import_shots_file(csv_path)
+    from_edl = import_shots_file(edl_path)
+
+    # same rule for both formats: no invented UNASSIGNED sequence
+    assert from_csv.sequences == {"SQ010": ["SH010"], "SQ020": ["SH030"]}
+    assert from_csv.skipped == ["SH020"]
+    assert from_edl.sequences == {"SQ010": ["SH010"]}
+    assert from_edl.skipped == ["SH020"]
@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+
+from builder.cli import main
+from builder.core.job_config import make_job_config, write_job_config
+from builder.core.job_diff import JobDiffError, diff_job_configs
+from builder.core.manifest import read_manifest
+from builder.util.name_ranges import expand_tokens
+
+import pytest
+
+
+def _cfg(root, sequences, mode="shots", project="Show"):
+    return make_job_config(
+        root=root, project=project, template_id="vfx_default", mode=mode,
+        overwrite=False, sequences=sequences if mode == "shots" else None,
+        assets=sequences if mode == "assets" else None,
+    )
+
+
+def test_diff_reports_added_and_removed_names(tmp_path):
+    old = _cfg(tmp_path, {"SQ010": expand_tokens(["SH0010-SH0500x10"]), "SQ020": ["SH010"]})
+    new = _cfg(tmp_path, {"SQ010": expand_tokens(["SH0010-SH0500x10", "SH0505"]), "SQ030": ["SH010"]})
+
+    delta = diff_job_configs(old, new)
+
+    assert delta.added == {"SQ010": ["SH0505"], "SQ030": ["SH010"]}
+    assert delta.removed == {"SQ020": ["SH010"]}
+    assert diff_job_configs(new, new).is_empty
+    with pytest.raises(JobDiffError):
+        diff_job_configs(old, _cfg(tmp_path, {"SQ010": ["SH010"]}, project="Other"))
+
+
+def test_rebuild_builds_only_the_delta_and_merges_the_manifest(tmp_path, capsys):
+    old_path = write_job_config(tmp_path / "old.json", _cfg(tmp_path, {"SQ010": ["SH010", "SH020"]}))
+    new_path = write_job_config(tmp_path / "new.json", _cfg(tmp_path, {"SQ010": ["SH010", "SH020", "SH030"]}))
+    assert main(["build", "--config", str(old_path), "--json"]) == 0
+    first = json.loads(capsys.readouterr().out)
+    full_actions = len(json.loads(open(first["manifest"], encoding="utf-8").read())["actions"])
+
+    assert main(["rebuild", "--old", str(old_path), "--new", str(new_path), "--json"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+
+    assert summary["added"] == {"SQ010": 1}
+    assert not any("SH010" in p or "SH020" in p for p in _planned(tmp_path, old_path, new_path, capsys))
+    assert (tmp_path / "Show" / "sequences" / "SQ010" / "SH030").is_dir()
+    # the full manifest is untouched; the rebuild went to the delta sidecar
+    assert len(json.loads(open(summary["manifest"], encoding="utf-8").read())["actions"]) == full_actions
+    manifest = read_manifest(Path(summary["manifest"]))
+    assert manifest["sequences"]["SQ010"] == ["SH010", "SH020", "SH030"]
+    assert len(manifest["actions"]) > full_actions
+    assert manifest["results"]["created_dirs"] > summary["results"]["created_dirs"]
+
+
+def _planned(tmp_path, old_path, new_path, capsys):
+    main(["rebuild", "--old", str(old_path), "--new", str(new_path), "--dry-run", "--list"])
+    return [line for line in capsys.readouterr().out.splitlines() if "sequences/SQ010/" in line]
@@ -0,0 +1,29 @@
+from builder.util.log_sink import LogSink
+
+
+def test_drain_returns_batches_and_history_is_bounded():
+    sink = LogSink(max_lines=3)
+    sink.write("one")
+    sink.write("two\nthree")
+
+    assert sink.drain() == ["one", "two", "three"]
+    assert sink.drain() == []
+
+    sink.write("four")
+    assert sink.history() == ["two", "three", "four"]
+
+
+def test_overflow_is_summarised_and_spilled_to_file(tmp_path):
+    spill = tmp_path / "logs" / "session.log"
+    sink = LogSink(max_lines=100, spill_path=spill)
+    for i in range(100_000):
+        sink.write(f"line {i}")
+
+    batch = sink.drain()
+    sink.close()
+
+    assert len(batch) == 101
+    assert batch[0].startswith("... 99900 line(s) not shown")
+    assert batch[-1] == "line 99999"
+    lines = spill.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 100_000 and lines[0] == "line 0"
@@ -3,7 +3,7 @@ from pathlib import Path
 
 from builder.core.builder import PlanBuilder
 from builder.models import PlanAction, PlanActionType
-from builder.core.manifest import build_manifest, write_manifest
+from builder.core.manifest import build_manifest, delta_path, read_manifest, update_manifest, write_manifest
 
 
 def test_manifest_written(tmp_path: Path):
@@ -47,3 +47,42 @@ def test_manifest_written(tmp_path: Path):
     assert "timestamp" in data
     assert data["results"]["errors"] == 0
     assert data["manifest_path"] == path.as_posix()
+
+
+def _record(project_root: Path, shots: list[str]):
+    plan = [PlanAction(PlanActionType.DIR, project_root / "sequences" / "SQ010" / shot) for shot in shots]
+    result = PlanBuilder().execute(plan)
+    return build_manifest(project_root, "VFX Default", "1.0", {}, "shots", {"SQ010": shots}, None, result)
+
+
+def test_updates_append_deltas_and_compact_when_the_sidecar_grows(tmp_path: Path):
+    project_root = tmp_path / "MyShow"
+    path = write_manifest(_record(project_root, [f"SH{i:03d}" for i in range(1, 21)]))
+    base = path.read_text(encoding="utf-8")
+
+    update_manifest(_record(project_root, ["SH021"]))
+    assert path.read_text(encoding="utf-8") == base  # O(change): only the sidecar grew
+    merged = read_manifest(path)
+    assert len(merged["actions"]) == 21 and merged["results"]["created_dirs"] == 21
+    assert merged["sequences"] == {"SQ010": ["SH021"]}  # config fields from the newest record
+
+    for i in range(22, 60):
+        update_manifest(_record(project_root, [f"SH{i:03d}"]))
+    # the sidecar was folded in once it outgrew the manifest
+    assert path.read_text(encoding="utf-8") != base
+    assert delta_path(path).stat().st_size < path.stat().st_size
+    assert len(read_manifest(path)["actions"]) == 59
+
+
+def test_malformed_actions_are_skipped(tmp_path: Path):
+    project_root = tmp_path / "MyShow"
+    path = write_manifest(_record(project_root, ["SH010"]))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["actions"].append({"type": "dir", "status": "created"})  # no path
+    path.write_text(json.dumps(data), encoding="utf-8")
+    update_manifest(_record(project_root, ["SH020"]))
+    with delta_path(path).open("a", encoding="utf-8") as fh:
+        fh.write('{"actions": [{"path": "x"')  # cut short
+
+    merged = read_manifest(path)
+    assert [a["path"].rsplit("/", 1)[-1] for a in merged["actions"]] == ["SH010", "SH020"]
@@ -0,0 +1,131 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from builder.core.job_config import make_job_config, read_job_config, write_job_config
+from builder.core.plan_request import PlanInputError, PlanRequest, run_plan_request
+from builder.core.planner import plan_shot_build
+from builder.util.format_input import format_seq_shots_text
+from builder.util.name_ranges import NameList, NameRange, RangeTooLargeError, parse_range_token
+from builder.util.parse_assets import parse_assets
+from builder.util.parse_input import parse_sequences_and_shots
+
+
+def test_parse_range_tokens():
+    r = parse_range_token("SH010-SH995x10")
+    assert r == NameRange(prefix="SH", start=10, stop=990, step=10, width=3)
+    assert len(r) == 99
+    assert r[0] == "SH010" and r[-1] == "SH990"
+    assert "SH500" in r and "SH505" not in r and "SH0500" not in r
+
+    assert list(parse_range_token("SH8-SH10")) == ["SH8", "SH9", "SH10"]
+    assert list(parse_range_token("[8-10]")) == ["8", "9", "10"]
+    assert list(parse_range_token("SH[0001-0003]_bg")) == ["SH0001_bg", "SH0002_bg", "SH0003_bg"]
+    assert parse_range_token("SH010") is None
+    assert parse_range_token("SH090-SH010") is None
+    # only unambiguous forms are ranges
+    assert parse_range_token("SH010-020") is None
+    assert parse_range_token("010-020") is None
+    assert parse_range_token("SH010-FX020") is None
+
+
+def test_name_list_dedupes_across_names_and_ranges():
+    names = NameList()
+    names.add("SH020")
+    names.add_token("SH010-SH040x10")  # overlaps SH020 -> expanded
+    names.add_token("SH100-SH200x50")
+    names.add("SH150")
+
+    assert list(names) == ["SH020", "SH010", "SH030", "SH040", "SH100", "SH150", "SH200"]
+    assert len(names) == 7
+    assert names[5] == "SH150"
+    assert names.tokens() == ["SH020", "SH010", "SH030", "SH040", "SH100-SH200x50"]
+
+
+def test_overlap_checks_do_not_enumerate_names():
+    many = ", ".join(f"{c}0001-{c}99999" for c in "ABCDEFGHIJ")
+    names = ", ".join(f"N{i:05d}" for i in range(20_000))
+    small = ", ".join(f"R{i:03d}_01-R{i:03d}_10" for i in range(200))
+
+    started = time.perf_counter()
+    parsed = parse_sequences_and_shots(f"SQ010: {many}\nSQ020: {names}, {small}\nSQ030: {small}, {names}")
+    assert time.perf_counter() - started < 1.0
+
+    assert len(parsed.sequences["SQ010"]) == 999_990
+    assert parsed.sequences["SQ010"].tokens() == [f"{c}0001-{c}99999" for c in "ABCDEFGHIJ"]
+    assert len(parsed.sequences["SQ020"]) == len(parsed.sequences["SQ030"]) == 22_000
+
+
+def test_overlapping_ranges_are_still_deduped():
+    names = NameList()
+    names.add_token("SH0010-SH0990x10")
+    names.add_token("SH0005-SH0995x5")     # shares every 10th name
+    names.add_token("SH1000-SH1005")
+    names.add_token("SH[00999-01001]")     # SH01000 is not SH1000: kept as a range
+    names.add_token("SH998-SH1001")        # SH1000/SH1001 are: expanded
+    assert len(names) == len(set(names)) == 99 + 100 + 6 + 3 + 2
+    assert names.tokens()[0] == "SH0010-SH0990x10"
+    assert names.tokens()[-4:] == ["SH1000-SH1005", "SH00999-SH01001", "SH998", "SH999"]
+
+
+def test_huge_range_stays_compact_through_job_config(tmp_path: Path):
+    parsed = parse_sequences_and_shots("SQ010: SH000001-SH100000, SH200000\n")
+    shots = parsed.sequences["SQ010"]
+    assert len(shots) == 100_001
+
+    cfg = make_job_config(
+        root=tmp_path, project="MyShow", template_id="vfx_default", mode="shots",
+        overwrite=False, sequences=parsed.sequences, assets=None,
+    )
+    path = write_job_config(tmp_path / "job_config.json", cfg)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["sequences"] == {"SQ010": [{"range": "SH000001-SH100000"}, "SH200000"]}
+    assert read_job_config(path).sequences["SQ010"] == shots
+
+
+def test_planner_expands_ranges():
+    template = {"project_folders": [], "shot_tree": {"work": []}}
+    sequences = parse_sequences_and_shots("SQ010: SH010-SH030x10").sequences
+
+    plan = plan_shot_build(Path("D:/shows"), "MyShow", template, sequences)
+    paths = {a.path.as_posix() for a in plan}
+
+    assert "D:/shows/MyShow/sequences/SQ010/SH020/work" in paths
+    assert "D:/shows/MyShow/sequences/SQ010/SH030/work" in paths
+
+
+def test_assets_accept_ranges():
+    parsed = parse_assets("props: Crate01-Crate03, Barrel")
+    assert list(parsed.assets["props"]) == ["Crate01", "Crate02", "Crate03", "Barrel"]
+
+
+def test_hyphenated_literal_names_round_trip(tmp_path: Path):
+    literal = ["SH010-020", "SH010-SH020", "SH030"]
+    cfg = make_job_config(
+        root=tmp_path, project="MyShow", template_id="vfx_default", mode="shots",
+        overwrite=False, sequences={"SQ010": literal}, assets=None,
+    )
+    path = write_job_config(tmp_path / "job_config.json", cfg)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["sequences"] == {"SQ010": literal}
+    assert read_job_config(path).sequences == {"SQ010": literal}
+
+    # through the text box: range-like names are quoted, then read back literally
+    text = format_seq_shots_text({"SQ010": literal})
+    assert text == 'SQ010: SH010-020, "SH010-SH020", SH030'
+    assert parse_sequences_and_shots(text).sequences == {"SQ010": literal}
+
+
+def test_oversized_ranges_are_rejected():
+    with pytest.raises(RangeTooLargeError, match="999,999,999"):
+        parse_sequences_and_shots("SQ010: SH1-SH999999999")
+
+    req = PlanRequest(Path("D:/shows"), "MyShow", {}, "shots", "SQ010: SH1-SH999999999")
+    with pytest.raises(PlanInputError, match="999,999,999"):
+        run_plan_request(req)
+
+    many = "\n".join(f"SQ{i:03d}: SH000001-SH900000" for i in range(2))
+    with pytest.raises(PlanInputError, match="1,800,000 shots"):
+        run_plan_request(PlanRequest(Path("D:/shows"), "MyShow", {}, "shots", many))
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from builder.core.plan_request import PlanGenerations, PlanInputError, PlanRequest, run_plan_request
+from builder.core.planner import PlanCancelled
+
+
+TEMPLATE = {"name": "T", "version": "1.0", "project_folders": ["editorial"], "shot_tree": {"work": ["maya"]}}
+
+
+def _request(text: str, mode: str = "shots") -> PlanRequest:
+    return PlanRequest(Path("D:/shows"), "MyShow", TEMPLATE, mode, text)
+
+
+def test_request_parses_and_plans_off_the_ui():
+    resp = run_plan_request(_request("SQ010: SH010-SH030x10"))
+
+    assert resp.summary() == "Sequences: 1 | Shots: 3"
+    assert resp.assets is None
+    assert len(resp.tree) == len(resp.plan)
+    assert "D:/shows/MyShow/sequences/SQ010/SH030/work/maya" in {a.path.as_posix() for a in resp.plan}
+
+    with pytest.raises(PlanInputError):
+        run_plan_request(_request("   ", mode="assets"))
+
+
+def test_superseded_request_is_cancelled_mid_plan():
+    generations = PlanGenerations()
+    first = generations.bump()
+    check = generations.canceller(first)
+    polls = []
+
+    def should_cancel():
+        polls.append(1)
+        if len(polls) == 100:
+            generations.bump()  # the user typed again
+        return check()
+
+    text = "SQ010: SH0001-SH5000"
+    with pytest.raises(PlanCancelled):
+        run_plan_request(_request(text), should_cancel=should_cancel)
+
+    assert len(polls) == 100
+    assert not generations.is_current(first)
+    assert run_plan_request(_request(text), should_cancel=generations.canceller(generations.current)).plan
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from builder.core.plan_tree import ROOT, PlanTree
+from builder.core.planner import plan_shot_build
+from builder.models import PlanAction, PlanActionType
+
+
+TEMPLATE = {
+    "name": "VFX Default",
+    "version": "1.0",
+    "project_folders": ["editorial"],
+    "shot_tree": {"docs": ["notes.md"], "work": ["maya", "nuke/scripts"]},
+}
+
+
+def _plan():
+    root = Path("D:/shows")
+    return plan_shot_build(root, "MyShow", TEMPLATE, {"SQ010": ["SH010", "SH020"], "SQ020": ["SH010"]})
+
+
+def _find(tree, path):
+    return next(i for i, a in enumerate(tree.actions) if a.path.as_posix() == path)
+
+
+def test_tree_nests_plan_under_nearest_planned_folder():
+    tree = PlanTree(_plan(), base=Path("D:/shows/MyShow"))
+
+    assert sorted(tree.label(i) for i in tree.children(ROOT)) == ["editorial", "sequences"]
+
+    sq010 = _find(tree, "D:/shows/MyShow/sequences/SQ010")
+    assert [tree.label(i) for i in tree.children(sq010)] == ["SH010", "SH020"]
+
+    # "nuke" itself is not planned: the script folder hangs off "work"
+    work = _find(tree, "D:/shows/MyShow/sequences/SQ010/SH010/work")
+    assert sorted(tree.label(i) for i in tree.children(work)) == ["maya", "nuke/scripts"]
+    assert tree.parent(work) == _find(tree, "D:/shows/MyShow/sequences/SQ010/SH010")
+
+
+def test_filter_keeps_ancestors_of_matches():
+    tree = PlanTree(_plan(), base=Path("D:/shows/MyShow"))
+
+    assert tree.filter("   ") is None
+    visible = tree.filter("sq010 SH020")
+    labels = {tree.actions[i].path.as_posix() for i in visible}
+
+    assert "D:/shows/MyShow/sequences" in labels
+    assert "D:/shows/MyShow/sequences/SQ010/SH020/docs/notes.md" in labels
+    assert not any("SH010" in p or "SQ020" in p for p in labels)
+
+
+def test_plain_actions_without_common_root():
+    actions = [PlanAction(PlanActionType.DIR, Path("a")), PlanAction(PlanActionType.FILE, Path("b/c.txt"))]
+    tree = PlanTree(actions)
+
+    assert tree.children(ROOT) == [0, 1]
+    assert tree.label(1) == "b/c.txt"
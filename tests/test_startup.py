@@ -0,0 +1,32 @@
+import json
+
+from builder.util.startup import StartupProfile
+
+
+def _profile(ticks):
+    it = iter(ticks)
+    return StartupProfile(clock=lambda: next(it))
+
+
+def test_marks_record_time_since_previous_phase():
+    profile = _profile([10.0, 10.2, 10.5, 11.0])
+
+    assert round(profile.mark("import Qt"), 3) == 0.2
+    profile.mark("import app")
+    profile.mark("first window")
+
+    assert [name for name, _ in profile.marks] == ["import Qt", "import app", "first window"]
+    assert round(profile.total, 3) == 1.0
+    assert profile.pretty().startswith("Startup: 1000 ms (import Qt 200 ms, import app 300 ms")
+
+
+def test_write_report_to_file_or_stderr(tmp_path, capsys):
+    profile = _profile([0.0, 0.25])
+    profile.mark("first window")
+
+    profile.write_report(str(tmp_path / "out" / "startup.json"))
+    report = json.loads((tmp_path / "out" / "startup.json").read_text(encoding="utf-8"))
+    assert report["total_ms"] == 250.0 and report["phases"] == [{"phase": "first window", "ms": 250.0}]
+
+    profile.write_report("1")
+    assert "Startup: 250 ms" in capsys.readouterr().err
@@ -0,0 +1,50 @@
+from pathlib import Path
+import json
+
+from builder.core.template_bulk import validate_library
+
+
+VALID = {
+    "name": "VFX Default",
+    "version": "1.0",
+    "project_folders": ["assets"],
+    "shot_tree": {"docs": ["notes.md"]},
+    "asset_tree": {"characters": ["work"]},
+}
+
+
+def write_json(p: Path, obj) -> None:
+    p.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+
+
+def make_library(templates_dir: Path) -> None:
+    templates_dir.mkdir()
+    for i in range(6):
+        write_json(templates_dir / f"t{i:02d}.json", {**VALID, "name": f"T{i}"})
+    write_json(templates_dir / "child.json", {"extends": "t00", "name": "Child", "version": "1.0"})
+    write_json(templates_dir / "bad.json", {"name": "Bad", "version": "1.0"})
+    (templates_dir / "broken.json").write_text("{ nope", encoding="utf-8")
+
+
+def test_bulk_report_serial(tmp_path: Path):
+    make_library(tmp_path / "templates")
+
+    report = validate_library(tmp_path / "templates", workers=1)
+
+    assert len(report.files) == 9
+    assert report.valid_count == 7
+    assert set(report.invalid) == {"bad.json", "broken.json"}
+    assert report.files["child.json"] == []
+    assert report.files["broken.json"][0].code == "LOAD_FAIL"
+    assert not report.ok
+
+
+def test_bulk_report_process_pool_matches_serial(tmp_path: Path):
+    make_library(tmp_path / "templates")
+
+    serial = validate_library(tmp_path / "templates", workers=1)
+    pooled = validate_library(tmp_path / "templates", workers=2, chunk_size=2)
+
+    assert pooled.workers == 2
+    assert pooled.files == serial.files
+    assert "bad.json" in pooled.pretty()
@@ -0,0 +1,86 @@
+from pathlib import Path
+import json
+import os
+
+from builder.core.template_cache import TemplateCache
+from builder.core.template_loader import TemplateLoader
+
+
+VALID = {
+    "name": "VFX Default",
+    "version": "1.0",
+    "project_folders": ["assets", "sequences"],
+    "shot_tree": {"docs": ["notes.md"]},
+    "asset_tree": {"characters": ["work"]},
+}
+
+
+def write_json(p: Path, obj) -> None:
+    p.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+
+
+def test_unchanged_files_come_from_cache(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    write_json(templates_dir / "vfx.json", VALID)
+    write_json(templates_dir / "bad.json", {"name": "Bad", "version": "1.0"})
+    cache_path = tmp_path / "cache" / "template_cache.json"
+
+    first = TemplateLoader(templates_dir, cache=TemplateCache(cache_path)).load_all()
+    assert first.cached == 0
+    assert cache_path.is_file()
+
+    # fresh cache object -> proves the cache was persisted
+    second = TemplateLoader(templates_dir, cache=TemplateCache(cache_path)).load_all()
+    assert second.cached == 2
+    assert [t.name for t in second.templates] == ["VFX Default"]
+    assert second.problems["bad.json"] == first.problems["bad.json"]
+
+
+def test_changed_file_is_revalidated(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    path = templates_dir / "vfx.json"
+    write_json(path, VALID)
+
+    loader = TemplateLoader(templates_dir, cache=TemplateCache())
+    loader.load_all()
+
+    write_json(path, {**VALID, "name": "VFX Renamed", "version": "2.0"})
+    result = loader.load_all()
+
+    assert result.cached == 0
+    assert result.templates[0].name == "VFX Renamed"
+
+
+def test_touched_but_identical_file_hits_hash(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    path = templates_dir / "vfx.json"
+    write_json(path, VALID)
+
+    loader = TemplateLoader(templates_dir, cache=TemplateCache())
+    loader.load_all()
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    result = loader.load_all()
+
+    assert result.cached == 1
+    assert len(result.templates) == 1
+
+
+def test_removed_files_are_pruned(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    write_json(templates_dir / "a.json", VALID)
+    write_json(templates_dir / "b.json", VALID)
+
+    cache = TemplateCache()
+    loader = TemplateLoader(templates_dir, cache=cache)
+    loader.load_all()
+    assert len(cache) == 2
+
+    (templates_dir / "b.json").unlink()
+    loader.load_all()
+    assert len(cache) == 1
@@ -0,0 +1,114 @@
+from pathlib import Path
+import json
+
+from builder.core.template_inherit import merge_template
+from builder.core.template_loader import TemplateLoader
+
+
+BASE = {
+    "name": "VFX Default",
+    "version": "1.0",
+    "project_folders": ["assets", "sequences"],
+    "shot_tree": {"work": ["maya", "nuke"], "docs": ["notes.md"]},
+    "asset_tree": {"characters": ["work", "publish"]},
+}
+
+
+def write_json(p: Path, obj) -> None:
+    p.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+
+
+def test_merge_overrides_and_extends_trees():
+    child = {
+        "extends": "vfx_default",
+        "name": "Show A",
+        "version": "1.1",
+        "project_folders": ["editorial", "assets"],
+        "shot_tree": {"+work": ["houdini", "maya"], "docs": ["readme.md"]},
+        "asset_tree": {"props": ["work"]},
+    }
+
+    merged = merge_template(BASE, child)
+
+    assert merged["name"] == "Show A"
+    assert merged["project_folders"] == ["assets", "sequences", "editorial"]
+    assert merged["shot_tree"]["work"] == ["maya", "nuke", "houdini"]
+    assert merged["shot_tree"]["docs"] == ["readme.md"]
+    assert merged["asset_tree"] == {"characters": ["work", "publish"], "props": ["work"]}
+    # base untouched
+    assert BASE["shot_tree"]["work"] == ["maya", "nuke"]
+
+
+def test_extend_without_a_base_entry_drops_the_prefix():
+    base = {"name": "Base", "version": "1.0", "project_folders": [], "shot_tree": {"work": ["maya"]}}
+    child = {
+        "name": "Child",
+        "version": "1.0",
+        "shot_tree": {"+comp": {"+nuke": ["scripts"]}, "review": {"+daily": ["mov"]}},
+        "asset_tree": {"+props": ["work"]},  # base has no asset_tree at all
+    }
+
+    merged = merge_template(base, child)
+
+    assert merged["shot_tree"] == {"work": ["maya"], "comp": {"nuke": ["scripts"]}, "review": {"daily": ["mov"]}}
+    assert merged["asset_tree"] == {"props": ["work"]}
+
+
+def test_loader_resolves_chain_and_memoizes_base(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    write_json(templates_dir / "vfx_default.json", BASE)
+    write_json(templates_dir / "show_a.json", {"extends": "vfx_default", "name": "Show A", "version": "1.0"})
+    write_json(
+        templates_dir / "show_a_ep2.json",
+        {"extends": "show_a", "name": "Show A Ep2", "version": "1.0", "shot_tree": {"+work": ["unreal"]}},
+    )
+    write_json(templates_dir / "show_b.json", {"extends": "vfx_default", "name": "Show B", "version": "1.0"})
+
+    loader = TemplateLoader(templates_dir)
+    reads: list[str] = []
+    original = loader._read_file
+
+    def counting_read_file(path: Path):
+        reads.append(path.name)
+        return original(path)
+
+    loader._read_file = counting_read_file  # type: ignore[method-assign]
+    result = loader.load_all()
+
+    by_name = {t.name: t for t in result.templates}
+    assert result.problems == {}
+    assert by_name["Show A"].raw["project_folders"] == ["assets", "sequences"]
+    assert by_name["Show A Ep2"].raw["shot_tree"]["work"] == ["maya", "nuke", "unreal"]
+    # each file is read once per reload, even though vfx_default has three descendants
+    assert sorted(reads) == sorted(p.name for p in templates_dir.glob("*.json"))
+
+
+def test_loader_reports_cycles_and_missing_bases(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    write_json(templates_dir / "a.json", {"extends": "b", "name": "A", "version": "1.0"})
+    write_json(templates_dir / "b.json", {"extends": "a", "name": "B", "version": "1.0"})
+    write_json(templates_dir / "orphan.json", {"extends": "nope", "name": "Orphan", "version": "1.0"})
+
+    result = TemplateLoader(templates_dir).load_all()
+
+    assert result.templates == []
+    assert result.problems["a.json"][0].code == "EXTENDS_CYCLE"
+    assert result.problems["b.json"][0].code == "EXTENDS_CYCLE"
+    assert result.problems["orphan.json"][0].code == "EXTENDS_MISSING"
+
+
+def test_invalidating_base_invalidates_children(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    write_json(templates_dir / "vfx_default.json", BASE)
+    write_json(templates_dir / "show_a.json", {"extends": "vfx_default", "name": "Show A", "version": "1.0"})
+
+    loader = TemplateLoader(templates_dir)
+    loader.load_all()
+    child = templates_dir / "show_a.json"
+    assert loader.is_memoized(child)
+
+    loader.invalidate(templates_dir / "vfx_default.json")
+    assert not loader.is_memoized(child)
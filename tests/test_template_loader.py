@@ -1,7 +1,8 @@
 from pathlib import Path
 import json
 
-from builder.core.template_loader import TemplateLoader
+from builder.core.template_loader import TemplateLoader, TemplateLoadError
+from builder.core.template_watcher import TemplateWatcher
 
 
 def write_json(p: Path, obj) -> None:
@@ -57,3 +58,85 @@ def test_skip_invalid_json(tmp_path: Path):
 
     assert len(result.templates) == 0
     assert "broken.json" in result.problems
+
+
+def test_scan_reads_headers_and_load_is_memoized(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+
+    write_json(
+        templates_dir / "vfx.json",
+        {
+            "name": "VFX Default",
+            "version": "1.0",
+            "project_folders": ["assets"],
+            "shot_tree": {"docs": ["notes.md"]},
+            "asset_tree": {"characters": ["work"]},
+        },
+    )
+    write_json(templates_dir / "bad.json", {"name": "Bad", "version": "2.0"})
+
+    loader = TemplateLoader(templates_dir)
+    handles = loader.scan()
+
+    # discovery does not validate: the broken template is still listed
+    assert [(h.name, h.version) for h in handles] == [("Bad", "2.0"), ("VFX Default", "1.0")]
+    assert loader.problems() == {}
+
+    info = loader.load(handles[1])
+    assert info.raw["project_folders"] == ["assets"]
+    assert loader.load(handles[1]) is info
+
+    try:
+        loader.load(handles[0])
+        assert False, "Should have raised TemplateLoadError"
+    except TemplateLoadError as exc:
+        assert exc.issues
+    assert "bad.json" in loader.problems()
+
+
+def test_scan_falls_back_to_file_stem_for_unreadable_header(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    (templates_dir / "broken.json").write_text("{ this is not json", encoding="utf-8")
+
+    handles = TemplateLoader(templates_dir).scan()
+
+    assert handles[0].name == "broken"
+    assert handles[0].version == "?"
+
+
+def test_watcher_changes_refresh_only_touched_templates(tmp_path: Path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    base = {
+        "version": "1.0",
+        "project_folders": ["assets"],
+        "shot_tree": {"docs": ["notes.md"]},
+        "asset_tree": {"characters": ["work"]},
+    }
+    write_json(templates_dir / "a.json", {**base, "name": "A"})
+    write_json(templates_dir / "b.json", {**base, "name": "B"})
+
+    loader = TemplateLoader(templates_dir)
+    watcher = TemplateWatcher(templates_dir)
+    handles = loader.scan()
+    info_a = loader.load(handles[0])
+    info_b = loader.load(handles[1])
+
+    write_json(templates_dir / "b.json", {**base, "name": "B2", "version": "2.0"})
+    write_json(templates_dir / "c.json", {**base, "name": "C"})
+    (templates_dir / "a.json").unlink()
+
+    changes = watcher.poll()
+    assert [p.name for p in changes.added] == ["c.json"]
+    assert [p.name for p in changes.changed] == ["b.json"]
+    assert [p.name for p in changes.removed] == ["a.json"]
+
+    handles = loader.refresh(handles, changes)
+    assert [(h.name, h.version) for h in handles] == [("B2", "2.0"), ("C", "1.0")]
+    assert loader.load(handles[0]) is not info_b
+    assert loader.load(handles[0]).name == "B2"
+    assert info_a.path not in {h.path for h in handles}
+
+    assert not watcher.poll()
@@ -0,0 +1,29 @@
+import json
+
+from builder.cli import main
+from builder.util import tracing
+
+
+def test_spans_are_noops_while_disabled():
+    assert not tracing.is_enabled()
+    with tracing.span("plan.shots", shots=1) as sp:
+        sp.set(rows=3)
+    assert tracing.disable() is None
+
+
+def test_cli_trace_exports_chrome_trace_json(tmp_path, capsys):
+    trace = tmp_path / "trace.json"
+    argv = ["build", "--root", str(tmp_path), "--project", "P", "--template", "vfx_default",
+            "--shots", "SQ010: SH010-SH030x10", "--trace", str(trace)]
+
+    assert main(argv) == 0
+    assert not tracing.is_enabled()
+
+    events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    for name in ("template.load", "parse.shots", "plan.shots", "plan.dedupe_sort", "build.dirs", "build.files",
+                 "manifest.write"):
+        assert name in spans
+    assert all(e["dur"] >= 0 for e in spans.values())
+    assert spans["build.dirs"]["args"]["actions"] > 0
+    assert "span(s) written" in capsys.readouterr().err